@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \__init__.py                                                                                                  #
+# Language : Python 3.8.12                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 11:40:15 am                                                                        #
+# Modified : Sunday, October 18th 2026, 11:40:15 am                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_bootstrap.py                                                                                           #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 1:15:02 am                                                                         #
+# Modified : Monday, October 19th 2026, 1:42:51 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Per-task cost of configuring logging in every job of a pool of tiny jobs, against configuring it once per worker."""
+import argparse
+import logging
+import logging.config
+import multiprocessing as mp
+import threading
+import time
+
+from experiments.nlr import get_queue_config
+from experiments.nlr.package.batching import unbatch
+from experiments.nlr.package.bootstrap import configure
+# ------------------------------------------------------------------------------------------------------------------------ #
+_config = None
+
+
+def init(config):
+    global _config
+    _config = config
+    configure(config)
+
+
+def per_job_dictconfig(i):
+    # What workers.worker and parallel.Worker.run did for every job.
+    logging.config.dictConfig(_config)
+    logging.getLogger('tiny').info('Job %d', i)
+
+
+def per_job_configure(i):
+    configure(_config)
+    logging.getLogger('tiny').info('Job %d', i)
+
+
+def per_job_copy(i):
+    # A job that brings an equal configuration of its own, as a pickled Job does.
+    configure(dict(_config))
+    logging.getLogger('tiny').info('Job %d', i)
+
+
+def initializer_only(i):
+    logging.getLogger('tiny').info('Job %d', i)
+
+
+def drain(q, received):
+    while True:
+        item = q.get()
+        if item is None:
+            return
+        received.extend(unbatch(item))
+
+
+def run(task, tasks, workers):
+    q = mp.Queue()
+    received = []
+    reader = threading.Thread(target=drain, args=(q, received))
+    reader.start()
+    pool = mp.Pool(workers, initializer=init, initargs=(get_queue_config(q),))
+    pool.map(initializer_only, range(workers))  # Workers up and configured before the clock starts.
+    start = time.perf_counter()
+    pool.map(task, range(tasks), chunksize=1)
+    elapsed = time.perf_counter() - start
+    pool.close()
+    pool.join()
+    q.put(None)
+    reader.join()
+    print('{:<20} {:>8.1f} us/task  {:>6,d} of {:,d} records'.format(
+        task.__name__, elapsed / tasks * 1e6, len(received) - workers, tasks))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    before = run(per_job_dictconfig, args.tasks, args.workers)
+    after = run(per_job_configure, args.tasks, args.workers)
+    copied = run(per_job_copy, args.tasks, args.workers)
+    floor = run(initializer_only, args.tasks, args.workers)
+    print('speedup {:>20.2f}x  ({:.2f}x for equal copies, {:.1f} us/task of comparing over the floor)'.format(
+        before / after, before / copied, (copied - floor) / args.tasks * 1e6))
+
+
+if __name__ == '__main__':
+    main()
+# %%
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_chunking.py                                                                                            #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 3:57:51 am                                                                         #
+# Modified : Monday, October 19th 2026, 3:57:51 am                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Per-task cost of tiny tasks sent one apply_async() at a time, through a plain Pool and a ChunkingPool."""
+import argparse
+import multiprocessing as mp
+import time
+
+from experiments.nlr.package.chunking import ChunkingPool
+from experiments.nlr.package.project import Job
+from experiments.parallel.pool import noop, pow3
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def run_job(job):
+    return job.run()
+
+
+TASKS = {
+    'noop': (noop, lambda i: i),
+    'pow3': (pow3, lambda i: i),
+    'job': (run_job, Job),
+}
+
+
+def run(pool, func, make, tasks):
+    start = time.perf_counter()
+    results = [pool.apply_async(func, (make(i),)) for i in range(tasks)]
+    for result in results:
+        result.get()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=20000)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--start-method', default=None, choices=mp.get_all_start_methods())
+    args = parser.parse_args()
+
+    ctx = mp.get_context(args.start_method)
+    with ctx.Pool(args.processes) as plain, ChunkingPool(args.processes, context=ctx) as chunking:
+        for name, (func, make) in TASKS.items():
+            # A first pass warms the workers up and lets the ChunkingPool learn the task.
+            run(plain, func, make, args.processes)
+            run(chunking, func, make, args.tasks // 10)
+            before = run(plain, func, make, args.tasks)
+            after = run(chunking, func, make, args.tasks)
+            print('{:<6} {:>8.1f} us/task plain  {:>8.1f} us/task chunked  chunks of {:>3d}  {:>6.2f}x'.format(
+                name, before / args.tasks * 1e6, after / args.tasks * 1e6, chunking.chunksize(func),
+                before / after))
+
+
+if __name__ == '__main__':
+    main()
+# %%
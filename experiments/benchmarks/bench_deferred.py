@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_deferred.py                                                                                            #
+# Language : Python 3.8.12                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 4:37:25 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 4:37:25 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Worker CPU spent on logging Job.run style records, with eager and deferred message formatting."""
+import argparse
+import logging
+import queue
+import time
+
+from experiments.nlr.package.batching import CompactQueueHandler
+from experiments.nlr.package.project import Job
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def run(defer_format, jobs):
+    sink = queue.SimpleQueue()
+    handler = CompactQueueHandler(sink, capacity=100, flush_interval=0, defer_format=defer_format)
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(logging.DEBUG)
+    start = time.process_time()
+    for i in range(jobs):
+        Job(i).run()
+    handler.flush()
+    elapsed = time.process_time() - start
+    handler.close()
+    root.handlers[:] = []
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=5000)
+    args = parser.parse_args()
+
+    eager = run(False, args.jobs)
+    deferred = run(True, args.jobs)
+    print('eager     {:>8.3f}s worker CPU'.format(eager))
+    print('deferred  {:>8.3f}s worker CPU ({:.0%} of eager)'.format(deferred, deferred / eager))
+
+
+if __name__ == '__main__':
+    main()
+# %%
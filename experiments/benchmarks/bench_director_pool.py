@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_director_pool.py                                                                                       #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 1:47:36 am                                                                         #
+# Modified : Monday, October 19th 2026, 2:20:14 am                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Wall time for a Director run of many small Projects: a pool per Project, one shared pool, and all Projects at once."""
+import argparse
+import functools
+import multiprocessing as mp
+import threading
+import time
+
+from experiments.nlr import get_queue_config
+from experiments.nlr.package.batching import unbatch
+from experiments.nlr.package.bootstrap import configure
+from experiments.nlr.package.director import Director
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def run_job(job, sleep=0.0):
+    # Jobs waiting on I/O for up to sleep seconds, varying from job to job.
+    time.sleep(sleep * (job.i % 3) / 2)
+    return job.run()
+
+
+def pool_per_project(director, config, func):
+    # What nlr.__main__.execute_project did: spawn, configure and join a pool for each Project.
+    for project in director.get_projects():
+        pool = mp.Pool(director.processes, initializer=configure, initargs=(config,))
+        async_results = [pool.apply_async(func, (job,)) for job in project.jobs]
+        pool.close()
+        pool.join()
+        project.compile_results([async_result.get() for async_result in async_results])
+
+
+def shared_pool(director, config, func):
+    with director:
+        for project in director.get_projects():
+            async_results = [director.pool.apply_async(func, (job,)) for job in project.jobs]
+            project.compile_results([async_result.get() for async_result in async_results])
+
+
+def scheduled(director, config, func):
+    with director:
+        director.run(func)
+
+
+def drain(q, received):
+    while True:
+        item = q.get()
+        if item is None:
+            return
+        received.extend(unbatch(item))
+
+
+def run(strategy, projects, jobs, processes, sleep):
+    q = mp.Queue()
+    received = []
+    reader = threading.Thread(target=drain, args=(q, received))
+    reader.start()
+    config = get_queue_config(q)
+    director = Director(projects, jobs, processes, initializer=configure, initargs=(config,))
+    director.get_projects()
+    start = time.perf_counter()
+    strategy(director, config, functools.partial(run_job, sleep=sleep))
+    elapsed = time.perf_counter() - start
+    q.put(None)
+    reader.join()
+    done = sum(len(project.results) for project in director.get_projects())
+    print('{:<17} {:>8.3f}s  {:>7.1f} ms/project  {:,d} jobs  {:,d} records'.format(
+        strategy.__name__, elapsed, elapsed / projects * 1e3, done, len(received)))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--projects', type=int, default=50)
+    parser.add_argument('--jobs', type=int, default=5)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--sleep', type=float, default=0.0, help='longest I/O wait per job, in seconds')
+    args = parser.parse_args()
+
+    before = run(pool_per_project, args.projects, args.jobs, args.processes, args.sleep)
+    after = run(shared_pool, args.projects, args.jobs, args.processes, args.sleep)
+    concurrent = run(scheduled, args.projects, args.jobs, args.processes, args.sleep)
+    print('speedup {:>17.2f}x shared pool, {:.2f}x scheduled'.format(before / after, before / concurrent))
+
+
+if __name__ == '__main__':
+    main()
+# %%
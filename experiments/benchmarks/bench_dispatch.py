@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_dispatch.py                                                                                            #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 9:58:14 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 9:58:14 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Listener records/sec routing received records to their handlers, with per-record lookups and with the DispatchTable."""
+import argparse
+import copy
+import logging
+import logging.config
+import multiprocessing as mp
+import os
+import time
+from random import choice
+
+from experiments.nlr.package.dispatch import DispatchTable
+from experiments.nlr.package.project import Job
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def make_config(sink):
+    """config_listener's layout, with its console and files replaced by sink."""
+    if sink == 'null':
+        handler = {'class': 'logging.NullHandler'}
+    else:
+        handler = {'class': 'logging.FileHandler', 'filename': os.devnull, 'formatter': 'detailed'}
+    return {
+        'version': 1,
+        'disable_existing_loggers': True,
+        'formatters': {
+            'detailed': {
+                'class': 'logging.Formatter',
+                'format': '%(asctime)s %(name)-15s %(levelname)-8s %(processName)-10s %(message)s'
+            }
+        },
+        'handlers': {
+            'console': dict(handler, level='INFO'),
+            'file': dict(handler, level='DEBUG'),
+            'errors': dict(handler, level='ERROR')
+        },
+        'root': {
+            'handlers': ['console', 'file', 'errors'],
+            'level': 'DEBUG'
+        }
+    }
+
+
+def make_records(n):
+    """Received records shaped like those Job.run emits, from a dozen workers."""
+    names = Job.loggers + ['{}.{}'.format(name, child) for name in Job.loggers for child in ('a', 'b')]
+    workers = ['ForkPoolWorker-{}'.format(i) for i in range(12)]
+    records = []
+    for i in range(n):
+        record = logging.LogRecord(choice(names), choice(Job.levels), __file__, 49,
+                                   'I made %s last year', ('$1.00',), None, func='run')
+        record.processName = choice(workers)
+        records.append(record)
+    return records
+
+
+def per_record(record):
+    # What MyHandler, QueueLogHandler and ProcessLogger did for every record.
+    if record.name == "root":
+        logger = logging.getLogger()
+    else:
+        logger = logging.getLogger(record.name)
+    if logger.isEnabledFor(record.levelno):
+        record.processName = '%s (for %s)' % (
+            mp.current_process().name, record.processName)
+        logger.handle(record)
+
+
+def measure(name, handle, records):
+    records = [copy.copy(record) for record in records]
+    start = time.perf_counter()
+    for record in records:
+        handle(record)
+    elapsed = time.perf_counter() - start
+    print('{:<12} {:>12,.0f} records/sec'.format(name, len(records) / elapsed))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=200000)
+    parser.add_argument('--sink', choices=('null', 'file'), default='null',
+                        help="null isolates dispatch; file formats and writes to os.devnull")
+    args = parser.parse_args()
+
+    logging.config.dictConfig(make_config(args.sink))
+    records = make_records(args.records)
+    table = DispatchTable()
+    before = measure('per-record', per_record, records)
+    after = measure('table', lambda record: table.handle(record, check_level=True), records)
+    print('speedup      {:>12.2f}x'.format(before / after))
+
+
+if __name__ == '__main__':
+    main()
+# %%
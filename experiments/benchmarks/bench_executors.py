@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_executors.py                                                                                           #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 5:35:44 am                                                                         #
+# Modified : Monday, October 19th 2026, 5:35:44 am                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Wall time of I/O-bound jobs on each executor, and of a mixed workload run on its backends at once or one after another."""
+import argparse
+import asyncio
+import time
+
+from experiments.nlr.package.director import Director
+from experiments.nlr.package.project import Project
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class SpinJob:
+    """Keeps a CPU busy in Python."""
+
+    def __init__(self, n):
+        self.n = n
+
+    def run(self):
+        return {'x': sum(i * i for i in range(self.n)), 'y': 0}
+
+
+class SleepJob:
+    """Waits on I/O, or a sleep standing in for it, with the GIL released."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def run(self):
+        time.sleep(self.seconds)
+        return {'x': 0, 'y': 0}
+
+
+class AsyncSleepJob(SleepJob):
+    """Waits as a coroutine, so that one event loop can wait on all of them at once."""
+
+    async def run(self):
+        await asyncio.sleep(self.seconds)
+        return {'x': 0, 'y': 0}
+
+
+def run_job(job):
+    return job.run()
+
+
+def project(jobs, executor):
+    p = Project(len(jobs), executor=executor)
+    p.jobs = jobs
+    return p
+
+
+def timed(director, projects):
+    director.set_projects(projects)
+    start = time.perf_counter()
+    director.run(run_job, stream=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--sleep', type=float, default=0.05)
+    parser.add_argument('--spin', type=int, default=300000)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=50)
+    args = parser.parse_args()
+
+    with Director(processes=args.processes, threads=args.threads) as director:
+        director.pool.map(run_job, [SleepJob(0)] * args.processes)  # Workers up before the clock starts.
+        for executor, job in [('process', SleepJob), ('thread', SleepJob), ('asyncio', AsyncSleepJob)]:
+            elapsed = timed(director, [project([job(args.sleep) for _ in range(args.jobs)], executor)])
+            print('{:<10} {:>8.3f}s for {:,d} jobs of {:.0f} ms'.format(
+                executor, elapsed, args.jobs, args.sleep * 1e3))
+
+        def workload():
+            return [project([SpinJob(args.spin) for _ in range(args.processes * 4)], 'process'),
+                    project([SleepJob(args.sleep) for _ in range(args.jobs)], 'thread'),
+                    project([AsyncSleepJob(args.sleep) for _ in range(args.jobs)], 'asyncio')]
+
+        apart = sum(timed(director, [p]) for p in workload())
+        together = timed(director, workload())
+    print('mixed      {:>8.3f}s one backend at a time, {:.3f}s at once ({:.2f}x)'.format(
+        apart, together, apart / together))
+
+
+if __name__ == '__main__':
+    main()
+# %%
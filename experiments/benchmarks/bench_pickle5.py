@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_pickle5.py                                                                                             #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 5:03:09 am                                                                         #
+# Modified : Monday, October 19th 2026, 5:03:09 am                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Round trip time for a payload sent to a pool worker and back, pickled in band and sent out of band with protocol 5."""
+import argparse
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+from experiments.nlr.package.outofband import OutOfBandPool
+# ------------------------------------------------------------------------------------------------------------------------ #
+SIZES = ['1K', '64K', '1M', '16M', '256M', '1G']
+UNITS = {'K': 2 ** 10, 'M': 2 ** 20, 'G': 2 ** 30}
+
+PAYLOADS = {
+    'bytes': lambda size: bytes(size),
+    'bytearray': lambda size: bytearray(size),
+    'ndarray': lambda size: np.ones(size // 8),
+}
+
+
+def echo(payload):
+    return payload
+
+
+def parse_size(text):
+    return int(text[:-1]) * UNITS[text[-1]] if text[-1] in UNITS else int(text)
+
+
+def round_trip(pool, payload, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pool.apply(echo, (payload,))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', nargs='+', default=SIZES, help='payload sizes, e.g. 1K 16M 1G')
+    parser.add_argument('--payloads', nargs='+', default=list(PAYLOADS), choices=list(PAYLOADS))
+    parser.add_argument('--start-method', default=None, choices=mp.get_all_start_methods())
+    args = parser.parse_args()
+
+    ctx = mp.get_context(args.start_method)
+    with ctx.Pool(1) as in_band, OutOfBandPool(1, context=ctx) as out_of_band:
+        for kind in args.payloads:
+            for text in args.sizes:
+                size = parse_size(text)
+                payload = PAYLOADS[kind](size)
+                # Best of several for small payloads, where a single trip is too short to time.
+                repeat = max(1, min(100, 2 ** 26 // size))
+                before = round_trip(in_band, payload, repeat)
+                after = round_trip(out_of_band, payload, repeat)
+                del payload
+                print('{:<9} {:>5}  in band {:>10.3f} ms  out of band {:>10.3f} ms  {:>8.0f} MB/s  {:>6.2f}x'.format(
+                    kind, text, before * 1e3, after * 1e3, 2 * size / after / 2 ** 20, before / after))
+
+
+if __name__ == '__main__':
+    main()
+# %%
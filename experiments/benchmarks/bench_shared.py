@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_shared.py                                                                                              #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 4:30:27 am                                                                         #
+# Modified : Monday, October 19th 2026, 4:30:27 am                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Time per job for jobs that take and return a large array, pickled into the pool or passed in shared memory."""
+import argparse
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+from experiments.nlr.package.shared import SharedArrays, share
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def pickled_job(array):
+    return array * 2
+
+
+def shared_job(handle):
+    return share(handle.view() * 2)
+
+
+def pickled(pool, array, jobs, registry):
+    results = [pool.apply_async(pickled_job, (array,)) for _ in range(jobs)]
+    return sum(float(result.get()[-1]) for result in results)
+
+
+def shared(pool, array, jobs, registry):
+    handle = registry.put(array, refs=jobs)
+    total = 0.0
+    for result in [pool.apply_async(shared_job, (handle,)) for _ in range(jobs)]:
+        output = registry.adopt(result.get())
+        total += float(output.view()[-1])
+        registry.release(output)
+        registry.release(handle)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 8, 64], help='array sizes, in MB')
+    parser.add_argument('--jobs', type=int, default=16)
+    parser.add_argument('--processes', type=int, default=4)
+    args = parser.parse_args()
+
+    with SharedArrays() as registry, mp.Pool(args.processes) as pool:
+        for size in args.sizes:
+            array = np.random.default_rng(0).random(size * 2 ** 20 // 8)
+            times = {}
+            for mode in (pickled, shared):
+                start = time.perf_counter()
+                mode(pool, array, args.jobs, registry)
+                times[mode.__name__] = (time.perf_counter() - start) / args.jobs
+            print('{:>5d} MB  pickled {:>8.2f} ms/job  shared {:>8.2f} ms/job  {:>6.2f}x'.format(
+                size, times['pickled'] * 1e3, times['shared'] * 1e3, times['pickled'] / times['shared']))
+        assert not len(registry)
+
+
+if __name__ == '__main__':
+    main()
+# %%
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_speculation.py                                                                                         #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 6:08:15 am                                                                         #
+# Modified : Monday, October 19th 2026, 6:08:15 am                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Makespan of a Project on a pool with one slow worker, with and without speculative copies of its stragglers."""
+import argparse
+import multiprocessing as mp
+import time
+
+from experiments.nlr.package.director import Director
+from experiments.nlr.package.project import Project
+# ------------------------------------------------------------------------------------------------------------------------ #
+_slow = False
+
+
+def init(claimed):
+    # The first worker up is the slow one, as a worker on an overloaded or failing host would be.
+    global _slow
+    with claimed.get_lock():
+        _slow = not claimed.value
+        claimed.value = 1
+
+
+class SleepJob:
+    """Sleeps, standing in for a job of fixed size, slowdown times longer on the slow worker."""
+
+    def __init__(self, seconds, slowdown):
+        self.seconds = seconds
+        self.slowdown = slowdown
+
+    def run(self):
+        time.sleep(self.seconds * (self.slowdown if _slow else 1))
+        return {'x': 1, 'y': 0}
+
+
+def run_job(job):
+    return job.run()
+
+
+def run(args, speculate):
+    claimed = mp.Value('i', 0)
+    with Director(processes=args.processes, initializer=init, initargs=(claimed,)) as director:
+        director.pool.map(run_job, [SleepJob(0, 1)] * args.processes)  # Workers up before the clock starts.
+        project = Project(args.jobs)
+        project.jobs = [SleepJob(args.sleep, args.slowdown) for _ in range(args.jobs)]
+        director.set_projects([project])
+        director.run(run_job, stream=True, speculate=speculate)
+        report = director.report()
+    print('{:<14} makespan {:>6.2f}s  ideal {:>5.2f}s  {:>4.0%} efficient  {:>3d} copies, {:>3d} won'.format(
+        'speculate {}'.format(speculate) if speculate else 'no copies', report['makespan'], report['ideal'],
+        report['efficiency'], report['speculated'], report['won']))
+    return report['makespan']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=40)
+    parser.add_argument('--sleep', type=float, default=0.1)
+    parser.add_argument('--slowdown', type=float, default=20)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--speculate', type=float, default=0.9)
+    args = parser.parse_args()
+
+    before = run(args, None)
+    after = run(args, args.speculate)
+    print('speedup {:>21.2f}x'.format(before / after))
+
+
+if __name__ == '__main__':
+    main()
+# %%
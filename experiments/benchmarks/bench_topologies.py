@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_topologies.py                                                                                          #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 11:04:27 pm                                                                        #
+# Modified : Sunday, October 18th 2026, 11:04:27 pm                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Records/sec, enqueue-to-write latency, listener CPU and peak RSS of each multiprocess logging topology."""
+import argparse
+import json
+import logging
+import logging.config
+import multiprocessing as mp
+import os
+import pickle
+import platform
+import resource
+import shutil
+import tempfile
+import time
+from array import array
+from multiprocessing.util import Finalize
+from random import choices
+
+from experiments.nlr.package.ringbuffer import SharedMemoryQueue
+from experiments.nlr.subclass.pool_queue_logging import PoolWithLogging, ProcessLogger
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Each topology is rebuilt from its module's own listener, configurers and transport, with the workers replaced by a
+# synthetic workload and a LatencyProbe added to the listener. Listener console output goes to console.log in a scratch
+# directory, which also receives whatever files the topology writes.
+
+TOPOLOGIES = ['logging_vsajip', 'logging_vsajip_pool', 'log_single_file', 'log_single_file_pool',
+              'pool_apply_with_log', 'pool_queue_logging']
+LOGGERS = ['foo', 'foo.bar', 'foo.bar.baz', 'spam', 'spam.ham', 'spam.ham.eggs']
+LEVEL_MIX = 'DEBUG=40,INFO=40,WARNING=15,ERROR=4,CRITICAL=1'
+PROBE_FILE = 'probe.pickle'
+
+
+def parse_mix(mix):
+    """'DEBUG=40,INFO=60' to {logging.DEBUG: 40, logging.INFO: 60}."""
+    weights = {}
+    for item in mix.split(','):
+        name, weight = item.split('=')
+        weights[logging.getLevelName(name.strip().upper())] = float(weight)
+    return weights
+
+
+class Workload:
+    """
+    What each worker logs: records to randomly chosen loggers, at levels drawn from mix, each carrying size bytes of
+    payload, paced to rate records/sec or as fast as possible if rate is 0.
+    """
+
+    def __init__(self, records=10000, rate=0, size=100, mix=LEVEL_MIX):
+        self.records = records
+        self.rate = rate
+        self.size = size
+        self.mix = parse_mix(mix)
+
+    def run(self):
+        levels = choices(list(self.mix), list(self.mix.values()), k=self.records)
+        names = choices(LOGGERS, k=self.records)
+        payload = 'x' * self.size
+        start = time.perf_counter()
+        for i in range(self.records):
+            if self.rate:
+                delay = start + i / self.rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            logging.getLogger(names[i]).log(levels[i], 'Message no. %d %s', i, payload)
+
+
+class LatencyProbe(logging.Handler):
+    """
+    Added after the listener's own handlers. Samples the delay from each workload record's creation in a worker to its
+    handling here, and at exit dumps the samples with the listener's CPU time and peak RSS.
+    """
+
+    def __init__(self, path=PROBE_FILE):
+        super().__init__()
+        self.path = os.path.abspath(path)
+        self.names = frozenset(LOGGERS)
+        self.latencies = array('d')
+        # After the 20 and 30 of the handlers and filters that may still be flushing.
+        Finalize(self, self.dump, exitpriority=5)
+
+    def emit(self, record):
+        if record.name in self.names:
+            self.latencies.append(time.time() - record.created)
+
+    def dump(self):
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        with open(self.path, 'wb') as f:
+            pickle.dump({'latencies': self.latencies,
+                         'cpu': usage.ru_utime + usage.ru_stime,
+                         'rss': usage.ru_maxrss * 1024}, f)
+
+
+def add_probe():
+    logging.getLogger().addHandler(LatencyProbe())
+
+
+PROBE_HANDLER = {'()': 'experiments.benchmarks.bench_topologies.LatencyProbe'}
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def quiet(target, *args):
+    """Runs target with stdout and stderr sent to console.log."""
+    fd = os.open('console.log', os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    os.dup2(fd, 1)
+    os.dup2(fd, 2)
+    target(*args)
+
+
+def worker(configurer, arg, workload):
+    configurer(arg)
+    workload.run()
+
+
+def job(workload):
+    workload.run()
+
+
+def run_processes(configurer, arg, workload, workers):
+    processes = [mp.Process(target=worker, args=(configurer, arg, workload)) for _ in range(workers)]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+
+
+def run_pool(pool, workload, workers):
+    results = [pool.apply_async(job, args=(workload,)) for _ in range(workers)]
+    pool.close()
+    pool.join()
+    for result in results:
+        result.get()
+
+
+def vsajip_configs(q, queue_class, file_class):
+    """config_worker and config_listener of the logging_vsajip modules, with the probe on the root logger."""
+    config_worker = {
+        'version': 1,
+        'disable_existing_loggers': True,
+        'handlers': {'queue': {'class': queue_class, 'queue': q}},
+        'root': {'level': 'DEBUG', 'handlers': ['queue']}
+    }
+    config_listener = {
+        'version': 1,
+        'disable_existing_loggers': True,
+        'formatters': {
+            'detailed': {
+                'class': 'logging.Formatter',
+                'format': '%(asctime)s %(name)-15s %(levelname)-8s %(processName)-10s %(message)s'
+            },
+            'simple': {
+                'class': 'logging.Formatter',
+                'format': '%(name)-15s %(levelname)-8s %(processName)-10s %(message)s'
+            }
+        },
+        'handlers': {
+            'console': {'class': 'logging.StreamHandler', 'level': 'INFO', 'formatter': 'simple'},
+            'file': {'class': file_class, 'filename': 'mplog.log', 'mode': 'w', 'formatter': 'detailed'},
+            'foofile': {'class': file_class, 'filename': 'mplog-foo.log', 'mode': 'w', 'formatter': 'detailed'},
+            'errors': {'class': 'logging.FileHandler', 'filename': 'mplog-errors.log', 'mode': 'w',
+                       'level': 'ERROR', 'formatter': 'detailed'},
+            'probe': PROBE_HANDLER
+        },
+        'loggers': {'foo': {'handlers': ['foofile']}},
+        'root': {'level': 'DEBUG', 'handlers': ['console', 'file', 'errors', 'probe']}
+    }
+    return config_worker, config_listener
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def logging_vsajip(workload, workers):
+    from experiments.parallel import logging_vsajip as topology
+    q = mp.Queue()
+    config_worker, config_listener = vsajip_configs(
+        q, 'experiments.nlr.package.batching.BatchingQueueHandler',
+        'experiments.nlr.package.buffered.BufferedFileHandler')
+    stop_event = mp.Event()
+    listener = mp.Process(target=quiet, args=(topology.listener_process, q, stop_event, config_listener))
+    listener.start()
+    run_processes(logging.config.dictConfig, config_worker, workload, workers)
+    stop_event.set()
+    listener.join()
+
+
+def logging_vsajip_pool(workload, workers):
+    from experiments.parallel import logging_vsajip_pool as topology
+    q = mp.Queue()
+    config_worker, config_listener = vsajip_configs(q, 'logging.handlers.QueueHandler', 'logging.FileHandler')
+    stop_event = mp.Event()
+    listener = mp.Process(target=quiet, args=(topology.listener_process, q, stop_event, config_listener))
+    listener.start()
+    run_pool(mp.Pool(workers, initializer=logging.config.dictConfig, initargs=(config_worker,)), workload, workers)
+    stop_event.set()
+    listener.join()
+
+
+def single_file_listener():
+    from experiments.parallel import log_single_file as topology
+    topology.listener_configurer()
+    add_probe()
+
+
+def log_single_file(workload, workers):
+    from experiments.parallel import log_single_file as topology
+    queue = mp.Queue(-1)
+    listener = mp.Process(target=quiet, args=(topology.listener_process, queue, single_file_listener))
+    listener.start()
+    run_processes(topology.worker_configurer, queue, workload, workers)
+    queue.put_nowait(None)
+    listener.join()
+
+
+def single_file_pool_listener():
+    from experiments.parallel import log_single_file_pool as topology
+    topology.listener_configurer()
+    add_probe()
+
+
+def log_single_file_pool(workload, workers):
+    from experiments.parallel import log_single_file_pool as topology
+    queue = SharedMemoryQueue()
+    stop_event = mp.Event()
+    listener = mp.Process(target=quiet, args=(topology.listener_process, queue, single_file_pool_listener,
+                                              stop_event))
+    listener.start()
+    run_pool(mp.Pool(workers, initializer=topology.worker_configurer, initargs=(queue,)), workload, workers)
+    stop_event.set()
+    listener.join()
+    queue.unlink()
+
+
+def apply_with_log_listener():
+    from experiments.parallel import pool_apply_with_log as topology
+    topology.listener_configurer()
+    add_probe()
+
+
+def pool_apply_with_log(workload, workers):
+    from experiments.parallel import pool_apply_with_log as topology
+    queue = SharedMemoryQueue()
+    listener = mp.Process(target=quiet, args=(topology.listener_process, queue, apply_with_log_listener))
+    listener.start()
+    run_pool(mp.Pool(workers, initializer=topology.worker_configurer, initargs=(queue,)), workload, workers)
+    queue.put_nowait(None)
+    listener.join()
+    queue.unlink()
+
+
+class ProbedProcessLogger(ProcessLogger):
+
+    @staticmethod
+    def configure():
+        ProcessLogger.configure()
+        add_probe()
+
+    def run(self):
+        quiet(super().run)
+
+
+def pool_queue_logging(workload, workers):
+    process_logger = ProbedProcessLogger()
+    process_logger.start()
+    # Closed rather than terminated, as the with block in main() would, so the workers get to flush.
+    run_pool(PoolWithLogging(processes=workers, log_process=process_logger), workload, workers)
+    process_logger.stop()
+    process_logger.join()
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def percentile_ms(ordered, p):
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+
+
+def measure(name, workload, workers, keep=False):
+    directory = tempfile.mkdtemp(prefix='{}-'.format(name))
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        start = time.perf_counter()
+        globals()[name](workload, workers)
+        elapsed = time.perf_counter() - start
+        with open(PROBE_FILE, 'rb') as f:
+            probe = pickle.load(f)
+    except Exception as e:
+        return {'error': '{}: {}'.format(type(e).__name__, e)}
+    finally:
+        os.chdir(cwd)
+        if keep:
+            print('{} kept in {}'.format(name, directory))
+        else:
+            shutil.rmtree(directory, ignore_errors=True)
+    latencies = sorted(probe['latencies'])
+    sent = workload.records * workers
+    return {
+        'sent': sent,
+        'written': len(latencies),
+        'lost': sent - len(latencies),
+        'seconds': elapsed,
+        'records_per_sec': len(latencies) / elapsed,
+        'p50_ms': percentile_ms(latencies, 50),
+        'p99_ms': percentile_ms(latencies, 99),
+        'listener_cpu_s': probe['cpu'],
+        'listener_peak_rss_mb': probe['rss'] / (1 << 20)
+    }
+
+
+def fmt_ms(value):
+    return '{:>10.2f}'.format(value) if value is not None else '{:>10}'.format('-')
+
+
+def report(results, params, baseline=None):
+    print('{:<22} {:>12} {:>9} {:>10} {:>10} {:>8} {:>9}'.format(
+        'topology', 'records/sec', 'lost', 'p50 ms', 'p99 ms', 'cpu s', 'rss MB'))
+    for name, result in results.items():
+        if 'error' in result:
+            print('{:<22} {}'.format(name, result['error']))
+            continue
+        print('{:<22} {:>12,.0f} {:>9,d} {} {} {:>8.2f} {:>9.1f}'.format(
+            name, result['records_per_sec'], result['lost'], fmt_ms(result['p50_ms']),
+            fmt_ms(result['p99_ms']), result['listener_cpu_s'], result['listener_peak_rss_mb']))
+    if not baseline:
+        return
+    print('\nchange from baseline')
+    if baseline['params'] != params:
+        print('(parameters differ: {})'.format(baseline['params']))
+    for name, result in results.items():
+        before = baseline['results'].get(name)
+        if 'error' in result or not before or 'error' in before:
+            continue
+        changes = []
+        for key in ('records_per_sec', 'p99_ms', 'listener_cpu_s', 'listener_peak_rss_mb'):
+            if result[key] is not None and before[key]:
+                changes.append('{} {:+.1%}'.format(key, result[key] / before[key] - 1))
+        print('{:<22} {}'.format(name, '  '.join(changes)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--topologies', nargs='+', choices=TOPOLOGIES, default=TOPOLOGIES)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--records', type=int, default=5000, help='records per worker')
+    parser.add_argument('--rate', type=float, default=0, help='records/sec per worker; 0 for flat out')
+    parser.add_argument('--size', type=int, default=100, help='payload bytes per record')
+    parser.add_argument('--levels', default=LEVEL_MIX, help='level weights, as in the default')
+    parser.add_argument('--start-method', choices=mp.get_all_start_methods())
+    parser.add_argument('--output', help='write the parameters and results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON from an earlier --output to compare against')
+    parser.add_argument('--keep', action='store_true', help="keep each topology's scratch directory")
+    args = parser.parse_args()
+
+    if args.start_method:
+        mp.set_start_method(args.start_method)
+    workload = Workload(args.records, args.rate, args.size, args.levels)
+    params = {'workers': args.workers, 'records': args.records, 'rate': args.rate, 'size': args.size,
+              'levels': args.levels, 'start_method': mp.get_start_method()}
+    results = {name: measure(name, workload, args.workers, args.keep) for name in args.topologies}
+    run = {
+        'params': params,
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(),
+                    'cpus': os.cpu_count()},
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results
+    }
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    report(results, params, baseline)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(run, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
+# %%
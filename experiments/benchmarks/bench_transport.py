@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_transport.py                                                                                           #
+# Language : Python 3.8.12                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 11:40:15 am                                                                        #
+# Modified : Sunday, October 18th 2026, 11:40:15 am                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Records/sec through each candidate log transport, with several producers and one consumer."""
+import argparse
+import logging
+import multiprocessing as mp
+import time
+
+from experiments.nlr.package.ringbuffer import SharedMemoryQueue
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def make_record(i):
+    return logging.LogRecord('a.b.c', logging.INFO, __file__, i, 'Random message #%d', (i,), None,
+                             func='producer')
+
+
+def producer(q, records):
+    for i in range(records):
+        q.put(make_record(i))
+
+
+def run(name, q, producers, records):
+    workers = [mp.Process(target=producer, args=(q, records)) for _ in range(producers)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for _ in range(producers * records):
+        q.get()
+    elapsed = time.perf_counter() - start
+    for w in workers:
+        w.join()
+    rate = producers * records / elapsed
+    print('{:<20} {:>10,.0f} records/sec'.format(name, rate))
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--producers', type=int, default=4)
+    parser.add_argument('--records', type=int, default=20000)
+    args = parser.parse_args()
+
+    manager = mp.Manager()
+    ring = SharedMemoryQueue()
+    transports = [('Manager().Queue', manager.Queue()),
+                  ('mp.Queue', mp.Queue()),
+                  ('mp.SimpleQueue', mp.SimpleQueue()),
+                  ('SharedMemoryQueue', ring)]
+    print('{} producers x {} records'.format(args.producers, args.records))
+    try:
+        for name, q in transports:
+            run(name, q, args.producers, args.records)
+    finally:
+        ring.unlink()
+        manager.shutdown()
+
+
+if __name__ == '__main__':
+    main()
+# %%
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bench_wire.py                                                                                                #
+# Language : Python 3.8.12                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 3:31:44 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 3:31:44 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+# %%
+"""Bytes per record and records/sec of the compact wire format against pickling prepared LogRecords."""
+import argparse
+import logging
+import logging.handlers
+import pickle
+import time
+from random import choice, randint
+
+from experiments.nlr.package.project import Job
+from experiments.nlr.package.wire import RecordDecoder, RecordEncoder
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def make_records(n):
+    """Records shaped like those Job.run emits."""
+    handler = logging.handlers.QueueHandler(None)
+    records = []
+    for i in range(n):
+        record = logging.LogRecord(choice(Job.loggers), choice(Job.levels), __file__, 49,
+                                   'I made %s last year', ("${:,.2f}".format(randint(9999999, 99999999)),),
+                                   None, func='run')
+        records.append(handler.prepare(record))
+    return records
+
+
+def measure(name, encode, decode, records):
+    start = time.perf_counter()
+    encoded = [encode(record) for record in records]
+    middle = time.perf_counter()
+    for data in encoded:
+        decode(data)
+    end = time.perf_counter()
+    size = sum(len(data) for data in encoded) / len(encoded)
+    print('{:<10} {:>8.1f} bytes/record {:>12,.0f} encodes/sec {:>12,.0f} decodes/sec'.format(
+        name, size, len(records) / (middle - start), len(records) / (end - middle)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=100000)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    measure('pickle', lambda record: pickle.dumps(record, pickle.HIGHEST_PROTOCOL), pickle.loads, records)
+    measure('compact', RecordEncoder().encode, RecordDecoder().decode, records)
+
+
+if __name__ == '__main__':
+    main()
+# %%
@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Sunday, November 7th 2021, 1:49:24 am                                                                         #
-# Modified : Sunday, November 7th 2021, 6:01:37 am                                                                         #
+# Modified : Sunday, October 18th 2026, 10:31:50 pm                                                                        #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -35,19 +35,51 @@ LOG_FILEPATH = ".logs/debug.log"
 LOG_FILEPATH_ERRORS = ".logs/error.log"
 
 
-def get_queue_config(queue):
+def get_queue_config(queue, capacity=100, flush_interval=0.5, levels=None,
+                     dedupe_window=None, rate=None, burst=None, rates=None):
+    """
+    Worker configuration shipping records to queue. levels, as returned by
+    package.levels.compile_levels for the listener configuration, sets the
+    worker loggers so that records the listener would discard are never sent.
+
+    dedupe_window collapses repeats of a message within that many seconds
+    into one record and a count. rate limits each logger to that many
+    records per second, in bursts of up to burst, with rates overriding it
+    per logger name. Both act before records reach the queue; see
+    package.throttle.
+    """
+    levels = dict(levels or {})
+    root_level = levels.pop('root', logging.DEBUG)
+    filters = {}
+    if dedupe_window:
+        filters['dedupe'] = {
+            '()': 'experiments.nlr.package.throttle.DuplicateFilter',
+            'window': dedupe_window
+        }
+    if rate or rates:
+        filters['ratelimit'] = {
+            '()': 'experiments.nlr.package.throttle.RateLimitFilter',
+            'rate': rate,
+            'burst': burst,
+            'rates': rates
+        }
     return {
         'version': 1,
         'disable_existing_loggers': True,
+        'filters': filters,
         'handlers': {
             'queue': {
-                'class': 'logging.handlers.QueueHandler',
-                'queue': queue
+                'class': 'experiments.nlr.package.batching.BatchingQueueHandler',
+                'queue': queue,
+                'capacity': capacity,
+                'flush_interval': flush_interval,
+                'filters': list(filters)
             }
         },
+        'loggers': {name: {'level': level} for name, level in levels.items()},
         'root': {
             'handlers': ['queue'],
-            'level': 'DEBUG'
+            'level': root_level
         }
     }
 
@@ -86,7 +118,7 @@ config_listener = {
             'level': 'INFO'
         },
         'file': {
-            'class': 'logging.FileHandler',
+            'class': 'experiments.nlr.package.buffered.BufferedFileHandler',
             'filename': LOG_FILEPATH,
             'mode': 'w',
             'formatter': 'detailed',
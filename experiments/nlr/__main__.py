@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Sunday, November 7th 2021, 3:52:43 am                                                                         #
-# Modified : Sunday, November 7th 2021, 2:15:10 pm                                                                         #
+# Modified : Monday, October 19th 2026, 1:34:05 pm                                                                         #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -24,12 +24,19 @@ import logging.config
 import logging.handlers
 import multiprocessing as mp
 from random import choice
+from experiments.nlr.package.batching import unbatch
+from experiments.nlr.package.bootstrap import configure
 from experiments.nlr.package.director import Director
+from experiments.nlr.package.dispatch import DispatchTable
+from experiments.nlr.package.levels import LevelTable
+from experiments.nlr.package.overflow import OverflowCounters
 from experiments.nlr.package.project import Job
+from experiments.nlr.package.ringbuffer import SharedMemoryQueue
 
 # ------------------------------------------------------------------------------------------------------------------------ #
 LOG_FILEPATH = "logs/debug.log"
 LOG_FILEPATH_ERRORS = "logs/error.log"
+JOB_TIMEOUT = 60
 # ------------------------------------------------------------------------------------------------------------------------ #
 
 
@@ -41,32 +48,32 @@ class MyHandler:
     configured for those loggers.
     """
 
-    def handle(self, record):
-        if record.name == "root":
-            logger = logging.getLogger()
-        else:
-            logger = logging.getLogger(record.name)
+    def __init__(self):
+        self.dispatch = DispatchTable()
 
-        record.processName = '%s (for %s)' % (
-            current_process().name, record.processName)
-        logger.handle(record)
+    def handle(self, item):
+        for record in unbatch(item):
+            self.dispatch.handle(record)
 
 
-def listener_process(queue, configurer):
+def listener_process(queue, config, counters):
     logging.config.dictConfig(config)
+    counters.start_reporting()
+    dispatch = DispatchTable(rewrite_process_name=False)
     while True:
         try:
-            record = queue.get()
-            if record is None:  # We send this as a sentinel to tell the listener to quit.
+            item = queue.get()
+            if item is None:  # We send this as a sentinel to tell the listener to quit.
                 break
-            logger = logging.getLogger(record.name)
-            # No level or filter logic applied - just do it!
-            logger.handle(record)
+            for record in unbatch(item):
+                # No level or filter logic applied - just do it!
+                dispatch.handle(record)
         except Exception:
             import sys
             import traceback
             print('Whoops! Problem:', file=sys.stderr)
             traceback.print_exc(file=sys.stderr)
+    counters.close()
 
 
 def listener_process2(q, stop_event, config):
@@ -96,8 +103,11 @@ def listener_process2(q, stop_event, config):
     listener.stop()
 
 
-def worker_pool_init(config: dict):
-    logging.config.dictConfig(config)
+def worker_pool_init(config: dict, levels: LevelTable):
+    configure(config)
+    # Only ship what the listener would write; the table follows listener reloads.
+    levels.apply()
+    levels.watch()
 
 
 def worker_pool_process(job):
@@ -108,33 +118,19 @@ def worker_pool_process(job):
     return result
 
 
-def execute_project(project, config_worker):
-
-    pool = mp.Pool(processes=12, initializer=worker_pool_init,
-                   initargs=config_worker)
-    async_results = [pool.apply_async(
-        func=worker_pool_process, args=(job)) for job in project.jobs]
-    pool.close()
-    pool.join()
-
-    results = [async_result.get() for async_result in async_results]
-
-    project.compile_results(results)
-
-    return project
-
-
-def work(director, config_worker):
-    projects = director.get_projects()
-    completed_projects = [execute_project(
-        project, config_worker) for project in projects]
-    director.set_projects(completed_projects)
+def work(director):
+    # Jobs of every project share the director's pool, so no project waits on another's tail,
+    # and each result reaches its project as soon as it returns. A hung job gets a TimeoutError as
+    # its result after its deadline instead of blocking the run, and its worker is terminated and
+    # replaced.
+    director.run(worker_pool_process, stream=True, timeout=JOB_TIMEOUT)
     director.print_projects()
     return director
 
 
 def main():
-    queue = mp.Manager().Queue()
+    queue = SharedMemoryQueue()
+    counters = OverflowCounters()
 
     config_main = {
         'version': 1,
@@ -154,14 +150,25 @@ def main():
     # root logger, which allows all messages to be sent to the queue.
     # We disable existing loggers to disable the "setup" logger used in the
     # parent process. This is needed on POSIX because the logger will
-    # be there in the child following a fork().
+    # be there in the child following a fork(). Repeated messages are
+    # collapsed in the worker so that a flood costs one record on the queue.
     config_worker = {
         'version': 1,
         'disable_existing_loggers': True,
+        'filters': {
+            'dedupe': {
+                '()': 'experiments.nlr.package.throttle.DuplicateFilter',
+                'window': 1.0
+            }
+        },
         'handlers': {
             'queue': {
-                'class': 'logging.handlers.QueueHandler',
+                'class': 'experiments.nlr.package.batching.CompactQueueHandler',
                 'queue': queue,
+                'defer_format': True,
+                'overflow': 'drop',
+                'counters': counters,
+                'filters': ['dedupe'],
                 'level': 'DEBUG'
             }
         },
@@ -191,7 +198,7 @@ def main():
                 'level': 'DEBUG'
             },
             'file': {
-                'class': 'logging.FileHandler',
+                'class': 'experiments.nlr.package.buffered.BufferedFileHandler',
                 'filename': "log_debug.log",
                 'mode': 'w',
                 'formatter': 'detailed',
@@ -217,17 +224,22 @@ def main():
 
     stop_event = mp.Event()
     lp = mp.Process(target=listener_process, name='listener',
-                    args=(queue, config_listener))
+                    args=(queue, config_listener, counters))
     lp.start()
 
-    director = Director()
-    director = work(director, config_worker)
+    levels = LevelTable(config_listener)
+
+    # Closing the director's pool at the end flushes whatever the workers still buffer.
+    with Director(processes=12, initializer=worker_pool_init,
+                  initargs=(config_worker, levels)) as director:
+        director = work(director)
 
     logger.info('Telling listener to stop ...')
     # stop_event.set()
     # lp.join()
     queue.put_nowait(None)
     lp.join()
+    queue.unlink()
     logger.info('All done.')
 
 
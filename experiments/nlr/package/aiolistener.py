@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \aiolistener.py                                                                                               #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 12:09:48 am                                                                        #
+# Modified : Monday, October 19th 2026, 9:51:26 am                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""An asyncio listener reading several log queues and pipes at once."""
+import asyncio
+import logging
+import logging.config
+import os
+import queue as queues
+import sys
+import traceback
+from multiprocessing.connection import Connection
+
+from .batching import unbatch
+from .dispatch import DispatchTable
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Transports without a file descriptor to wait on, such as SharedMemoryQueue, are polled, backing off to this.
+_MAX_POLL = 0.005
+# Items taken from one transport before the others get a turn, in case no sink ever awaits anything.
+_TURN = 64
+# Returned in place of an item once a transport is finished.
+_END = object()
+
+
+class DispatchSink:
+    """Routes records through the listener's logging configuration, as the thread-based listeners do."""
+
+    def __init__(self, rewrite_process_name=True):
+        self.dispatch = DispatchTable(rewrite_process_name)
+
+    async def handle(self, records):
+        for record in records:
+            self.dispatch.handle(record)
+
+    async def flush(self):
+        pass
+
+    async def aclose(self):
+        pass
+
+
+class AsyncFileSink:
+    """
+    Appends formatted records to a file. Records are formatted on the event
+    loop and written from the loop's default executor, a buffer_size block
+    at a time and on each flush(), so a slow disk delays the writes but never
+    the loop.
+    """
+
+    def __init__(self, filename, mode='a', formatter=None, level=logging.NOTSET,
+                 buffer_size=1 << 16, encoding='utf-8'):
+        self.filename = os.path.abspath(filename)
+        self.mode = mode
+        self.formatter = formatter or logging.Formatter(logging.BASIC_FORMAT)
+        self.level = level
+        self.buffer_size = buffer_size
+        self.encoding = encoding
+        self._buffer = []
+        self._size = 0
+        self._file = None
+        self._lock = None
+
+    async def handle(self, records):
+        level = self.level
+        for record in records:
+            if record.levelno >= level:
+                line = self.formatter.format(record) + '\n'
+                self._buffer.append(line)
+                self._size += len(line)
+        if self._size >= self.buffer_size:
+            await self.flush()
+
+    async def flush(self):
+        if not self._buffer:
+            return
+        data = ''.join(self._buffer)
+        self._buffer = []
+        self._size = 0
+        # The lock is fair, so blocks reach the file in the order they were taken.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, data)
+
+    def _write(self, data):
+        if self._file is None:
+            self._file = open(self.filename, self.mode, encoding=self.encoding)
+        self._file.write(data)
+        self._file.flush()
+
+    async def aclose(self):
+        await self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class AsyncListener:
+    """
+    Reads any number of log transports, typically one per pool or per
+    project, on one event loop, and hands each item's records to the sinks in
+    turn. A sink is any object with handle(records), flush() and aclose()
+    coroutines; by default records go through the logging configuration.
+
+    multiprocessing Queues and Connections are waited on through their file
+    descriptors, so an idle listener costs nothing. Anything else with
+    get_nowait(), such as SharedMemoryQueue, is polled.
+
+    A transport is finished by a None sentinel or, for a Connection, once
+    every writer has closed it. stop(), or setting stop_event, finishes all
+    of them once what they hold has been handled. run() returns when they are
+    all finished; given a stop_event it waits for that as well, so transports
+    can be added while it runs. Transports added by name have their records
+    tagged with it as record.source.
+    """
+
+    def __init__(self, transports=(), sinks=None, stop_event=None, metrics=None, flush_interval=1.0,
+                 poll_interval=0.05):
+        self.sinks = list(sinks) if sinks is not None else [DispatchSink()]
+        self.stop_event = stop_event
+        self.metrics = metrics
+        self.flush_interval = flush_interval
+        self.poll_interval = poll_interval
+        self._pending = list(transports.items() if isinstance(transports, dict) else
+                             ((None, transport) for transport in transports))
+        self._readers = set()
+        self._wakeups = set()
+        self._stopping = False
+        self._done = None
+
+    def add(self, transport, name=None):
+        """Starts reading transport. Call it from the loop's thread."""
+        if self._done is None:
+            self._pending.append((name, transport))
+            return
+        task = asyncio.get_running_loop().create_task(self._read(transport, name))
+        self._readers.add(task)
+        task.add_done_callback(self._finished)
+
+    def _finished(self, task):
+        self._readers.discard(task)
+        if not self._readers and (self.stop_event is None or self._stopping):
+            self._done.set()
+
+    def stop(self):
+        """Finishes every transport once drained. Call it from the loop's thread."""
+        self._stopping = True
+        for wakeup in self._wakeups:
+            wakeup.set()
+        if self._done is not None and not self._readers:
+            self._done.set()
+
+    async def run(self):
+        self._done = asyncio.Event()
+        pending, self._pending = self._pending, []
+        for name, transport in pending:
+            self.add(transport, name)
+        if not self._readers and (self.stop_event is None or self._stopping):
+            self._done.set()
+        helpers = [asyncio.create_task(self._flush_sinks())]
+        if self.stop_event is not None:
+            helpers.append(asyncio.create_task(self._watch_stop_event()))
+        await self._done.wait()
+        if self._readers:
+            await asyncio.wait(self._readers)
+        for helper in helpers:
+            helper.cancel()
+        for sink in self.sinks:
+            await sink.aclose()
+
+    async def _watch_stop_event(self):
+        while not self.stop_event.is_set():
+            await asyncio.sleep(self.poll_interval)
+        self.stop()
+
+    async def _flush_sinks(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            for sink in self.sinks:
+                await sink.flush()
+
+    async def _handle(self, item, name):
+        try:
+            records = list(unbatch(item))
+            if name is not None:
+                for record in records:
+                    record.source = name
+            for sink in self.sinks:
+                await sink.handle(records)
+            if self.metrics is not None:
+                self.metrics.observe(records)
+        except Exception:
+            print('Whoops! Problem:', file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+
+    async def _read(self, transport, name):
+        fd, get = self._source(transport)
+        wakeup = asyncio.Event()
+        self._wakeups.add(wakeup)
+        loop = asyncio.get_running_loop()
+        if fd is not None:
+            loop.add_reader(fd, wakeup.set)
+        handled = 0
+        try:
+            while True:
+                item = await self._take(get, fd, wakeup)
+                if item is _END:
+                    return
+                await self._handle(item, name)
+                handled += 1
+                if not handled % _TURN:
+                    await asyncio.sleep(0)
+        finally:
+            if fd is not None:
+                loop.remove_reader(fd)
+            self._wakeups.discard(wakeup)
+
+    async def _take(self, get, fd, wakeup):
+        # The next item on a transport, waiting for one as long as the listener runs; _END once it is finished.
+        wait = 0.0
+        while True:
+            try:
+                item = get()
+            except queues.Empty:
+                if self._stopping:
+                    return _END
+                if fd is not None:
+                    wakeup.clear()
+                    await wakeup.wait()
+                else:
+                    wait = min(wait * 2 or 0.0001, _MAX_POLL)
+                    await asyncio.sleep(wait)
+                continue
+            except EOFError:
+                return _END
+            return _END if item is None else item
+
+    def _source(self, transport):
+        # (file descriptor to wait on or None to poll, non-blocking get) for a transport.
+        if isinstance(transport, Connection):
+            return transport.fileno(), self._receiver(transport)
+        if hasattr(transport, '_reader'):
+            # A multiprocessing Queue: items arrive on the pipe behind it.
+            return transport._reader.fileno(), transport.get_nowait
+        return None, transport.get_nowait
+
+    @staticmethod
+    def _receiver(connection):
+        def get():
+            if not connection.poll():
+                raise queues.Empty
+            return connection.recv()
+        return get
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def listener_process(transports, stop_event, config, sinks=None, metrics=None, stats_interval=None):
+    """
+    Configures logging and runs an AsyncListener over transports until they
+    are all finished or stop_event is set.
+    """
+    logging.config.dictConfig(config)
+    if metrics is not None:
+        metrics.start(stats_interval)
+    asyncio.run(AsyncListener(transports, sinks, stop_event, metrics).run())
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \batching.py                                                                                                  #
+# Language : Python 3.8.12                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 9:12:40 am                                                                         #
+# Modified : Monday, October 19th 2026, 12:31:47 pm                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Batched transport of LogRecords from worker processes to the listener."""
+import copy
+import logging
+import logging.handlers
+import multiprocessing.util
+import os
+import threading
+import time
+import weakref
+
+from .overflow import POLICIES
+from .wire import RecordEncoder, decode
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class RecordBatch(list):
+    """
+    A block of prepared LogRecords shipped to the listener as one queue message.
+    It is a plain list so that it pickles as cheaply as the records themselves.
+    """
+
+
+def unbatch(item):
+    """Yields the LogRecords carried by an item taken off a log queue, decoding compact ones."""
+    for record in item if isinstance(item, RecordBatch) else (item,):
+        if isinstance(record, bytes):
+            record = decode(record)
+            if record is None:
+                continue
+        yield record
+
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+_SCALARS = frozenset((str, int, float, bool, bytes, type(None)))
+_exception_formatter = logging.Formatter()
+
+
+def pickle_safe(value):
+    """
+    True if value is built only from builtin types that serialise cheaply and
+    format the same in any process. Subclasses are excluded, since their
+    __str__ or __repr__ may depend on state that does not travel.
+    """
+    kind = type(value)
+    if kind in _SCALARS:
+        return True
+    if kind is tuple or kind is list:
+        return all(pickle_safe(item) for item in value)
+    if kind is dict:
+        return all(type(key) is str and pickle_safe(item) for key, item in value.items())
+    return False
+
+
+def defer(record):
+    """
+    Prepares a copy of record for the queue with msg and args left unformatted,
+    so that getMessage() and formatting happen in the listener. Only the
+    exception, whose traceback cannot cross the process boundary, is rendered
+    here.
+    """
+    record = copy.copy(record)
+    if record.exc_info:
+        if not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record.exc_info = None
+    return record
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class BatchingQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that collects records in the worker and enqueues them as a
+    single RecordBatch, rather than doing one put per record.
+
+    The buffer is flushed when it reaches capacity, when the oldest buffered
+    record is older than flush_interval seconds, when a record at or above
+    flush_level arrives and when the process exits, as pool workers do once
+    the pool is closed and joined; see flush_all() for Pool.terminate(). A
+    background thread enforces the time threshold so that a
+    quiet worker does not sit on its records.
+
+    With defer_format, records whose args are pickle safe are sent with msg
+    and args unformatted and the listener does the formatting. Other records
+    fall back to the eager QueueHandler.prepare().
+
+    overflow selects what happens when a bounded transport is full: 'block',
+    'drop', 'sample' or 'spill' (see package.overflow). Its options, such as
+    max_pending, sample_rate, spill_dir and shared counters, are passed as
+    further keyword arguments. Without it a full transport is reported
+    through handleError().
+    """
+
+    def __init__(self, queue, capacity=100, flush_interval=0.5, flush_level=logging.ERROR,
+                 defer_format=False, overflow=None, **overflow_options):
+        super().__init__(queue)
+        self.overflow = POLICIES[overflow](self, **overflow_options) if overflow else None
+        self._levels = []
+        self.defer_format = defer_format
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.buffer = RecordBatch()
+        self._oldest = None
+        self._pid = None
+        self._closed = False
+        self._wakeup = threading.Event()
+        self._registered = None
+        self._register()
+
+    def _register(self):
+        # Finalizers are per process, so a handler inherited across a fork
+        # registers again in the child.
+        if self._registered != os.getpid():
+            self._registered = os.getpid()
+            flush_at_exit(self)
+
+    def prepare(self, record):
+        if self.defer_format and isinstance(record.msg, str) and pickle_safe(record.args):
+            return defer(record)
+        return super().prepare(record)
+
+    def _start_timer(self):
+        # Threads do not survive a fork, so the timer is started lazily by
+        # whichever process first emits through this handler.
+        self._pid = os.getpid()
+        self._register()
+        if self.flush_interval:
+            timer = threading.Thread(target=self._run_timer, name='BatchingQueueHandler',
+                                     daemon=True)
+            timer.start()
+
+    def _run_timer(self):
+        while not self._wakeup.wait(self.flush_interval):
+            oldest = self._oldest
+            if oldest is not None and time.monotonic() - oldest >= self.flush_interval:
+                self.flush()
+            elif self.overflow is not None and self.overflow.pending:
+                # Retry what a full transport turned away, even if the worker has gone quiet.
+                self.flush()
+
+    def emit(self, record):
+        try:
+            if self._pid != os.getpid():
+                self._start_timer()
+            if self.overflow is not None and not self.overflow.admit(record):
+                return
+            self.buffer.append(self.prepare(record))
+            self._levels.append(record.levelno)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            if self.should_flush(record):
+                self._flush()
+        except Exception:
+            self.handleError(record)
+
+    def should_flush(self, record):
+        return (len(self.buffer) >= self.capacity
+                or record.levelno >= self.flush_level
+                or time.monotonic() - self._oldest >= self.flush_interval)
+
+    def _flush(self):
+        if self.buffer:
+            batch, self.buffer, self._oldest = self.buffer, RecordBatch(), None
+            levels, self._levels = self._levels, []
+            if self.overflow is None:
+                self.enqueue(batch)
+            else:
+                self.overflow.send(batch, levels)
+        elif self.overflow is not None and self.overflow.pending:
+            self.overflow.send((), ())
+
+    def put(self, items, block=False, timeout=None):
+        """Sends items to the transport as one RecordBatch."""
+        self.queue.put(RecordBatch(items), block, timeout)
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._flush()
+        finally:
+            self.release()
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._wakeup.set()
+            self.flush()
+            if self.overflow is not None:
+                self.overflow.close()
+        super().close()
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class CompactQueueHandler(BatchingQueueHandler):
+    """
+    A BatchingQueueHandler that ships records in the compact wire format
+    rather than as pickled LogRecord dicts. Use capacity=1 to send records
+    one at a time.
+    """
+
+    def __init__(self, queue, capacity=100, flush_interval=0.5, flush_level=logging.ERROR,
+                 defer_format=False, overflow=None, **overflow_options):
+        super().__init__(queue, capacity, flush_interval, flush_level, defer_format,
+                         overflow, **overflow_options)
+        self.encoder = RecordEncoder()
+
+    def prepare(self, record):
+        if self.defer_format and isinstance(record.msg, str) and pickle_safe(record.args):
+            # The encoder only reads the record, so unlike defer() no copy is needed.
+            return self.encoder.encode(record)
+        return self.encoder.encode(logging.handlers.QueueHandler.prepare(self, record))
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+_flushed = weakref.WeakSet()
+
+
+def flush_all():
+    """
+    Flushes every batching and segment handler in this process. Buffered
+    records are flushed by a finalizer when the process exits, as a pool
+    worker does after Pool.close() and join(), but Pool.terminate() kills
+    its workers outright: a job whose records must survive it calls this
+    before returning.
+    """
+    for handler in list(_flushed):
+        handler.flush()
+
+
+def flush_at_exit(handler):
+    """Has handler flushed, and closed, when this process exits, and by flush_all()."""
+    # Runs ahead of the queue's own finalizers (priority 10) so the batch
+    # still has a transport to go to when the process shuts down.
+    multiprocessing.util.Finalize(handler, handler.close, exitpriority=20)
+    _flushed.add(handler)
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class BatchQueueListener(logging.handlers.QueueListener):
+    """A QueueListener that unpacks RecordBatches before dispatching to its handlers."""
+
+    def handle(self, item):
+        for record in unbatch(item):
+            super().handle(record)
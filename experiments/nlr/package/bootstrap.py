@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \bootstrap.py                                                                                                 #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 1:15:02 am                                                                         #
+# Modified : Monday, October 19th 2026, 1:42:51 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Configures logging once per process, however many jobs the process runs."""
+import inspect
+import logging
+import logging.config
+import os
+import pickle
+# ------------------------------------------------------------------------------------------------------------------------ #
+# (pid, canonical form) of the configuration this process last applied, and the
+# last object found to match it, held so that its id cannot be reused.
+_applied = None
+_config = None
+_SCALARS = frozenset((str, bytes, int, float, bool, complex, type(None)))
+
+
+def _canonical(value):
+    # A form of a dictConfig configuration that is equal for equal configurations, whatever order their keys
+    # are in. Objects in it count by their config_key() where they define one, and otherwise by their pickle.
+    kind = type(value)
+    if kind in _SCALARS:
+        return value
+    if isinstance(value, dict):
+        # Sorted, so that key order does not count.
+        try:
+            keys = sorted(value)
+        except TypeError:
+            keys = sorted(value, key=repr)
+        return ('dict', tuple((key, _canonical(value[key])) for key in keys))
+    if isinstance(value, (list, tuple)):
+        return (kind.__name__, tuple(map(_canonical, value)))
+    if isinstance(value, (set, frozenset)):
+        return (kind.__name__, tuple(sorted(map(_canonical, value), key=repr)))
+    if isinstance(value, type) or inspect.isroutine(value):
+        return ('%s.%s' % (value.__module__, value.__qualname__),)
+    return _object(value, '%s.%s' % (kind.__module__, kind.__qualname__))
+
+
+def _object(value, name):
+    key = getattr(value, 'config_key', None)
+    if key is not None:
+        return (name, _canonical(key()))
+    try:
+        return (name, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        # Queues and locks only pickle while a process starts, so any copy of one was inherited: the same object.
+        return (name, id(value))
+
+
+def configure(config):
+    """
+    Applies config with logging.config.dictConfig unless it is what this
+    process already runs. Use it as the pool initializer, and in jobs that
+    bring their own configuration: a matching one costs a comparison, not
+    a teardown and rebuild of every handler, and the very object last
+    matched is not even compared, so edit a copy rather than the dict
+    itself. Returns True if it applied config.
+
+    Configurations match whatever order their keys are in. Objects in them,
+    such as handlers and transports, match by their config_key() where they
+    define one, as SocketQueue does with its address, and otherwise by
+    their pickle, so that a pickled copy matches the original. What cannot
+    be pickled matches by identity, as the queues workers inherit do.
+
+    A forked child applies the configuration again, since the one it
+    inherited was set up for its parent.
+    """
+    global _applied, _config
+    pid = os.getpid()
+    if config is _config and _applied is not None and _applied[0] == pid:
+        return False
+    # Compared as is: within one process, the canonical form needs no digest.
+    key = (pid, _canonical(config))
+    if key == _applied:
+        _config = config
+        return False
+    # Recorded only once applied: a configuration dictConfig rejects is tried again next time.
+    logging.config.dictConfig(config)
+    _applied = key
+    _config = config
+    return True
+
+
+def reset():
+    """Forgets the applied configuration, so the next configure() applies whatever it is given."""
+    global _applied, _config
+    _applied = None
+    _config = None
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \buffered.py                                                                                                  #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 8:54:12 pm                                                                         #
+# Modified : Monday, October 19th 2026, 2:03:10 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""A listener file handler that writes formatted records in batches rather than one at a time."""
+import logging
+import os
+import threading
+import time
+# ------------------------------------------------------------------------------------------------------------------------ #
+NEVER = 'never'
+BATCH = 'batch'
+INTERVAL = 'interval'
+FSYNC_POLICIES = (NEVER, BATCH, INTERVAL)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    A FileHandler that formats records as they arrive but collects them in
+    memory, then writes the whole buffer with a single write() and flush().
+
+    The buffer is written when it holds buffer_size characters, when the
+    oldest buffered record is older than flush_interval seconds, and
+    immediately when a record at or above flush_level arrives, so errors are
+    on disk as soon as FileHandler would have put them there. A background
+    thread enforces the time threshold.
+
+    fsync controls how far durability goes beyond the OS page cache: 'never'
+    leaves it to the OS, 'batch' calls os.fsync() after every write and
+    'interval' at most once per flush_interval. Unless it is 'never',
+    records at or above flush_level are fsynced straight away.
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False, errors=None,
+                 buffer_size=1 << 20, flush_interval=1.0, fsync=NEVER, flush_level=logging.ERROR):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError('fsync must be one of %s, not %r' % (', '.join(FSYNC_POLICIES), fsync))
+        if errors is None:
+            super().__init__(filename, mode, encoding, delay)
+        else:
+            super().__init__(filename, mode, encoding, delay, errors)  # FileHandler takes errors from Python 3.9.
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.flush_level = flush_level
+        self.buffer = []
+        self._size = 0
+        self._oldest = None
+        self._unsynced = False
+        self._pid = None
+        self._wakeup = threading.Event()
+
+    def _start_timer(self):
+        # As in BatchingQueueHandler, the timer belongs to the process that emits.
+        self._pid = os.getpid()
+        if self.flush_interval:
+            timer = threading.Thread(target=self._run_timer, name='BufferedFileHandler',
+                                     daemon=True)
+            timer.start()
+
+    def _run_timer(self):
+        while not self._wakeup.wait(self.flush_interval):
+            self.acquire()
+            try:
+                oldest = self._oldest
+                if oldest is not None and time.monotonic() - oldest >= self.flush_interval:
+                    self._commit()
+                if self.fsync == INTERVAL and self._unsynced:
+                    self._sync()
+            except Exception:
+                self.handleError(None)
+            finally:
+                self.release()
+
+    def emit(self, record):
+        try:
+            if self._pid != os.getpid():
+                self._start_timer()
+            message = self.format(record) + self.terminator
+            self.buffer.append(message)
+            self._size += len(message)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            if record.levelno >= self.flush_level:
+                self._commit(sync=self.fsync != NEVER)
+            elif self._size >= self.buffer_size:
+                self._commit()
+        except Exception:
+            self.handleError(record)
+
+    def _commit(self, sync=False):
+        """Writes the buffer in one go. Call with the handler lock held."""
+        if self.buffer:
+            data, self.buffer, self._size, self._oldest = ''.join(self.buffer), [], 0, None
+            if self.stream is None and (self.mode != 'w' or not self._closed):
+                self.stream = self._open()
+            if self.stream is None:
+                return
+            self.stream.write(data)
+            self.stream.flush()
+            self._unsynced = True
+        if self._unsynced and (sync or self.fsync == BATCH):
+            self._sync()
+
+    def _sync(self):
+        os.fsync(self.stream.fileno())
+        self._unsynced = False
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._commit(sync=self.fsync != NEVER)
+        finally:
+            self.release()
+
+    def close(self):
+        self._wakeup.set()
+        # FileHandler.close() only flushes a stream it has opened, and with
+        # delay=True the buffer may be all there is.
+        self.flush()
+        super().close()
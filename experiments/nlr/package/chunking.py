@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \chunking.py                                                                                                  #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 3:57:51 am                                                                         #
+# Modified : Monday, October 19th 2026, 1:34:05 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""A process pool that ships tiny tasks to its workers in chunks."""
+import asyncio
+import functools
+import math
+import multiprocessing.pool
+import multiprocessing.util
+import os
+import threading
+import time
+
+from .outofband import OutOfBandPool
+# ------------------------------------------------------------------------------------------------------------------------ #
+# In a worker, the shared table of (pid, chunk running + 1) pairs and the index of its own pair, if it got one.
+_slots = None
+_slot = None
+
+
+def _start_worker(slots, initializer, initargs):
+    global _slots, _slot
+    _slots, _slot = slots, None
+    with slots.get_lock():
+        for index in range(0, len(slots), 2):
+            if not slots[index]:
+                slots[index], slots[index + 1] = os.getpid(), 0
+                _slot = index
+                multiprocessing.util.Finalize(None, _mark, (None,), exitpriority=0)
+                break
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _mark(job):
+    # Records which chunk this worker is running, 0 for none, or with None gives up its pair as it exits.
+    if _slot is not None:
+        with _slots.get_lock():
+            if job is None:
+                _slots[_slot] = 0
+            _slots[_slot + 1] = 0 if job is None else job
+
+
+def _run_chunk(tasks, job):
+    # Each task fails on its own, as it would have in a pool worker, remote traceback included.
+    start = time.perf_counter()
+    outcomes = []
+    _mark(job)
+    try:
+        for func, args, kwds in tasks:
+            try:
+                outcomes.append((True, func(*args, **kwds)))
+            except Exception as e:
+                outcomes.append((False, multiprocessing.pool.ExceptionWithTraceback(e, e.__traceback__)))
+    finally:
+        _mark(0)
+    return outcomes, time.perf_counter() - start
+
+
+def _key(func):
+    # Partials made afresh for every call, as the scheduler's are, still share what was learned.
+    if isinstance(func, functools.partial):
+        key = (func.func, func.args)
+        try:
+            hash(key)
+        except TypeError:
+            return func
+        return key
+    return func
+
+
+class ChunkingPool(OutOfBandPool):
+    """
+    A Pool whose apply_async() sends tasks to the workers in chunks, one
+    message each way per chunk, when the work each does is small beside
+    the cost of getting it there and back.
+
+    A task goes at once while a worker is free. Otherwise tasks for the
+    same function wait until there are enough for a chunk, or a worker
+    frees up. How many are enough is learned per function: the time a
+    task takes in the worker, and the round trip a chunk takes beyond its
+    work, are tracked as exponentially weighted means, and a chunk holds
+    as many tasks as it takes for that overhead to come to no more than
+    overhead_share of the work, up to max_chunk. Functions that have not
+    run yet go one task at a time.
+
+    Each task still gets its own AsyncResult, with its own callbacks, and
+    an exception raised by one task is raised by its get() alone. A chunk
+    that cannot be sent, because the arguments of one task do not pickle,
+    is sent again one task at a time so that only the culprit fails. A
+    chunk whose results cannot be returned has already run, so rather than
+    run its tasks a second time, every task in it fails with the
+    MaybeEncodingError.
+
+    Chunks travel through the pool's OutOfBandQueues like any task, so large
+    buffers in them are not copied into the pickle.
+
+    cancel() stops a task running alone in its chunk, as every task does
+    while no more are in flight than the pool has processes, by terminating
+    the worker running it. The pool starts another in its place. Workers
+    record the chunk they are running in a table shared through the pool's
+    initializer, so that a worker is only terminated while it runs the task.
+    """
+
+    def __init__(self, processes=None, initializer=None, initargs=(), maxtasksperchild=None,
+                 context=None, max_chunk=256, overhead_share=0.1, alpha=0.3):
+        self.max_chunk = max_chunk
+        self.overhead_share = overhead_share
+        self.alpha = alpha
+        self._chunking = threading.Lock()
+        self._waiting = {}
+        self._in_flight = 0
+        # Per function key: [seconds of work per task, seconds of overhead per chunk].
+        self._costs = {}
+        # Tasks sent in a chunk of their own, to its AsyncResult, and the workers' table of what they are running,
+        # with room for workers that replace those terminated before their pairs are given up.
+        self._alone = {}
+        if initializer is not None and not callable(initializer):
+            raise TypeError('initializer must be a callable')
+        ctx = context or multiprocessing.get_context()
+        self._slots = ctx.Array('q', 4 * (processes or os.cpu_count() or 1))
+        super().__init__(processes, _start_worker, (self._slots, initializer, initargs), maxtasksperchild, context)
+
+    def chunksize(self, func):
+        """How many tasks for func go to a worker in one chunk."""
+        cost = self._costs.get(_key(func))
+        if cost is None or cost[1] is None:
+            return 1
+        work, overhead = cost
+        if work <= 0:
+            return self.max_chunk
+        return max(1, min(self.max_chunk, math.ceil(overhead / (self.overhead_share * work))))
+
+    def apply_async(self, func, args=(), kwds={}, callback=None, error_callback=None):
+        self._check_running()
+        result = multiprocessing.pool.ApplyResult(self, callback, error_callback)
+        key = _key(func)
+        with self._chunking:
+            waiting = self._waiting.setdefault(key, [])
+            waiting.append((result, (func, args, kwds)))
+            if self._in_flight < self._processes or len(waiting) >= self.chunksize(func):
+                self._send(self._waiting.pop(key), key)
+        return result
+
+    def _send(self, chunk, key):
+        # Called with _chunking held.
+        results, tasks = zip(*chunk)
+        idle = self._in_flight < self._processes
+        self._in_flight += 1
+        sent = time.perf_counter()
+        # What Pool.apply_async() does, less its check that the pool is running: a chunk that failed
+        # may have to go again after close(), and close() itself sends what is still waiting.
+        result = multiprocessing.pool.ApplyResult(
+            self, functools.partial(self._returned, key, results, sent, idle),
+            functools.partial(self._failed, key, chunk))
+        if len(results) == 1:
+            self._alone[results[0]] = result
+        self._taskqueue.put(([(result._job, 0, _run_chunk, (list(tasks), result._job + 1), {})], None))
+
+    def _returned(self, key, results, sent, idle, value):
+        # Runs in the pool's result handler thread.
+        round_trip = time.perf_counter() - sent
+        outcomes, seconds = value
+        for result, outcome in zip(results, outcomes):
+            result._set(0, outcome)
+        with self._chunking:
+            self._alone.pop(results[0], None)
+            self._in_flight -= 1
+            self._learn(key, len(results), seconds, round_trip - seconds if idle else None)
+            self._send_waiting()
+
+    def _failed(self, key, chunk, error):
+        with self._chunking:
+            self._alone.pop(chunk[0][0], None)
+            self._in_flight -= 1
+            # A chunk whose results did not pickle has run; only one that could not be sent is safe to send again.
+            if len(chunk) > 1 and not isinstance(error, multiprocessing.pool.MaybeEncodingError):
+                for task in chunk:
+                    self._send([task], key)
+                return
+        for result, _ in chunk:
+            result._set(0, (False, error))
+        with self._chunking:
+            self._send_waiting()
+
+    def _learn(self, key, tasks, seconds, overhead):
+        # Overhead is only measured on chunks sent to a free worker, so time spent queued behind others is not counted.
+        cost = self._costs.get(key)
+        if cost is None:
+            self._costs[key] = [seconds / tasks, overhead]
+            return
+        cost[0] += self.alpha * (seconds / tasks - cost[0])
+        if overhead is not None:
+            cost[1] = overhead if cost[1] is None else cost[1] + self.alpha * (overhead - cost[1])
+
+    def _send_waiting(self):
+        # Called with _chunking held, whenever a worker may have come free.
+        for key in list(self._waiting):
+            if self._in_flight >= self._processes:
+                return
+            self._send(self._waiting.pop(key), key)
+
+    def cancel(self, result):
+        """
+        Terminates the worker running the task with this AsyncResult, which
+        then fails with asyncio.CancelledError, returning True if it did. A
+        task that shares its chunk, or is not running, is left alone.
+        """
+        with self._chunking:
+            chunk = self._alone.get(result)
+        if chunk is None:
+            return False
+        with self._slots.get_lock():
+            # Held until the worker is gone, so it cannot finish the task and take another meanwhile.
+            pairs = self._slots[:]
+            for index in range(0, len(pairs), 2):
+                if pairs[index] and pairs[index + 1] == chunk._job + 1:
+                    break
+            else:
+                return False
+            worker = next((process for process in list(self._pool) if process.pid == pairs[index]), None)
+            if worker is None:
+                return False
+            worker.kill()
+            worker.join()
+            self._slots[index] = self._slots[index + 1] = 0
+        chunk._set(0, (False, asyncio.CancelledError()))
+        return True
+
+    def close(self):
+        with self._chunking:
+            for key in list(self._waiting):
+                self._send(self._waiting.pop(key), key)
+        super().close()
+
+    def terminate(self):
+        with self._chunking:
+            self._waiting.clear()
+        super().terminate()
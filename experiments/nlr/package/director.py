@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Sunday, November 7th 2021, 1:59:08 am                                                                         #
-# Modified : Sunday, November 7th 2021, 12:31:32 pm                                                                        #
+# Modified : Monday, October 19th 2026, 1:17:40 pm                                                                         #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -21,22 +21,55 @@
 from datetime import datetime
 import logging
 import multiprocessing as mp
+from .executors import ASYNCIO, INLINE, PROCESS, THREAD, AsyncioExecutor, InlineExecutor, ProcessExecutor, \
+    ThreadExecutor
 from .project import Project
+from .scheduler import Scheduler
 # ------------------------------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 
 
 class Director:
+    """
+    Hands out Projects and owns the worker pool that runs their jobs. The
+    pool starts on first use and serves every Project until close(), so
+    workers are spawned, import their modules and configure logging once
+    per run rather than once per Project. It is a chunking.ChunkingPool, so
+    that tiny jobs reach the workers in chunks. Use the Director as a
+    context manager to have the pool closed at the end.
 
-    def __init__(self):
+    The pool is the process executor, the default one. A Project or a Job
+    whose executor attribute names another, 'thread', 'asyncio' or
+    'inline', has its jobs run there instead, started on first use like the
+    pool and alongside it, so a mixed workload runs on every backend it
+    needs at once. A Job's executor overrides its Project's. The thread
+    executor has threads workers, by default one per CPU, and none of the
+    executors but the pool run the initializer.
+    """
+
+    def __init__(self, n_projects=1, n_jobs=5, processes=None, initializer=None, initargs=(),
+                 ctx=None, threads=None, executor=PROCESS):
         self.name = self.__class__.__name__
+        self.n_projects = n_projects
+        self.n_jobs = n_jobs
+        self.processes = processes
+        self.initializer = initializer
+        self.initargs = initargs
+        self.ctx = ctx or mp.get_context()
+        self.threads = threads
+        self.executor = executor
         self._projects = []
+        self._executors = {}
+        self._last = None
+        # Jobs earlier runs gave up on, (executor, AsyncResult), in case they are still running at close().
+        self._abandoned = []
 
     def _get_projects(self):
         logger.info("Inside {}".format(self.__class__.__name__))
-        project = Project(5)
-        project.load_jobs()
-        self._projects.append(project)
+        for _ in range(self.n_projects):
+            project = Project(self.n_jobs)
+            project.load_jobs()
+            self._projects.append(project)
 
     def get_projects(self):
         if not self._projects:
@@ -49,3 +82,113 @@ class Director:
     def print_projects(self):
         for project in self._projects:
             print(project.results)
+
+    def run(self, func, max_active=None, stream=False, cost=None, timeout=None, speculate=None):
+        """
+        Runs the jobs of all Projects at once on the pool, applying func to
+        each, and has every Project compile its results as it completes, or
+        with stream, take each result through add_result() as it arrives.
+        max_active caps the jobs in flight per Project, for those that set
+        no cap of their own. Given a cost, such as a scheduler.CostModel,
+        the longest jobs go first. Given a timeout, in seconds, a job that
+        takes longer has a multiprocessing.TimeoutError as its result, and
+        given speculate, a percentile such as 0.9, a job running longer
+        than that share of its Project's returned jobs is started again and
+        the first copy back wins; see scheduler.Scheduler.
+        """
+        scheduler = self._scheduler(func, max_active, cost, timeout, speculate)
+        self.set_projects(scheduler.run(stream))
+        return self._projects
+
+    def as_completed(self, func, max_active=None, cost=None, timeout=None, speculate=None):
+        """Runs the jobs of all Projects as run() does, yielding (project, result) as each job returns."""
+        scheduler = self._scheduler(func, max_active, cost, timeout, speculate)
+        for project, _, result in scheduler.as_completed():
+            yield project, result
+
+    def report(self):
+        """The makespan report of the last run; see scheduler.Scheduler.report()."""
+        return self._last.report() if self._last else None
+
+    def _scheduler(self, func, max_active, cost, timeout, speculate):
+        if self._last is not None:
+            self._abandoned.extend(self._last.abandoned())
+        self._last = Scheduler(self._started_pool, func, max_active, cost, self.processes, route=self._route,
+                               timeout=timeout, speculate=speculate)
+        for project in self.get_projects():
+            self._last.submit(project)
+        return self._last
+
+    def _route(self, project, job):
+        name = getattr(job, 'executor', None) or getattr(project, 'executor', None) or self.executor
+        return self.get_executor(name)
+
+    def _started_pool(self):
+        # The Scheduler only needs the pool to tell its jobs from the others', so it is not started for it.
+        return self._executors.get(PROCESS)
+
+    @property
+    def pool(self):
+        """The worker pool shared by all Projects, started on first use."""
+        return self.get_executor(PROCESS)
+
+    def get_executor(self, name):
+        """The named executor, 'process', 'thread', 'asyncio' or 'inline', started on first use."""
+        if name not in self._executors:
+            if name == PROCESS:
+                executor = ProcessExecutor(self.processes, self.initializer, self.initargs, context=self.ctx)
+            elif name == THREAD:
+                executor = ThreadExecutor(self.threads)
+            elif name == ASYNCIO:
+                executor = AsyncioExecutor()
+            elif name == INLINE:
+                executor = InlineExecutor()
+            else:
+                raise ValueError('Unknown executor {!r}'.format(name))
+            self._executors[name] = executor
+        return self._executors[name]
+
+    def _stuck(self):
+        if self._last is not None:
+            self._abandoned.extend(self._last.abandoned())
+        stuck = {id(executor) for executor, result in self._abandoned if not result.ready()}
+        self._abandoned = []
+        return stuck
+
+    def close(self):
+        """
+        Lets every executor finish the jobs it has been given, then stops
+        it. An executor still running a job that was given up on, past its
+        deadline or beaten by a copy, is terminated instead: the job may
+        be hung, and its result is not wanted. Threads cannot be stopped,
+        so a terminated ThreadExecutor is not joined: its daemon threads
+        are left to the jobs they are running.
+        """
+        stuck = self._stuck()
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            if id(executor) in stuck:
+                executor.terminate()
+            else:
+                executor.close()
+        for executor in executors.values():
+            if id(executor) not in stuck or not isinstance(executor, ThreadExecutor):
+                executor.join()
+
+    def terminate(self):
+        """Stops every executor at once, abandoning outstanding jobs, and joins all but the ThreadExecutor."""
+        self._abandoned = []
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.terminate()
+            if not isinstance(executor, ThreadExecutor):
+                executor.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \dispatch.py                                                                                                  #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 9:58:14 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 9:58:14 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Precompiled routing of received records to the listener's handlers."""
+import logging
+import multiprocessing as mp
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Kept in the root logger's isEnabledFor() cache, which Logger.setLevel(),
+# logging.disable() and dictConfig() clear whenever the configuration changes.
+_COMPILED = object()
+
+
+class DispatchTable:
+    """
+    Does for a received record what logging.getLogger(record.name).handle()
+    does, without the per-record cost. The first record for a logger name
+    compiles its effective handlers, found by walking up the hierarchy as
+    Logger.callHandlers() does, into a flat tuple; later records are a dict
+    lookup and a loop over that tuple. Handler levels are still checked per
+    record, so they can change freely.
+
+    The listener's '<listener> (for <worker>)' process names are cached
+    too, one per worker.
+
+    The table rebuilds itself after a logger level changes or dictConfig()
+    runs. Call invalidate() after editing handlers or propagate directly.
+    """
+
+    def __init__(self, rewrite_process_name=True):
+        self.rewrite_process_name = rewrite_process_name
+        self._entries = {}
+        self._process_names = {}
+        self._root_cache = {}
+
+    def invalidate(self):
+        self._entries = {}
+        self._process_names = {}
+        self._root_cache = {}
+
+    def _compile(self, name):
+        if _COMPILED not in self._root_cache:
+            self.invalidate()
+            self._root_cache = logging.getLogger()._cache
+            self._root_cache[_COMPILED] = True
+        logger = logging.getLogger() if name == 'root' else logging.getLogger(name)
+        handlers = []
+        current = logger
+        while current:
+            handlers.extend(current.handlers)
+            current = current.parent if current.propagate else None
+        if not handlers and logging.lastResort:
+            handlers.append(logging.lastResort)
+        self._entries[name] = entry = (logger, tuple(handlers))
+        return entry
+
+    def process_name(self, name):
+        rewritten = self._process_names.get(name)
+        if rewritten is None:
+            rewritten = self._process_names[name] = '%s (for %s)' % (mp.current_process().name, name)
+        return rewritten
+
+    def handle(self, record, check_level=False):
+        """
+        Dispatches record to its logger's handlers. check_level drops records
+        below the logger's effective level first, as a listener that filters
+        rather than trusting its workers would.
+        """
+        entry = self._entries.get(record.name) if _COMPILED in self._root_cache else None
+        if entry is None:
+            entry = self._compile(record.name)
+        logger, handlers = entry
+        if check_level and not logger.isEnabledFor(record.levelno):
+            return
+        if self.rewrite_process_name:
+            record.processName = self.process_name(record.processName)
+        if logger.disabled or (logger.filters and not logger.filter(record)):
+            return
+        levelno = record.levelno
+        for handler in handlers:
+            if levelno >= handler.level:
+                handler.handle(record)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \executors.py                                                                                                 #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 5:35:44 am                                                                         #
+# Modified : Monday, October 19th 2026, 1:34:05 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Backends that run jobs: worker processes, worker threads, an event loop or the calling thread."""
+import asyncio
+import functools
+import inspect
+import multiprocessing
+import multiprocessing.pool
+import threading
+
+from .chunking import ChunkingPool
+# ------------------------------------------------------------------------------------------------------------------------ #
+PROCESS = 'process'
+THREAD = 'thread'
+ASYNCIO = 'asyncio'
+INLINE = 'inline'
+
+
+class Executor:
+    """
+    Where jobs run. Every backend takes them through apply_async() as a
+    multiprocessing Pool does: func(*args, **kwds) is run, callback is
+    called with its result or error_callback with the exception it raised,
+    and an AsyncResult is returned. Stop a backend with close() then
+    join(), to let it finish what it has been given, or terminate().
+    cancel() stops a job early where the backend can: AsyncioExecutor
+    cancels its task and ProcessExecutor terminates the worker running it,
+    but a worker thread runs a job to the end.
+    """
+
+    def apply_async(self, func, args=(), kwds={}, callback=None, error_callback=None):
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+    def join(self):
+        raise NotImplementedError
+
+    def terminate(self):
+        raise NotImplementedError
+
+    def cancel(self, result):
+        """Cancels the job with this AsyncResult, returning True if it will now never run to the end."""
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.terminate()
+
+
+class ProcessExecutor(ChunkingPool, Executor):
+    """
+    Worker processes, for jobs that keep a CPU busy in Python. It is a
+    ChunkingPool, which cancels a job by terminating its worker.
+    """
+
+
+class ThreadExecutor(multiprocessing.pool.ThreadPool, Executor):
+    """
+    Worker threads in this process, for jobs that spend their time waiting
+    on I/O or in code that releases the GIL. Jobs are not pickled, and log
+    through this process's own logging configuration.
+    """
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class AsyncResult:
+    """The result of a job given to a backend that is not a Pool, with the same get(), wait() and ready()."""
+
+    def __init__(self, callback=None, error_callback=None):
+        self._callback = callback
+        self._error_callback = error_callback
+        self._event = threading.Event()
+        self._success = None
+        self._value = None
+        self._future = None
+
+    def ready(self):
+        return self._event.is_set()
+
+    def successful(self):
+        if not self.ready():
+            raise ValueError('{0!r} not ready'.format(self))
+        return self._success
+
+    def wait(self, timeout=None):
+        self._event.wait(timeout)
+
+    def get(self, timeout=None):
+        self.wait(timeout)
+        if not self.ready():
+            raise multiprocessing.TimeoutError
+        if self._success:
+            return self._value
+        raise self._value
+
+    def _set(self, success, value):
+        # As in a Pool, the callbacks run before get() returns.
+        self._success, self._value = success, value
+        if success and self._callback:
+            self._callback(value)
+        if not success and self._error_callback:
+            self._error_callback(value)
+        self._event.set()
+
+
+class AsyncioExecutor(Executor):
+    """
+    An event loop in a thread of its own, for jobs that are coroutine
+    functions: any number of them can wait on I/O at once without a thread
+    each. Whatever func returns is awaited if it is awaitable, so a plain
+    function runs on the loop too, and must not block it.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='AsyncioExecutor',
+                                        daemon=True)
+        self._thread.start()
+        self._pending = set()
+        self._idle = threading.Condition()
+        self._running = True
+
+    def apply_async(self, func, args=(), kwds={}, callback=None, error_callback=None):
+        if not self._running:
+            raise ValueError('Executor not running')
+        result = AsyncResult(callback, error_callback)
+        future = asyncio.run_coroutine_threadsafe(self._run(func, args, kwds), self._loop)
+        result._future = future
+        with self._idle:
+            self._pending.add(future)
+        future.add_done_callback(functools.partial(self._done, result))
+        return result
+
+    @staticmethod
+    async def _run(func, args, kwds):
+        value = func(*args, **kwds)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    def _done(self, result, future):
+        if future.cancelled():
+            result._set(False, asyncio.CancelledError())
+        elif future.exception() is not None:
+            result._set(False, future.exception())
+        else:
+            result._set(True, future.result())
+        with self._idle:
+            self._pending.discard(future)
+            self._idle.notify_all()
+
+    def cancel(self, result):
+        # The job's task is cancelled at its next await, and error_callback gets a CancelledError.
+        return result._future.cancel() or result._future.cancelled()
+
+    def close(self):
+        self._running = False
+
+    def join(self):
+        if self._running:
+            raise ValueError('Executor is still running')
+        with self._idle:
+            while self._pending:
+                self._idle.wait()
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def terminate(self):
+        self._running = False
+        with self._idle:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        self.join()
+
+
+class InlineExecutor(Executor):
+    """
+    Runs each job at once, in the thread that submits it, with its
+    callbacks. Nothing is pickled and nothing runs concurrently, so a
+    debugger or a traceback goes straight into the job: use it to debug.
+    """
+
+    def __init__(self):
+        self._running = True
+
+    def apply_async(self, func, args=(), kwds={}, callback=None, error_callback=None):
+        if not self._running:
+            raise ValueError('Executor not running')
+        result = AsyncResult(callback, error_callback)
+        try:
+            value = func(*args, **kwds)
+        except Exception as e:
+            result._set(False, e)
+        else:
+            result._set(True, value)
+        return result
+
+    def close(self):
+        self._running = False
+
+    def join(self):
+        if self._running:
+            raise ValueError('Executor is still running')
+
+    def terminate(self):
+        self._running = False
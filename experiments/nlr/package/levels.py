@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \levels.py                                                                                                    #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 1:34:10 pm                                                                         #
+# Modified : Monday, October 19th 2026, 9:24:40 am                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Compiles the listener's logging configuration into minimum levels that workers apply locally."""
+import json
+import logging
+import multiprocessing as mp
+import os
+import threading
+# ------------------------------------------------------------------------------------------------------------------------ #
+ROOT = 'root'
+
+
+def _level(value, default=logging.NOTSET):
+    return default if value is None else logging._checkLevel(value)
+
+
+def compile_levels(config):
+    """
+    Returns {logger name: minimum level} for a dictConfig style listener configuration.
+
+    A record is only written by the listener if it passes the level of the
+    logger it was logged on and the level of at least one handler reachable
+    from that logger through propagation. The minimum level for a logger is
+    therefore the greater of its effective level and the lowest level among
+    those handlers. Loggers that reach no handler fall through to
+    logging.lastResort, which only emits WARNING and above. Handler filters
+    are not compiled, since they can only drop more.
+    """
+    handler_levels = {name: _level(handler.get('level'))
+                      for name, handler in config.get('handlers', {}).items()}
+    loggers = dict(config.get('loggers', {}))
+    root = config.get('root', {})
+    loggers[ROOT] = dict(root, level=root.get('level', logging.WARNING), propagate=False)
+
+    def parent(name):
+        while name != ROOT:
+            name = name.rpartition('.')[0] or ROOT
+            if name in loggers:
+                return name
+        return None
+
+    def effective_level(name):
+        while name is not None:
+            level = _level(loggers[name].get('level'))
+            if level:
+                return level
+            name = parent(name)
+        return logging.WARNING
+
+    levels = {}
+    for name in loggers:
+        reachable = []
+        node = name
+        while node is not None:
+            reachable.extend(handler_levels[h] for h in loggers[node].get('handlers', []))
+            node = parent(node) if loggers[node].get('propagate', True) else None
+        floor = min(reachable) if reachable else logging.lastResort.level
+        levels[name] = max(effective_level(name), floor)
+    return levels
+
+
+def _logger(name):
+    return logging.getLogger() if name == ROOT else logging.getLogger(name)
+
+
+def apply_levels(levels, prior=None):
+    """
+    Sets the compiled levels on this process's loggers. Given prior, a dict
+    kept from one call to the next, the level each logger had before a
+    table first set it is recorded there, and loggers that a later table no
+    longer lists are given it back, so a reload can undo an override.
+    """
+    if prior is not None:
+        for name in set(prior) - set(levels):
+            _logger(name).setLevel(prior.pop(name))
+    for name, level in levels.items():
+        logger = _logger(name)
+        if prior is not None and name not in prior:
+            prior[name] = logger.level
+        logger.setLevel(level)
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class LevelTable:
+    """
+    Compiled listener levels held in shared memory, for pool workers.
+
+    The table is created in the parent from the listener configuration and
+    passed to workers in the pool initializer, which calls apply() so that
+    logger.isEnabledFor() rejects records no listener handler would emit
+    before they are built or pickled. watch() starts a thread that re-applies
+    the table whenever publish() is called with a reloaded configuration, so
+    running workers pick up the new levels without a pool restart.
+    """
+
+    def __init__(self, config, size=8192, ctx=None):
+        ctx = ctx or mp.get_context()
+        self._data = ctx.Array('c', size)
+        self._version = ctx.Value('L', 0, lock=False)
+        self._applied = None
+        self._prior = {}
+        self._watcher = None
+        self.publish(config)
+
+    def __getstate__(self):
+        return self._data, self._version
+
+    def __setstate__(self, state):
+        self._data, self._version = state
+        self._applied = None
+        self._prior = {}
+        self._watcher = None
+
+    def publish(self, config):
+        """Compiles a (re)loaded listener configuration and publishes it to the workers."""
+        data = json.dumps(compile_levels(config)).encode()
+        with self._data.get_lock():
+            self._data.value = data
+            self._version.value += 1
+
+    def snapshot(self):
+        with self._data.get_lock():
+            return self._version.value, json.loads(self._data.value)
+
+    def apply(self):
+        """Applies the current table to this process's loggers, restoring those it no longer lists."""
+        version, levels = self.snapshot()
+        apply_levels(levels, self._prior)
+        self._applied = version
+
+    def watch(self, interval=1.0):
+        """Re-applies the table in this process whenever a new version is published."""
+        if self._watcher is not None and self._watcher[0] == os.getpid():
+            return
+        thread = threading.Thread(target=self._run_watch, args=(interval,),
+                                  name='LevelTable', daemon=True)
+        self._watcher = (os.getpid(), thread)
+        thread.start()
+
+    def _run_watch(self, interval):
+        wakeup = threading.Event()
+        while not wakeup.wait(interval):
+            # An unlocked read is enough to notice a change; apply() takes the lock.
+            if self._version.value != self._applied:
+                self.apply()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \metrics.py                                                                                                   #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 11:37:05 pm                                                                        #
+# Modified : Monday, October 19th 2026, 1:58:24 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Rolling throughput, queue depth and lag metrics kept by a listener."""
+import bisect
+import collections
+import logging
+import multiprocessing as mp
+import operator
+import os
+import threading
+import time
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Upper bounds, in seconds, of the lag histogram's buckets. A last, open-ended bucket catches anything slower.
+LAG_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+_key = operator.attrgetter('name', 'levelno')
+
+
+class ListenerMetrics:
+    """
+    Counts of the records a listener dispatches, per logger and level, and a
+    histogram of each record's lag from its creation in the worker to the
+    end of the dispatch of its batch. Create it in the parent with the
+    listener's queue, call start() in the listener and observe() with each
+    batch of records it has dispatched.
+
+    snapshot() may then be called from any thread of the listener or, through
+    a pipe answered by a thread start() runs, from any other process it was
+    shared with. Either way the dispatching thread only pays for a clock read
+    per batch, a bisect per record and a Counter update that loops over the
+    records in C; rates and percentiles are worked out by whoever takes the
+    snapshot.
+    """
+
+    def __init__(self, queue=None, buckets=LAG_BUCKETS, ctx=None):
+        ctx = ctx or mp.get_context()
+        self.queue = queue
+        self.buckets = tuple(buckets)
+        self._client, self._server = ctx.Pipe()
+        self._request_lock = ctx.Lock()
+        self._pid = None
+        self._reset()
+
+    def _reset(self):
+        self.started = time.time()
+        self.counts = collections.Counter()
+        self.lags = [0] * (len(self.buckets) + 1)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['counts'], state['lags']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset()
+
+    def start(self, interval=None, logger=None):
+        """
+        Called in the listener: starts answering snapshot() requests from other
+        processes and, given an interval, logs a stats record every interval
+        seconds that saw records or a backlog to logger, by default
+        'logging.metrics'. Each carries the snapshot for its interval as its
+        metrics attribute.
+        """
+        self._pid = os.getpid()
+        self._reset()
+        threading.Thread(target=self._serve, name='ListenerMetrics', daemon=True).start()
+        if interval:
+            logger = logger or logging.getLogger('logging.metrics')
+            threading.Thread(target=self._report, args=(interval, logger),
+                             name='ListenerMetricsReport', daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                self._server.recv()
+            except EOFError:
+                return
+            self._server.send(self._raw())
+
+    def observe(self, records):
+        """Called by the listener with records it has just dispatched."""
+        if records:
+            self.counts.update(map(_key, records))
+            now, buckets, lags = time.time(), self.buckets, self.lags
+            for record in records:
+                lags[bisect.bisect_left(buckets, now - record.created)] += 1
+
+    def depth(self):
+        """Items waiting on the queue, or None if it cannot say."""
+        try:
+            return self.queue.qsize()
+        except (AttributeError, NotImplementedError):
+            return None
+
+    def _raw(self):
+        # Copying a dict or list is atomic under the GIL, so the dispatching thread need not be stopped.
+        return {'time': time.time(), 'started': self.started, 'counts': dict(self.counts),
+                'lags': list(self.lags), 'queue_depth': self.depth()}
+
+    def snapshot(self, since=None, timeout=5.0):
+        """
+        The metrics now. Rates and lag percentiles cover the time since the
+        snapshot given as since, or since the listener started.
+        """
+        if self._pid == os.getpid():
+            raw = self._raw()
+        else:
+            with self._request_lock:
+                self._client.send(None)
+                if not self._client.poll(timeout):
+                    raise TimeoutError('The listener did not answer within %.1fs' % timeout)
+                raw = self._client.recv()
+        counts, lags = raw['counts'], raw['lags']
+        start = raw['started']
+        if since is not None and since['started'] == raw['started']:
+            start = since['time']
+            previous = since['counts']
+            counts = {key: count - previous.get(key, 0) for key, count in counts.items()}
+            lags = [count - previous for count, previous in zip(lags, since['lags'])]
+        elapsed = max(raw['time'] - start, 1e-9)
+        rates = {}
+        for (name, levelno), count in counts.items():
+            if count:
+                rates.setdefault(name, {})[logging.getLevelName(levelno)] = count / elapsed
+        return dict(raw, interval=elapsed, records=sum(counts.values()),
+                    records_per_sec=sum(counts.values()) / elapsed, rates=rates,
+                    lag_p50=self._percentile(lags, 0.5), lag_p99=self._percentile(lags, 0.99))
+
+    def _percentile(self, lags, p):
+        # The upper bound of the bucket holding the pth record, so at most an overestimate.
+        target = p * sum(lags)
+        if not target:
+            return None
+        seen = 0
+        for bound, count in zip(self.buckets + (float('inf'),), lags):
+            seen += count
+            if seen >= target:
+                return bound
+
+    def _report(self, interval, logger):
+        last = None
+        while not threading.Event().wait(interval):
+            last = self.snapshot(since=last)
+            if not last['records'] and not last['queue_depth']:
+                continue
+            logger.info('Listener: %.0f records/sec, queue depth %s, lag p50 <= %ss, p99 <= %ss',
+                        last['records_per_sec'], last['queue_depth'], last['lag_p50'], last['lag_p99'],
+                        extra={'metrics': last})
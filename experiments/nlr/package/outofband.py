@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \outofband.py                                                                                                 #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 5:03:09 am                                                                         #
+# Modified : Monday, October 19th 2026, 11:48:05 am                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""A Pool transport that pickles with protocol 5 and sends large buffers out of band."""
+import io
+import multiprocessing.connection
+import multiprocessing.pool
+import multiprocessing.queues
+import os
+import pickle
+import struct
+
+from multiprocessing.reduction import ForkingPickler
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Buffers at least this large travel out of band; smaller ones are cheaper inside the pickle.
+THRESHOLD = 64 * 1024
+
+_COUNT = struct.Struct('!I')
+_SIZE = struct.Struct('!i')
+_LARGE_SIZE = struct.Struct('!Q')
+_CONTAINERS = (tuple, list, dict)
+_MAX_SEARCH = 256
+
+
+class _Bytes:
+    """Stands in for a large bytes object, which picklers never hand to reducer_override()."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        return bytes, (pickle.PickleBuffer(self.data),)
+
+
+def _wrap(obj, depth=4):
+    # Large bytes in a task's arguments or a result, or in small tuples, lists and dicts holding
+    # them, go out of band too. Bytes deeper down or in long containers, which it would cost more
+    # to search than to pickle, go as they would.
+    kind = type(obj)
+    if kind is bytes:
+        return _Bytes(obj) if len(obj) >= THRESHOLD else obj
+    if not depth or kind not in _CONTAINERS or len(obj) > _MAX_SEARCH:
+        return obj
+    if kind is tuple:
+        return tuple(_wrap(item, depth - 1) for item in obj)
+    if kind is list:
+        return [_wrap(item, depth - 1) for item in obj]
+    return {key: _wrap(item, depth - 1) for key, item in obj.items()}
+
+
+def dumps(obj):
+    """
+    Pickles obj with protocol 5, returning the pickle, led by the lengths of
+    the buffers kept out of it, and those buffers, as memoryviews of the
+    objects' own memory.
+    """
+    buffers = []
+
+    def out_of_band(buffer):
+        view = buffer.raw()
+        if view.nbytes < THRESHOLD:
+            return True
+        buffers.append(view)
+        return False
+
+    stream = io.BytesIO()
+    stream.write(_COUNT.pack(0))
+    ForkingPickler(stream, 5, True, out_of_band).dump(_wrap(obj))
+    if buffers:
+        lengths = struct.pack('!I%dQ' % len(buffers), len(buffers), *(view.nbytes for view in buffers))
+        return lengths + stream.getbuffer()[_COUNT.size:], buffers
+    return stream.getbuffer(), buffers
+
+
+def loads(header, buffers):
+    return pickle.loads(header, buffers=buffers)
+
+
+def _split(message):
+    count, = _COUNT.unpack_from(message)
+    lengths = struct.unpack_from('!%dQ' % count, message, _COUNT.size)
+    return lengths, memoryview(message)[_COUNT.size + 8 * count:]
+
+
+def _write(connection, view):
+    # Straight from the object's memory to the pipe, with no copy in between.
+    if hasattr(connection, '_send'):
+        connection._send(view)
+    else:
+        connection.send_bytes(view)
+
+
+def _read(connection, length):
+    buffer = bytearray(length)
+    if hasattr(connection, '_send') and hasattr(os, 'readv'):
+        view = memoryview(buffer)
+        while view:
+            read = os.readv(connection.fileno(), [view])
+            if not read:
+                raise EOFError
+            view = view[read:]
+    else:
+        connection.recv_bytes_into(buffer)
+    return buffer
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class OutOfBandQueue(multiprocessing.queues.SimpleQueue):
+    """
+    A SimpleQueue whose messages are a protocol 5 pickle followed by the raw
+    contents of its large buffers: those of bytearrays, contiguous NumPy
+    arrays, PickleBuffers and large bytes. The sender writes them to the
+    pipe straight from the objects' memory and the receiver reads each into
+    a buffer of its own, which arrays and bytearrays then use as they are,
+    so a payload is copied once each side of the pipe rather than through
+    the pickle as well.
+    """
+
+    def __init__(self, *, ctx):
+        super().__init__(ctx=ctx)
+        # A message is several writes, so even where one write is atomic they need the lock.
+        if self._wlock is None:
+            self._wlock = ctx.Lock()
+
+    def _send(self, obj):
+        self._write_message(*dumps(obj))
+
+    def _write_message(self, header, buffers):
+        self._writer.send_bytes(header)
+        for view in buffers:
+            _write(self._writer, view)
+
+    def _recv(self):
+        lengths, header = _split(self._reader.recv_bytes())
+        return loads(header, [_read(self._reader, length) for length in lengths])
+
+    def _skip(self):
+        lengths, _ = _split(self._reader.recv_bytes())
+        for length in lengths:
+            _read(self._reader, length)
+
+    def put(self, obj):
+        # Serialized before taking the lock, and all of one message written while holding it.
+        message = dumps(obj)
+        with self._wlock:
+            self._write_message(*message)
+
+    def get(self):
+        with self._rlock:
+            lengths, header = _split(self._reader.recv_bytes())
+            buffers = [_read(self._reader, length) for length in lengths]
+        return loads(header, buffers)
+
+
+class _ResultQueue(OutOfBandQueue):
+    """
+    The pool's result queue, which never needs the lock the workers share
+    to stop the result handler, since a worker terminated part way through
+    writing a result never releases it. The sentinel, the None that Pool
+    puts to stop the handler, goes down a pipe only the pool's own process
+    holds, and once the pool is terminating a result left unfinished by a
+    worker it killed ends the handler's read with EOFError.
+    """
+
+    def __init__(self, *, ctx):
+        super().__init__(ctx=ctx)
+        self._sentinels, self._stop = ctx.Pipe(duplex=False)
+        # Sentinels received and not yet returned, and the workers of a terminating pool.
+        self._pending = 0
+        self._workers = None
+        self._raw = hasattr(self._reader, '_send') and hasattr(os, 'readv')
+        if self._raw:
+            # Reads that would block wait in _wait() instead, where they can be given up.
+            os.set_blocking(self._reader.fileno(), False)
+
+    def __setstate__(self, state):
+        # Workers only ever put results.
+        super().__setstate__(state)
+        self._sentinels = self._stop = None
+
+    def put(self, obj):
+        if obj is None and self._stop is not None:
+            self._stop.send_bytes(b'')
+        else:
+            super().put(obj)
+
+    def terminate(self, workers):
+        """Gives up on a result part way through once none of workers is alive to finish it."""
+        self._workers = workers
+
+    def _wait(self, between=False):
+        # Waits for the reader to have bytes, returning True, or between messages for a sentinel, returning False.
+        while not (between and self._pending):
+            if not between and self._workers is not None and not any(p.is_alive() for p in self._workers):
+                raise EOFError
+            ready = multiprocessing.connection.wait((self._reader, self._sentinels),
+                                                    None if self._workers is None else 0.1)
+            if self._reader in ready:
+                return True
+            while self._sentinels.poll():
+                self._sentinels.recv_bytes()
+                self._pending += 1
+        return False
+
+    def _take(self, length):
+        buffer = bytearray(length)
+        view = memoryview(buffer)
+        while view:
+            try:
+                read = os.readv(self._reader.fileno(), [view])
+            except BlockingIOError:
+                self._wait()
+                continue
+            if not read:
+                raise EOFError
+            view = view[read:]
+        return buffer
+
+    def _recv(self):
+        # Results already sent are taken before a sentinel, as they would be from the one pipe.
+        if not self._reader.poll() and not self._wait(between=True):
+            self._pending -= 1
+            return None
+        if not self._raw:
+            return super()._recv()
+        # Framed as Connection.send_bytes() frames it.
+        length, = _SIZE.unpack(self._take(_SIZE.size))
+        if length == -1:
+            length, = _LARGE_SIZE.unpack(self._take(_LARGE_SIZE.size))
+        lengths, header = _split(self._take(length))
+        return loads(header, [self._take(length) for length in lengths])
+
+
+class OutOfBandPool(multiprocessing.pool.Pool):
+    """A Pool whose tasks and results travel through OutOfBandQueues."""
+
+    def _setup_queues(self):
+        self._inqueue = OutOfBandQueue(ctx=self._ctx)
+        self._outqueue = _ResultQueue(ctx=self._ctx)
+        # As in Pool, the task and result handler threads are the only ones
+        # writing tasks and reading results in this process, so need no lock.
+        self._quick_put = self._inqueue._send
+        self._quick_get = self._outqueue._recv
+
+    @staticmethod
+    def _help_stuff_finish(inqueue, task_handler, size):
+        # Pool's own drains whole pickles, which out of band buffers are not. It also stops at the first
+        # pause, leaving a task handler part way through a large task blocked on the full pipe for good.
+        inqueue._rlock.acquire()
+        while task_handler.is_alive():
+            if inqueue._reader.poll(0.1):
+                inqueue._skip()
+
+    @classmethod
+    def _terminate_pool(cls, taskqueue, inqueue, outqueue, pool, *args):
+        # Pool puts its sentinel and kills the workers, whatever they are writing, before joining the
+        # result handler.
+        outqueue.terminate(pool)
+        super()._terminate_pool(taskqueue, inqueue, outqueue, pool, *args)
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \overflow.py                                                                                                  #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 7:48:05 pm                                                                         #
+# Modified : Monday, October 19th 2026, 12:14:22 pm                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Overflow policies for batching queue handlers writing to a bounded log transport."""
+import collections
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import pickle
+import queue
+import threading
+
+from .wire import RecordDecoder, definitions_only
+# ------------------------------------------------------------------------------------------------------------------------ #
+BLOCK = 'block'
+DROP = 'drop'
+SAMPLE = 'sample'
+SPILL = 'spill'
+
+# Records below this level are the first to go when the transport is full.
+EXPENDABLE = logging.WARNING
+
+
+class OverflowCounters:
+    """
+    Dropped and spilled record counts shared by every worker writing to one
+    transport. Create it in the parent, pass it to the workers' handlers and
+    call start_reporting() in the listener, and close() when it stops.
+    """
+
+    def __init__(self, ctx=None):
+        ctx = ctx or mp.get_context()
+        self._dropped = ctx.Value('Q', 0)
+        self._spilled = ctx.Value('Q', 0)
+        self._stop = None
+        self._thread = None
+
+    def __getstate__(self):
+        # The reporting thread stays with the listener.
+        return self._dropped, self._spilled
+
+    def __setstate__(self, state):
+        self._dropped, self._spilled = state
+        self._stop = None
+        self._thread = None
+
+    @property
+    def dropped(self):
+        return self._dropped.value
+
+    @property
+    def spilled(self):
+        return self._spilled.value
+
+    def add(self, dropped=0, spilled=0):
+        if dropped:
+            with self._dropped.get_lock():
+                self._dropped.value += dropped
+        if spilled:
+            with self._spilled.get_lock():
+                self._spilled.value += spilled
+
+    def start_reporting(self, interval=10.0, logger=None):
+        """Logs the counters every interval seconds, whenever they have changed."""
+        logger = logger or logging.getLogger('logging.overflow')
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._report, args=(interval, logger, self._stop),
+                                        name='OverflowCounters', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def _report(self, interval, logger, stop):
+        last = (0, 0)
+        while not stop.is_set():
+            stop.wait(interval)
+            current = (self.dropped, self.spilled)
+            if current != last:
+                logger.warning('Log transport overflow: %d records dropped, %d spilled', *current)
+                last = current
+
+    def close(self):
+        """Stops reporting, logging the final counts first if they changed since the last report."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class Overflow:
+    """
+    Base policy. Records leave the handler in order through `pending`, a
+    deque of (item, levelno) pairs. Whatever the transport will not take
+    stays there until the next flush, and overflow() decides what happens
+    once it is full; by default the worker waits for room, as BlockOverflow
+    does. Items with no level carry only string definitions of the compact
+    wire format; they are tiny and never discarded.
+    """
+
+    def __init__(self, handler, max_pending=10000, counters=None, **kwargs):
+        self.handler = handler
+        self.max_pending = max_pending
+        self.counters = counters
+        self.pending = collections.deque()
+        self.dropped = 0
+        self.spilled = 0
+
+    def admit(self, record):
+        """Called before the record is prepared. False discards it."""
+        return True
+
+    def send(self, batch, levels):
+        self.pending.extend(zip(batch, levels))
+        while self.pending:
+            chunk = list(itertools.islice(self.pending, self.handler.capacity))
+            try:
+                self.handler.put(item for item, _ in chunk)
+            except queue.Full:
+                if not self.overflow(chunk):
+                    return
+            else:
+                for _ in chunk:
+                    self.pending.popleft()
+
+    def overflow(self, chunk):
+        """Handles a full transport. Returns True to keep sending, False to wait for the next flush."""
+        return self.put_blocking(chunk)
+
+    def put_blocking(self, chunk):
+        self.handler.put((item for item, _ in chunk), block=True)
+        for _ in chunk:
+            self.pending.popleft()
+        return True
+
+    def discard(self, item):
+        """Returns what must still be sent for a discarded item: its definitions, if it is compact."""
+        if isinstance(item, bytes):
+            return definitions_only(item)
+        return None
+
+    def count(self, dropped=0, spilled=0):
+        self.dropped += dropped
+        self.spilled += spilled
+        if self.counters is not None:
+            self.counters.add(dropped, spilled)
+
+    def close(self, timeout=5.0):
+        """Makes a last, bounded attempt to deliver what is pending when the handler closes."""
+        while self.pending:
+            chunk = list(itertools.islice(self.pending, self.handler.capacity))
+            try:
+                self.handler.put((item for item, _ in chunk), block=True, timeout=timeout)
+            except queue.Full:
+                self.count(dropped=sum(1 for _, level in self.pending if level is not None))
+                self.pending.clear()
+            else:
+                for _ in chunk:
+                    self.pending.popleft()
+
+
+class BlockOverflow(Overflow):
+    """Waits for the listener to make room: lossless, at the cost of stalling the worker."""
+
+
+class DropOverflow(Overflow):
+    """
+    Holds up to max_pending records in the worker while the transport is full.
+    Beyond that it drops the oldest DEBUG and INFO records first, and only
+    blocks once nothing but WARNING and above is left.
+    """
+
+    def overflow(self, chunk):
+        excess = len(self.pending) - self.max_pending
+        if excess <= 0:
+            return False
+        kept = collections.deque()
+        dropped = 0
+        for item, level in self.pending:
+            if dropped < excess and level is not None and level < EXPENDABLE:
+                dropped += 1
+                item = self.discard(item)
+                if item is not None:
+                    kept.append((item, None))
+            else:
+                kept.append((item, level))
+        self.pending = kept
+        self.count(dropped=dropped)
+        if dropped < excess:
+            return self.put_blocking(list(itertools.islice(self.pending, self.handler.capacity)))
+        return False
+
+
+class SampleOverflow(DropOverflow):
+    """
+    While the transport is congested, keeps only one in sample_rate DEBUG and
+    INFO records, discarding the rest before they are even prepared.
+    Otherwise behaves as DropOverflow.
+    """
+
+    def __init__(self, handler, max_pending=10000, counters=None, sample_rate=10, **kwargs):
+        super().__init__(handler, max_pending, counters)
+        self.sample_rate = sample_rate
+        self._seen = 0
+
+    def admit(self, record):
+        if not self.pending or record.levelno >= EXPENDABLE:
+            return True
+        self._seen += 1
+        if self._seen % self.sample_rate:
+            self.count(dropped=1)
+            return False
+        return True
+
+
+class SpillOverflow(Overflow):
+    """
+    Writes whatever the transport will not take to a local spill file,
+    spill-<pid>.log in spill_dir, for replay with read_spill(). Nothing is
+    lost and the worker never waits on the listener.
+    """
+
+    def __init__(self, handler, max_pending=10000, counters=None, spill_dir='.', **kwargs):
+        super().__init__(handler, max_pending, counters)
+        self.spill_dir = spill_dir
+        self._file = None
+        self._pid = None
+        self._strings = 0
+
+    def overflow(self, chunk):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._strings = 0
+            path = os.path.join(self.spill_dir, 'spill-%d.log' % self._pid)
+            self._file = open(path, 'ab')
+        encoder = getattr(self.handler, 'encoder', None)
+        if encoder is not None:
+            # Spilled compact records may refer to strings defined in records
+            # that did reach the listener, so the definitions go in the file too.
+            strings = encoder.strings(self._strings)
+            if strings:
+                pickle.dump(('strings', encoder.sender, strings), self._file)
+                self._strings = max(strings)
+        kept = collections.deque()
+        spilled = []
+        for item, level in self.pending:
+            if level is None:
+                kept.append((item, level))
+                continue
+            spilled.append(item)
+            item = self.discard(item)
+            if item is not None:
+                kept.append((item, None))
+        pickle.dump(('items', spilled), self._file, pickle.HIGHEST_PROTOCOL)
+        self._file.flush()
+        self.pending = kept
+        self.count(spilled=len(spilled))
+        return False
+
+    def close(self, timeout=5.0):
+        super().close(timeout)
+        if self._file is not None:
+            self._file.close()
+
+
+POLICIES = {BLOCK: BlockOverflow, DROP: DropOverflow, SAMPLE: SampleOverflow, SPILL: SpillOverflow}
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def read_spill(path):
+    """Yields the LogRecords in a spill file, in the order they were logged, for replay through the listener."""
+    decoder = RecordDecoder()
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                kind, *entry = pickle.load(f)
+            except EOFError:
+                return
+            if kind == 'strings':
+                decoder.define(*entry)
+                continue
+            for item in entry[0]:
+                if isinstance(item, bytes):
+                    item = decoder.decode(item)
+                if item is not None:
+                    yield item
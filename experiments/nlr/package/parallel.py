@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Sunday, November 7th 2021, 1:52:54 am                                                                         #
-# Modified : Sunday, November 7th 2021, 1:57:20 am                                                                         #
+# Modified : Monday, October 19th 2026, 1:15:02 am                                                                         #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -25,6 +25,10 @@ import logging.config
 import logging.handlers
 import multiprocessing as mp
 
+from .batching import unbatch
+from .bootstrap import configure
+from .dispatch import DispatchTable
+from .sharded import close_shards, shard_handlers
 # ------------------------------------------------------------------------------------------------------------------------ #
 
 
@@ -36,7 +40,7 @@ class Worker:
         self.run()
 
     def run(self):
-        logging.config.dictConfig(self.config)
+        configure(self.config)
         logger = logging.getLogger(self.job.name)
         logger.info(self.job.start)
         result = self.job.run()
@@ -50,36 +54,45 @@ class QueueLogHandler:
     A simple handler for logging events. It runs in the listener process and
     dispatches events to loggers based on the name in the received record,
     which then get dispatched, by the logging system, to the handlers
-    configured for those loggers.
+    configured for those loggers. Given a metrics.ListenerMetrics, it has it
+    observe each batch once dispatched.
     """
 
-    def handle(self, record):
-        if record.name == "root":
-            logger = logging.getLogger()
-        else:
-            logger = logging.getLogger(record.name)
+    def __init__(self, metrics=None):
+        # The process name is transformed just to show that it's the listener
+        # doing the logging to files and console
+        self.dispatch = DispatchTable()
+        self.metrics = metrics
 
-        if logger.isEnabledFor(record.levelno):
-            # The process name is transformed just to show that it's the listener
-            # doing the logging to files and console
-            record.processName = '%s (for %s)' % (
-                current_process().name, record.processName)
-            logger.handle(record)
+    def handle(self, item):
+        records = list(unbatch(item))
+        for record in records:
+            self.dispatch.handle(record, check_level=True)
+        if self.metrics is not None:
+            self.metrics.observe(records)
 # ------------------------------------------------------------------------------------------------------------------------ #
 
 
 class Listener(mp.Process):
 
-    def __init__(self, queue, stop_event, config):
+    def __init__(self, queue, stop_event, config, metrics=None, stats_interval=None):
         self.queue = queue
         self.stop_event = stop_event
         self.config = config
+        # A metrics.ListenerMetrics over queue, and how often to log its stats.
+        self.metrics = metrics
+        self.stats_interval = stats_interval
         self.run()
 
     def run(self):
         logging.config.dictConfig(self.config)
+        # Each configured handler writes from its own thread; the QueueListener
+        # thread only routes records to them.
+        shards = shard_handlers()
+        if self.metrics is not None:
+            self.metrics.start(self.stats_interval)
         listener = logging.handlers.QueueListener(
-            self.queue, QueueLogHandler())
+            self.queue, QueueLogHandler(self.metrics))
         listener.start()
         if os.name == 'posix':
             # On POSIX, the setup logger will have been configured in the
@@ -93,3 +106,4 @@ class Listener(mp.Process):
                 'Should not appear, because of disabled logger ...')
         self.stop_event.wait()
         listener.stop()
+        close_shards(shards)
@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Sunday, November 7th 2021, 2:13:12 am                                                                         #
-# Modified : Sunday, November 7th 2021, 1:10:44 pm                                                                         #
+# Modified : Monday, October 19th 2026, 1:17:40 pm                                                                         #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -33,6 +33,10 @@ class Job:
     loggers = ['blue_log', 'red_log']
     levels = [logging.DEBUG, logging.INFO, logging.WARNING,
               logging.ERROR, logging.CRITICAL]
+    # Executor this job needs, overriding its project's; see executors.
+    executor = None
+    # Seconds this job may take before it is given up on, overriding the Director's.
+    timeout = None
 
     def __init__(self, i):
         self.i = i
@@ -46,23 +50,59 @@ class Job:
             y += i ** 2
             logger = logging.getLogger(choice(Job.loggers))
             level = choice(Job.levels)
-            message = 'I made %s last year' % (
-                "${:,.2f}".format(randint(9999999, 99999999)))
-            logger.log(level, message)
-        logger.info('Worker %s processed job #%d  squaring up to %d for a sum of %d' %
-                    (self.name, self.i, x, y))
+            amount = randint(9999999, 99999999)
+            # Only pay for the currency formatting if the record will be sent.
+            if logger.isEnabledFor(level):
+                logger.log(level, 'I made %s last year', "${:,.2f}".format(amount))
+        logger.info('Worker %s processed job #%d  squaring up to %d for a sum of %d',
+                    self.name, self.i, x, y)
         return {'process': self.name, 'job': self.i, 'x': x, 'y': y}
 
 
 class Project:
-    def __init__(self, n):
+    def __init__(self, n, max_active=None, keep_results=True, executor=None):
         self.name = self.__class__.__name__
         self.n = n
+        # Most jobs of this project the scheduler runs at once; None for no limit.
+        self.max_active = max_active
+        # Whether streamed results are kept, or only tallied as they arrive.
+        self.keep_results = keep_results
+        # Executor the Director runs this project's jobs on; None for its default.
+        self.executor = executor
         self.jobs = None
         self.results = None
+        self.completed = 0
+        self.timed_out = 0
+        self.totals = {'x': 0, 'y': 0}
 
     def load_jobs(self):
         self.jobs = [Job(i) for i in range(self.n)]
 
     def compile_results(self, results):
         self.results = results
+        self.completed = 0
+        self.timed_out = 0
+        self.totals = {'x': 0, 'y': 0}
+        for result in results:
+            self._tally(result)
+
+    def add_result(self, result):
+        """
+        Takes the result of one job as soon as it returns, in completion
+        order, when the Director streams. The totals are kept up to date;
+        the result itself is kept only with keep_results, so that a large
+        project can be aggregated in bounded memory.
+        """
+        self._tally(result)
+        if self.keep_results:
+            if self.results is None:
+                self.results = []
+            self.results.append(result)
+
+    def _tally(self, result):
+        if isinstance(result, mp.TimeoutError):
+            self.timed_out += 1  # Ran past its deadline; see Director.run().
+            return
+        self.completed += 1
+        for key in self.totals:
+            self.totals[key] += result[key]
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \ringbuffer.py                                                                                                #
+# Language : Python 3.8.12                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 11:03:52 am                                                                        #
+# Modified : Monday, October 19th 2026, 9:12:05 am                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Shared-memory ring buffer usable as the log queue between workers and the listener."""
+import multiprocessing as mp
+import pickle
+import queue
+import struct
+import time
+from multiprocessing import context, shared_memory
+# ------------------------------------------------------------------------------------------------------------------------ #
+# The segment starts with two monotonically increasing byte counters: the write position (head), owned by the
+# producers, and the read position (tail), owned by the single consumer. Message counts kept the same way follow
+# them, for qsize(). Messages are a 4 byte length followed by the
+# pickled payload and wrap around the end of the ring.
+#
+# The counters are read and written through a 'Q' cast of the buffer, which is a single 8 byte load or store.
+# struct.pack_into is not usable for them because it zero-fills the target before packing, so a concurrent reader can
+# see the counter drop to 0.
+_LENGTH = struct.Struct('I')
+_HEAD = 0
+_TAIL = 1
+_PUTS = 2
+_GETS = 3
+_DATA = 64
+_MAX_WAIT = 0.001
+
+# Segments attached in this process, by name, so that a queue pickled into every
+# apply_async call is mapped once rather than once per task.
+_attached = {}
+
+
+class SharedMemoryQueue:
+    """
+    A multi-producer, single-consumer queue over a multiprocessing.shared_memory
+    ring buffer. It exposes the put/get subset of the queue API used by
+    QueueHandler and QueueListener, and pickles by segment name so it can be
+    passed to forked or spawned workers as a Process argument or a pool
+    initarg. Like a multiprocessing.Queue it carries a lock, so it cannot be
+    pickled once the process exists: not into an apply_async argument.
+
+    The consumer side is lock-free: it only reads the head and advances the
+    tail. Producers serialise on a lock held just long enough to copy the
+    message in and publish the new head, since CPython has no atomic
+    compare-and-swap to claim space with. Word-sized stores are relied on to
+    be atomic and ordered, which holds for x86-64.
+    """
+
+    def __init__(self, capacity=1 << 22, ctx=None):
+        ctx = ctx or mp.get_context()
+        self.capacity = capacity
+        self._lock = ctx.Lock()
+        self._shm = shared_memory.SharedMemory(create=True, size=_DATA + capacity)
+        self._shm.buf[:_DATA] = bytes(_DATA)
+        self._counters = self._shm.buf[:32].cast('Q')
+        self._owner = True
+        _attached[self._shm.name] = self._shm
+
+    def __getstate__(self):
+        if context.get_spawning_popen() is None:
+            raise RuntimeError('SharedMemoryQueue objects should only be shared between processes through '
+                               'inheritance: pass it as a Process argument or a pool initarg')
+        return self._shm.name, self.capacity, self._lock
+
+    def __setstate__(self, state):
+        name, self.capacity, self._lock = state
+        if name not in _attached:
+            _attached[name] = shared_memory.SharedMemory(name=name)
+        self._shm = _attached[name]
+        self._counters = self._shm.buf[:32].cast('Q')
+        self._owner = False
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def _copy_in(self, position, data):
+        start = position % self.capacity
+        first = min(len(data), self.capacity - start)
+        buf = self._shm.buf
+        buf[_DATA + start:_DATA + start + first] = data[:first]
+        if first < len(data):
+            buf[_DATA:_DATA + len(data) - first] = data[first:]
+
+    def _copy_out(self, position, size):
+        start = position % self.capacity
+        first = min(size, self.capacity - start)
+        buf = self._shm.buf
+        data = bytes(buf[_DATA + start:_DATA + start + first])
+        if first < size:
+            data += bytes(buf[_DATA:_DATA + size - first])
+        return data
+
+    def put(self, obj, block=True, timeout=None):
+        payload = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+        size = _LENGTH.size + len(payload)
+        if size > self.capacity:
+            raise ValueError('Message of %d bytes does not fit a ring of %d bytes' % (size, self.capacity))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        wait = 0.0
+        while True:
+            with self._lock:
+                head = self._counters[_HEAD]
+                if head + size - self._counters[_TAIL] <= self.capacity:
+                    self._copy_in(head, _LENGTH.pack(len(payload)) + payload)
+                    self._counters[_PUTS] += 1
+                    # Publishing the head is what makes the message visible to the consumer.
+                    self._counters[_HEAD] = head + size
+                    return
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise queue.Full
+            wait = min(wait * 2 or 0.00001, _MAX_WAIT)
+            time.sleep(wait)
+
+    def put_nowait(self, obj):
+        self.put(obj, block=False)
+
+    def get(self, block=True, timeout=None):
+        tail = self._counters[_TAIL]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        wait = 0.0
+        while self._counters[_HEAD] == tail:
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise queue.Empty
+            wait = min(wait * 2 or 0.00001, _MAX_WAIT)
+            time.sleep(wait)
+        length = _LENGTH.unpack(self._copy_out(tail, _LENGTH.size))[0]
+        payload = self._copy_out(tail + _LENGTH.size, length)
+        self._counters[_TAIL] = tail + _LENGTH.size + length
+        self._counters[_GETS] += 1
+        return pickle.loads(payload)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def empty(self):
+        return self._counters[_HEAD] == self._counters[_TAIL]
+
+    def qsize(self):
+        """Messages waiting; approximate while producers are writing."""
+        return max(0, self._counters[_PUTS] - self._counters[_GETS])
+
+    def close(self):
+        """Detaches this process from the segment."""
+        self._counters.release()
+        shm = _attached.pop(self._shm.name, None)
+        if shm is not None:
+            shm.close()
+
+    def unlink(self):
+        """Detaches and destroys the segment. Called once, by the creating process."""
+        self.close()
+        if self._owner:
+            self._shm.unlink()
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \scheduler.py                                                                                                 #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 2:20:14 am                                                                         #
+# Modified : Monday, October 19th 2026, 1:34:05 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Runs the jobs of several Projects on one worker pool at once."""
+import bisect
+import collections
+import functools
+import heapq
+import inspect
+import multiprocessing
+import os
+import threading
+import time
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def _timed(func, job):
+    # Runs in the worker, so the duration excludes time spent queued.
+    start = time.perf_counter()
+    value = func(job)
+    if inspect.isawaitable(value):
+        return _timed_await(value, start)  # For an executor with an event loop to await.
+    return value, time.perf_counter() - start
+
+
+async def _timed_await(value, start):
+    return await value, time.perf_counter() - start
+
+
+class CostModel:
+    """
+    Estimates how long a job will take from how long similar jobs took.
+    Jobs are grouped by key(job), by default their class name, and a
+    group's estimate is the exponentially weighted mean of its observed
+    durations, in seconds, with weight alpha on the newest. Groups not yet
+    seen are estimated at default.
+
+    Pass one as the Scheduler's cost; it learns from every job run, so
+    Projects submitted later are ordered by what earlier ones took.
+    """
+
+    def __init__(self, key=None, alpha=0.3, default=1.0):
+        self.key = key or (lambda job: type(job).__name__)
+        self.alpha = alpha
+        self.default = default
+        self.estimates = {}
+
+    def __call__(self, job):
+        return self.estimates.get(self.key(job), self.default)
+
+    def observe(self, job, seconds):
+        key = self.key(job)
+        estimate = self.estimates.get(key)
+        self.estimates[key] = seconds if estimate is None else estimate + self.alpha * (seconds - estimate)
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class _Progress:
+    """Where one Project stands: its jobs still to submit, jobs in flight and jobs still to return."""
+
+    def __init__(self, project, max_active, estimate=None):
+        self.project = project
+        self.max_active = max_active
+        self.total = len(project.jobs)
+        if estimate is None:
+            self.pending = collections.deque(range(self.total))
+        else:
+            # Longest first; ties keep job order.
+            self.pending = [(-estimate(job), index) for index, job in enumerate(project.jobs)]
+            heapq.heapify(self.pending)
+        self.active = 0
+        self.remaining = self.total
+        self.results = None
+        # Job index to when it was first submitted and to its attempts still in flight.
+        self.started = {}
+        self.running = {}
+        # Run times of the jobs returned so far, in order, to find the stragglers among the rest.
+        self.durations = []
+
+    def ready(self):
+        return bool(self.pending) and (self.max_active is None or self.active < self.max_active)
+
+    def longest(self):
+        return -self.pending[0][0]
+
+    def peek(self):
+        if isinstance(self.pending, list):
+            return self.pending[0][1]
+        return self.pending[0]
+
+    def next(self):
+        if isinstance(self.pending, list):
+            return heapq.heappop(self.pending)[1]
+        return self.pending.popleft()
+
+    def percentile(self, q):
+        # Nearest rank, once there are enough peers for it to mean anything.
+        if len(self.durations) < Scheduler.peers:
+            return None
+        return self.durations[min(len(self.durations) - 1, int(q * len(self.durations)))]
+
+
+class _Attempt:
+    """One run of a job on an executor. A straggler gets a second, a copy, and the first to return wins."""
+
+    __slots__ = ('executor', 'windowed', 'copy', 'started', 'result')
+
+    def __init__(self, executor, windowed, copy):
+        self.executor = executor
+        self.windowed = windowed
+        self.copy = copy
+        self.started = time.perf_counter()
+        self.result = None
+
+
+class Scheduler:
+    """
+    Feeds the jobs of every submitted Project to one pool, so that the pool
+    stays busy while the last jobs of one Project finish and the next ones
+    start. Jobs are taken from the Projects in turn, at most max_active at a
+    time from each: a Project's own max_active attribute, where set,
+    overrides the Scheduler's.
+
+    Given a cost, a callable estimating a job's duration such as a
+    CostModel, jobs go longest first instead, across all Projects, and no
+    more than two per pool process are handed to the pool ahead of time. A
+    job's own cost attribute, where set, overrides the estimate. Since the
+    pool's workers share one task queue, whichever worker frees up first
+    takes the longest job left, so no worker sits idle while another has a
+    backlog. Long jobs submitted last are what stretch a run on a skewed
+    workload; report() shows how close a run came to the ideal.
+
+    Results are taken in completion order, as from Pool.imap_unordered(),
+    by iterating over as_completed(), or handed to the Projects by run().
+
+    func is applied to each job in the pool, as with pool.apply_async(), and
+    processes is the number of workers in the pool, by default the number
+    of CPUs. Given a route, a callable taking a Project and one of its jobs,
+    each job goes to whichever executor route returns for it instead, so
+    Projects with different needs run side by side; see executors. The
+    window applies to the jobs sent to pool only. With a route, pool may
+    also be a function returning the pool, or None while it has not been
+    started, so that a pool started on first use starts only if some job
+    is routed to it.
+
+    Given a timeout, in seconds, a job that has not returned that long
+    after it was submitted is given up on and has a
+    multiprocessing.TimeoutError, the one AsyncResult.get(timeout) would
+    raise, as its result, so the rest of the run carries on. A job's own
+    timeout attribute, where set, overrides the Scheduler's. Given speculate, a fraction such as
+    0.9, a job still running once it has taken longer than that percentile
+    of the jobs of its Project returned so far is started again, as soon as
+    its executor has room that no new job needs: the first copy to return
+    wins and the other is cancelled. One slow or hung worker then holds up
+    only itself, not its Project. Speculation waits for peers jobs to have
+    returned, and only suits jobs that can safely run twice.
+
+    Either way, a job's time runs from its submission, so the pool is given
+    no more jobs than it has processes: each starts as it is submitted, on
+    its own, and the loser of a race or a job past its deadline is
+    cancelled. A ProcessExecutor terminates the worker running it and
+    starts another. An executor that cannot cancel, such as a pool of
+    threads, is left running the job and its result is ignored;
+    abandoned() lists those, for the executor to be terminated rather
+    than joined.
+    """
+
+    # Jobs of a Project that must have returned before its stragglers are speculated on.
+    peers = 3
+
+    def __init__(self, pool, func, max_active=None, cost=None, processes=None, route=None, timeout=None,
+                 speculate=None):
+        self._pool = pool
+        self.route = route
+        self.func = functools.partial(_timed, func)
+        self.max_active = max_active
+        self.cost = cost
+        self.processes = processes or os.cpu_count()
+        self.timeout = timeout
+        self.speculate = speculate
+        if timeout is not None or speculate is not None:
+            self.window = self.processes
+        else:
+            self.window = 2 * self.processes if cost is not None else None
+        self._progress = []
+        self._active = 0
+        self._finished = collections.deque()
+        self._condition = threading.Condition()
+        self._abandoned = []
+        self._counts = None
+        self._report = None
+
+    def submit(self, project):
+        max_active = getattr(project, 'max_active', None)
+        estimate = self._estimate if self.cost is not None else None
+        if any(getattr(job, 'timeout', None) is not None for job in project.jobs):
+            self.window = self.processes
+        self._progress.append(_Progress(project, max_active or self.max_active, estimate))
+
+    @property
+    def pool(self):
+        return self._pool() if callable(self._pool) else self._pool
+
+    def _estimate(self, job):
+        cost = getattr(job, 'cost', None)
+        return self.cost(job) if cost is None else cost
+
+    def as_completed(self):
+        """
+        Runs the submitted Projects, yielding (project, index, result) for
+        each job as it returns, where index is the job's position in
+        project.jobs. Nothing is kept once yielded, and the pool is topped
+        up before each batch of results is handed over, so it keeps working
+        while the caller does. The first job to raise has its exception
+        raised here, as AsyncResult.get() would; jobs already in the pool
+        are left to finish. A job past its deadline yields its TimeoutError
+        as its result instead.
+        """
+        for progress, index, value in self._completed():
+            yield progress.project, index, value
+
+    def run(self, stream=False):
+        """
+        Runs the submitted Projects to completion and returns them. By
+        default each Project has compile_results() called with its results,
+        in job order, as soon as its last job has returned. With stream,
+        each result is instead passed to the Project's add_result() as it
+        arrives, and none are held here.
+        """
+        projects = [progress.project for progress in self._progress]
+        if not stream:
+            for progress in self._progress:
+                progress.results = [None] * progress.total
+                if not progress.total:
+                    progress.project.compile_results([])
+        for progress, index, value in self._completed():
+            if stream:
+                progress.project.add_result(value)
+                continue
+            progress.results[index] = value
+            if not progress.remaining:
+                progress.project.compile_results(progress.results)
+                progress.results = None
+        return projects
+
+    def report(self):
+        """
+        How the last run went: its makespan, from the first job submitted
+        to the last returned, against the ideal, the longer of its longest
+        job and the total work spread evenly over the pool's processes, and
+        their ratio as efficiency; also how many jobs were speculated on,
+        how many of those the copy won and how many timed out.
+        """
+        return dict(self._report) if self._report else None
+
+    def abandoned(self):
+        """(executor, AsyncResult) of every job given up on that its executor is still running."""
+        self._abandoned = [attempt for attempt in self._abandoned
+                           if attempt.result is not None and not attempt.result.ready()]
+        return [(attempt.executor, attempt.result) for attempt in self._abandoned]
+
+    def _completed(self):
+        current = set(self._progress)
+        self._counts = dict.fromkeys(('jobs', 'busy', 'longest', 'speculated', 'won', 'timed_out'), 0)
+        start = time.perf_counter()
+        try:
+            remaining = sum(progress.remaining for progress in current)
+            self._dispatch()
+            while remaining:
+                with self._condition:
+                    if not self._finished:
+                        self._condition.wait(self._until())
+                    finished, self._finished = self._finished, collections.deque()
+                returned = self._settle(finished, current) + self._expire()
+                remaining -= len(returned)
+                self._top_up(returned)
+                for progress, index, success, value in returned:
+                    if not success:
+                        raise value
+                    # Counted down as each is handed over, so run() sees the last of a Project's results last.
+                    progress.remaining -= 1
+                    yield progress, index, value
+        finally:
+            self._progress = []
+            self._active = 0
+            counts = self._counts
+            makespan = time.perf_counter() - start
+            ideal = max(counts['busy'] / self.processes, counts['longest'])
+            self._report = dict(counts, processes=self.processes, makespan=makespan, ideal=ideal,
+                                efficiency=ideal / makespan if makespan else 1.0)
+
+    def _settle(self, finished, current):
+        # Takes each finished attempt to its Project, returning (progress, index, success, value) for the jobs
+        # now decided, with the run's counts and the cost model updated.
+        returned = []
+        counts = self._counts
+        for progress, index, attempt, success, value in finished:
+            if progress not in current:
+                continue  # Left over from a run that raised.
+            self._active -= attempt.windowed
+            attempts = progress.running.get(index, [])
+            if attempt not in attempts:
+                continue  # Lost a race, or ran past its deadline.
+            attempts.remove(attempt)
+            if not success and attempts:
+                continue  # The other copy may yet return.
+            self._resolve(progress, index)
+            if success:
+                value, seconds = value
+                counts['jobs'] += 1
+                counts['busy'] += seconds
+                counts['longest'] = max(counts['longest'], seconds)
+                counts['won'] += attempt.copy
+                bisect.insort(progress.durations, seconds)
+                if hasattr(self.cost, 'observe'):
+                    self.cost.observe(progress.project.jobs[index], seconds)
+            returned.append((progress, index, success, value))
+        return returned
+
+    def _expire(self):
+        # Gives up on the jobs past their deadline, returning a TimeoutError for each as its result, not raised,
+        # so that one overdue job does not end the run.
+        expired = []
+        for progress, index, timeout in self._overdue():
+            self._resolve(progress, index)
+            self._counts['timed_out'] += 1
+            expired.append((progress, index, True, multiprocessing.TimeoutError(
+                'Job {} of {} ran past its {}s deadline'.format(index, progress.project.name, timeout))))
+        return expired
+
+    def _top_up(self, returned):
+        # Refills the pool and copies the stragglers, unless a failure is about to end the run.
+        if all(success for _, _, success, _ in returned):
+            self._dispatch()
+            self._counts['speculated'] += self._speculate()
+
+    def _dispatch(self):
+        # Round robin over the Projects in job order or, with a cost, the longest job any of them has
+        # ready, until every Project is at its cap or out of jobs, or the window is full.
+        while True:
+            ready = [progress for progress in self._progress if progress.ready() and self._room(progress)]
+            if not ready:
+                return
+            if self.cost is not None:
+                self._submit(max(ready, key=_Progress.longest))
+                continue
+            for progress in ready:
+                if self._room(progress):
+                    self._submit(progress)
+
+    def _executor(self, progress, index):
+        if self.route is None:
+            return self.pool
+        return self.route(progress.project, progress.project.jobs[index])
+
+    def _room(self, progress):
+        return self._has_room(self._executor(progress, progress.peek()))
+
+    def _has_room(self, executor):
+        return executor is not self.pool or self.window is None or self._active < self.window
+
+    def _submit(self, progress):
+        index = progress.next()
+        progress.active += 1
+        progress.started[index] = time.perf_counter()
+        self._launch(progress, index, copy=False)
+
+    def _launch(self, progress, index, copy):
+        executor = self._executor(progress, index)
+        attempt = _Attempt(executor, executor is self.pool, copy)
+        # Recorded before the job is sent, since an inline executor finishes it before apply_async() returns.
+        progress.running.setdefault(index, []).append(attempt)
+        self._active += attempt.windowed
+        attempt.result = executor.apply_async(
+            self.func, (progress.project.jobs[index],),
+            callback=functools.partial(self._finish, progress, index, attempt, True),
+            error_callback=functools.partial(self._finish, progress, index, attempt, False))
+
+    def _finish(self, progress, index, attempt, success, value):
+        # Runs in the executor's result thread; the bookkeeping is left to _completed().
+        with self._condition:
+            self._finished.append((progress, index, attempt, success, value))
+            self._condition.notify()
+
+    def _resolve(self, progress, index):
+        # The job is decided: cancel whatever copies of it are still running, or else abandon them.
+        progress.active -= 1
+        del progress.started[index]
+        for attempt in progress.running.pop(index):
+            cancel = getattr(attempt.executor, 'cancel', None)
+            if cancel is None or not cancel(attempt.result):
+                self._abandoned.append(attempt)
+
+    def _deadline(self, progress, index):
+        timeout = getattr(progress.project.jobs[index], 'timeout', None)
+        return self.timeout if timeout is None else timeout
+
+    def _deadlines(self):
+        # (progress, index, timeout) of each job in flight that has a deadline.
+        for progress in self._progress:
+            for index in progress.running:
+                timeout = self._deadline(progress, index)
+                if timeout is not None:
+                    yield progress, index, timeout
+
+    def _overdue(self):
+        now = time.perf_counter()
+        return [(progress, index, timeout) for progress, index, timeout in self._deadlines()
+                if now - progress.started[index] > timeout]
+
+    def _stragglers(self):
+        # (since, progress, index) of each job in flight on one attempt that is due a copy at since.
+        if self.speculate is None:
+            return []
+        stragglers = []
+        for progress in self._progress:
+            threshold = progress.percentile(self.speculate)
+            if threshold is None:
+                continue
+            for index, attempts in progress.running.items():
+                if len(attempts) == 1 and not attempts[0].copy:
+                    stragglers.append((attempts[0].started + threshold, progress, index))
+        return stragglers
+
+    def _speculate(self):
+        # Longest running first, onto whatever room their executors have left after new jobs.
+        launched = 0
+        now = time.perf_counter()
+        for since, progress, index in sorted(self._stragglers(), key=lambda straggler: straggler[0]):
+            if since < now and self._has_room(progress.running[index][0].executor):
+                self._launch(progress, index, copy=True)
+                launched += 1
+        return launched
+
+    def _until(self):
+        # Seconds until the next deadline, or the next straggler that could get a copy; None to wait for results.
+        times = [progress.started[index] + timeout for progress, index, timeout in self._deadlines()]
+        times += [since for since, progress, index in self._stragglers()
+                  if self._has_room(progress.running[index][0].executor)]
+        return max(0.0, min(times) - time.perf_counter()) if times else None
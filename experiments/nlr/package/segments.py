@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \segments.py                                                                                                  #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 9:26:37 pm                                                                         #
+# Modified : Monday, October 19th 2026, 12:31:47 pm                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Per-process append-only log segments, merged into a single log once the run is over."""
+import contextlib
+import glob
+import heapq
+import itertools
+import logging
+import os
+import struct
+import time
+
+from .batching import flush_at_exit
+# ------------------------------------------------------------------------------------------------------------------------ #
+# created, pid, sequence number and length of the formatted text that follows.
+_ENTRY = struct.Struct('<dIQI')
+SUFFIX = '.seg'
+
+
+class SegmentHandler(logging.Handler):
+    """
+    Writes formatted records to a segment file that belongs to the emitting
+    process alone, <directory>/<prefix>-<pid>-<start>.seg, so workers log with
+    no IPC and no listener. Each entry carries the record's timestamp and a
+    per-process sequence number for merge_segments() to order by.
+
+    Writes go through a buffer of buffer_size bytes. It is flushed for
+    records at or above flush_level and at process exit, as with
+    BatchingQueueHandler.
+    """
+
+    def __init__(self, directory, prefix='segment', buffer_size=1 << 16, flush_level=logging.ERROR):
+        super().__init__()
+        self.directory = directory
+        self.prefix = prefix
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.stream = None
+        self.buffer = bytearray()
+        self._pid = None
+        self._sequence = None
+        self._registered = None
+        self._register()
+
+    def _register(self):
+        # Finalizers are per process, so a handler inherited across a fork
+        # registers again in the child.
+        if self._registered != os.getpid():
+            self._registered = os.getpid()
+            flush_at_exit(self)
+
+    def _open(self):
+        # Opened by whichever process first emits, so a handler inherited
+        # across a fork never shares its parent's segment. The buffer is kept
+        # here rather than in the file object for the same reason: an
+        # inherited io.BufferedWriter would write the parent's pending bytes
+        # a second time when the child drops it.
+        self._pid = os.getpid()
+        self._sequence = itertools.count()
+        self.buffer = bytearray()
+        self._register()
+        os.makedirs(self.directory, exist_ok=True)
+        name = '%s-%d-%x%s' % (self.prefix, self._pid, time.time_ns(), SUFFIX)
+        self.stream = open(os.path.join(self.directory, name), 'ab', buffering=0)
+
+    def emit(self, record):
+        try:
+            if self._pid != os.getpid():
+                self._open()
+            data = self.format(record).encode('utf-8', 'backslashreplace')
+            self.buffer += _ENTRY.pack(record.created, self._pid, next(self._sequence), len(data))
+            self.buffer += data
+            if record.levelno >= self.flush_level or len(self.buffer) >= self.buffer_size:
+                self._write()
+        except Exception:
+            self.handleError(record)
+
+    def _write(self):
+        if self.buffer and self._pid == os.getpid():
+            data = memoryview(self.buffer)
+            while data:
+                data = data[self.stream.write(data):]
+            del data
+            self.buffer.clear()
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._write()
+        finally:
+            self.release()
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream is not None and self._pid == os.getpid():
+                self._write()
+                self.stream.close()
+            self.stream = None
+            self._pid = None
+        finally:
+            self.release()
+        super().close()
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def segment_paths(directory, prefix='segment'):
+    return sorted(glob.glob(os.path.join(directory, '%s-*%s' % (prefix, SUFFIX))))
+
+
+def read_segment(path):
+    """
+    Yields (created, pid, sequence, text) for each entry in a segment, in the
+    order they were written. A final entry cut short by a killed process is
+    ignored.
+    """
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(_ENTRY.size)
+            if len(header) < _ENTRY.size:
+                return
+            created, pid, sequence, length = _ENTRY.unpack(header)
+            data = f.read(length)
+            if len(data) < length:
+                return
+            yield created, pid, sequence, data.decode('utf-8')
+
+
+def merge_segments(paths, output, mode='w', remove=False):
+    """
+    Writes the entries of all segments to the text log output, ordered by
+    timestamp, then process id and sequence number. The merge streams through
+    a heap holding one entry per segment, so memory does not grow with the
+    size of the logs. Returns the number of records written.
+    """
+    written = 0
+    with contextlib.ExitStack() as stack:
+        segments = [stack.enter_context(contextlib.closing(read_segment(path))) for path in paths]
+        with open(output, mode, encoding='utf-8') as f:
+            for _, _, _, text in heapq.merge(*segments):
+                f.write(text)
+                f.write('\n')
+                written += 1
+    if remove:
+        for path in paths:
+            os.remove(path)
+    return written
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \sharded.py                                                                                                   #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 6:02:33 pm                                                                         #
+# Modified : Monday, October 19th 2026, 12:57:31 pm                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Per-handler writer threads for the listener, so that one slow sink cannot stall the others."""
+import copy
+import logging
+import queue
+import threading
+# ------------------------------------------------------------------------------------------------------------------------ #
+_STOP = object()
+_logger = logging.getLogger('logging.shards')
+
+
+class ShardHandler(logging.Handler):
+    """
+    Stands in for a configured handler in the listener. handle() only places
+    the record on a bounded in-memory queue; a dedicated writer thread takes
+    it from there and calls the real handler, which applies its own filters,
+    lock and emit.
+
+    Each shard takes its own copy of the record, since formatting sets
+    message, asctime and exc_text on it and the writers run at once.
+
+    When the queue is full, records below block_level are dropped and
+    counted in dropped rather than holding up the dispatcher and the other
+    sinks. Records at or above block_level wait for space, so errors are
+    never lost to a slow terminal.
+    """
+
+    def __init__(self, target, maxsize=10000, block_level=logging.ERROR):
+        super().__init__(target.level)
+        self.target = target
+        self.name = target.name
+        self.block_level = block_level
+        self.dropped = 0
+        self.queue = queue.Queue(maxsize)
+        self._writer = threading.Thread(target=self._write, name='ShardHandler-%s' % (target.name or id(target)),
+                                        daemon=True)
+        self._writer.start()
+
+    def setLevel(self, level):
+        super().setLevel(level)
+        self.target.setLevel(level)
+
+    def handle(self, record):
+        try:
+            self.queue.put(copy.copy(record), block=record.levelno >= self.block_level)
+        except queue.Full:
+            self.dropped += 1
+        return True
+
+    def _write(self):
+        while True:
+            record = self.queue.get()
+            try:
+                if record is _STOP:
+                    break
+                self.target.handle(record)
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        """Waits for the writer to drain the queue, then flushes the real handler."""
+        if self._writer.is_alive():
+            self.queue.join()
+        self.target.flush()
+
+    def close(self):
+        if self._writer.is_alive():
+            self.queue.put(_STOP)
+            self._writer.join()
+        self.target.close()
+        super().close()
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def shard_handlers(maxsize=10000, block_level=logging.ERROR):
+    """
+    Replaces every handler configured in this process with a ShardHandler
+    writing to it from its own thread. Call after dictConfig in the
+    listener. Handlers shared between loggers share one shard. Returns the
+    shards, which should be closed when the listener stops.
+    """
+    loggers = [logging.getLogger()] + [logger for logger in logging.Logger.manager.loggerDict.values()
+                                       if isinstance(logger, logging.Logger)]
+    shards = {}
+    for logger in loggers:
+        for i, handler in enumerate(logger.handlers):
+            if isinstance(handler, ShardHandler):
+                continue
+            if handler not in shards:
+                shards[handler] = ShardHandler(handler, maxsize, block_level)
+            logger.handlers[i] = shards[handler]
+    return list(shards.values())
+
+
+def close_shards(shards):
+    """
+    Drains and closes the shards returned by shard_handlers(), logging on
+    'logging.shards' how many records any of them dropped once they have room
+    for the warning.
+    """
+    for shard in shards:
+        shard.flush()
+    for shard in shards:
+        if shard.dropped:
+            _logger.warning('Handler %s dropped %d records while its writer fell behind',
+                            shard.name or type(shard.target).__name__, shard.dropped)
+    for shard in shards:
+        shard.close()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \shared.py                                                                                                    #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 4:30:27 am                                                                         #
+# Modified : Monday, October 19th 2026, 11:21:48 am                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Large job inputs and outputs passed between processes in shared memory rather than pickled."""
+import collections
+import threading
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Blocks this process has mapped to read or write, least recently used first. Up to _MAX_ATTACHED stay
+# mapped so that jobs reusing a block do not map it again; beyond that the oldest not still in use are closed.
+_attached = collections.OrderedDict()
+_attaching = threading.Lock()
+_MAX_ATTACHED = 64
+# Blocks let go of while arrays still viewed them, closed once they no longer do.
+_lingering = []
+
+
+def _attach(name, shm=None):
+    with _attaching:
+        if shm is None:
+            shm = _attached.get(name)
+            if shm is None:
+                shm = shared_memory.SharedMemory(name)
+        _attached[name] = shm
+        _attached.move_to_end(name)
+        for stale in list(_attached)[:-_MAX_ATTACHED]:
+            try:
+                _attached[stale].close()
+            except BufferError:
+                continue  # Some array still views it.
+            del _attached[stale]
+        _lingering[:] = [block for block in _lingering if not _closed(block)]
+        return shm
+
+
+def _closed(shm):
+    try:
+        shm.close()
+    except BufferError:
+        return False
+    return True
+
+
+def _detach(name):
+    with _attaching:
+        shm = _attached.pop(name, None)
+        if shm is not None and not _closed(shm):
+            _lingering.append(shm)  # Mapped until the last view of it goes.
+    return shm
+
+
+class ArrayHandle:
+    """
+    Refers to an array held in a shared memory block. It pickles as the
+    block's name, shape and dtype, so a Job carrying one costs a few bytes
+    to send however large the array, and view() returns the array itself in
+    whichever process holds the handle, without copying it.
+    """
+
+    __slots__ = ('name', 'shape', 'dtype')
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype).str
+
+    def __getstate__(self):
+        return self.name, self.shape, self.dtype
+
+    def __setstate__(self, state):
+        self.name, self.shape, self.dtype = state
+
+    def __repr__(self):
+        return '%s(%r, %r, %r)' % (type(self).__name__, self.name, self.shape, self.dtype)
+
+    @property
+    def nbytes(self):
+        return int(np.prod(self.shape, dtype=np.int64)) * np.dtype(self.dtype).itemsize
+
+    def view(self):
+        """The array, mapped from its block. Writes to it are seen by every process viewing the block."""
+        return _view(_attach(self.name), self.shape, self.dtype)
+
+
+def _view(shm, shape, dtype):
+    # Unlike np.ndarray(buffer=...), frombuffer holds on to the buffer, so the
+    # block cannot be closed, and unmapped, while the array is still around.
+    count = int(np.prod(shape, dtype=np.int64))
+    return np.frombuffer(shm.buf, dtype, count).reshape(shape)
+
+
+def share(array):
+    """
+    Copies array into a new shared memory block and returns its handle.
+    Workers use it to return an array as a handle; the block stays until
+    the process that adopts the handle into a SharedArrays releases it.
+
+    This process's mapping is closed once the array is copied in, so a
+    worker holds none of the blocks it returns: view() maps one again
+    where the handle is read.
+    """
+    array = np.asarray(array)
+    if array.dtype.hasobject:
+        raise ValueError('Arrays of Python objects cannot be placed in shared memory')
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    handle = ArrayHandle(shm.name, array.shape, array.dtype)
+    _view(shm, array.shape, array.dtype)[...] = array
+    shm.close()
+    return handle
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class SharedArrays:
+    """
+    A registry of the shared memory blocks holding job data, kept by the
+    process that hands out the jobs. put() copies an array into a block
+    once and returns its handle for any number of Jobs to carry, and
+    adopt() takes in the handles workers return from share(). Each block is
+    reference counted, starting from refs, and is freed once release() has
+    been called as many times as it was put, adopted or retained. close(),
+    or leaving a with block, frees whatever is left.
+
+    Create it before the pool. Blocks are tracked, so that they are removed
+    if the program dies, by the resource tracker that the registry starts;
+    workers started after it share that tracker. A worker that started its
+    own would have it remove the blocks the worker made, as leaked, when
+    the worker exits.
+    """
+
+    def __init__(self):
+        resource_tracker.ensure_running()
+        self._refs = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._refs)
+
+    @property
+    def nbytes(self):
+        """Bytes held in the registry's blocks."""
+        with self._lock:
+            return sum(handle.nbytes for handle, _ in self._refs.values())
+
+    def put(self, array, refs=1):
+        return self.adopt(share(array), refs)
+
+    def adopt(self, handle, refs=1):
+        """Takes a block made by share(), in this process or a worker, into the registry."""
+        with self._lock:
+            if handle.name in self._refs:
+                raise ValueError('%r is already in the registry' % (handle,))
+            self._refs[handle.name] = [handle, refs]
+        return handle
+
+    def retain(self, handle, refs=1):
+        with self._lock:
+            self._refs[handle.name][1] += refs
+        return handle
+
+    def release(self, handle, refs=1):
+        """Drops refs references to the handle's block, freeing it if they were the last."""
+        with self._lock:
+            entry = self._refs[handle.name]
+            entry[1] -= refs
+            if entry[1] > 0:
+                return
+            del self._refs[handle.name]
+        self._free(handle.name)
+
+    def _free(self, name):
+        # Views still held keep their mapping; only the name goes now.
+        shm = _detach(name)
+        if shm is None:
+            try:
+                shm = shared_memory.SharedMemory(name)
+            except FileNotFoundError:
+                return
+            shm.close()
+        shm.unlink()
+
+    def close(self):
+        with self._lock:
+            names, self._refs = list(self._refs), {}
+        for name in names:
+            self._free(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
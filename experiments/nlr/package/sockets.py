@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \sockets.py                                                                                                   #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 12:42:31 am                                                                        #
+# Modified : Monday, October 19th 2026, 1:42:51 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""TCP and Unix socket transport from workers on any host to one aggregating listener."""
+import logging
+import logging.config
+import logging.handlers
+import os
+import pickle
+import queue
+import select
+import socket
+import socketserver
+import struct
+import threading
+import time
+
+from .batching import BatchingQueueHandler, CompactQueueHandler
+from .parallel import QueueLogHandler
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Each message is a 4 byte big-endian length and a pickled queue item, as logging.handlers.SocketHandler frames its
+# records. The aggregator unpickles what it receives, so it must only listen where every peer is trusted.
+_LENGTH = struct.Struct('>I')
+
+
+def _frame(obj):
+    data = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+    return _LENGTH.pack(len(data)) + data
+
+
+def _family(address):
+    """A (host, port) pair is TCP; a path is a Unix socket."""
+    return socket.AF_UNIX if isinstance(address, (str, bytes, os.PathLike)) else socket.AF_INET
+
+
+class SocketQueue:
+    """
+    The put side of a queue, sending items over one persistent connection to
+    a LogAggregator at address. Each process opens its own connection on
+    first use.
+
+    A lost or refused connection is retried no sooner than retry_start
+    seconds later, doubling up to retry_max while it keeps failing.
+    Meanwhile put() raises queue.Full, or with block waits up to timeout for
+    the connection to come back. A batching handler's overflow policy so
+    holds, drops or spills records while the aggregator is unreachable.
+
+    preamble, if given, is called on each new connection for a list of
+    items to send ahead of everything else, such as the string definitions
+    compact records refer to. It is not pickled with the queue.
+    """
+
+    def __init__(self, address, retry_start=0.1, retry_max=30.0, connect_timeout=5.0, preamble=None):
+        self.address = tuple(address) if isinstance(address, list) else address
+        self.retry_start = retry_start
+        self.retry_max = retry_max
+        self.connect_timeout = connect_timeout
+        self.preamble = preamble
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._sock = None
+        self._lock = threading.Lock()
+        self._retry_at = 0.0
+        self._retry_delay = self.retry_start
+
+    def __getstate__(self):
+        return self.address, self.retry_start, self.retry_max, self.connect_timeout
+
+    def __setstate__(self, state):
+        self.address, self.retry_start, self.retry_max, self.connect_timeout = state
+        self.preamble = None
+        self._reset()
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.address)
+
+    def config_key(self):
+        """What bootstrap.configure() compares a SocketQueue by, so copies shipped with each job match."""
+        return self.address
+
+    def _connect(self):
+        if self._sock is not None:
+            # The aggregator never writes, so a readable socket means it has closed or reset the
+            # connection. Sending anyway would succeed locally and lose the message.
+            if not select.select((self._sock,), (), (), 0)[0]:
+                return self._sock
+            self._disconnect()
+        now = time.monotonic()
+        if now < self._retry_at:
+            return None
+        sock = socket.socket(_family(self.address), socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.connect_timeout)
+            sock.connect(self.address)
+            sock.settimeout(None)
+            if sock.family == socket.AF_INET:
+                # Batches are complete messages; there is nothing to gain by waiting to coalesce them.
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            for obj in self.preamble() if self.preamble is not None else ():
+                sock.sendall(_frame(obj))
+        except OSError:
+            sock.close()
+            self._retry_at = now + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, self.retry_max)
+            return None
+        self._retry_delay = self.retry_start
+        self._sock = sock
+        return sock
+
+    def _disconnect(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._retry_at = time.monotonic()
+
+    def put(self, obj, block=True, timeout=None):
+        if self._pid != os.getpid():
+            # The connection belongs to the parent; closing this copy of it leaves theirs open.
+            if self._sock is not None:
+                self._sock.close()
+            self._reset()
+        message = _frame(obj)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while True:
+                sock = self._connect()
+                if sock is not None:
+                    try:
+                        sock.sendall(message)
+                        return
+                    except OSError:
+                        # The whole message is sent again on the next connection; the aggregator
+                        # discards the partial one with the connection it arrived on.
+                        self._disconnect()
+                        continue
+                now = time.monotonic()
+                if not block or (deadline is not None and now >= deadline):
+                    raise queue.Full
+                wait = self._retry_at - now
+                if deadline is not None:
+                    wait = min(wait, deadline - now)
+                time.sleep(max(wait, 0.001))
+
+    def put_nowait(self, obj):
+        self.put(obj, block=False)
+
+    def close(self):
+        with self._lock:
+            if self._sock is not None and self._pid == os.getpid():
+                self._sock.close()
+            self._sock = None
+
+
+class BatchingSocketHandler(BatchingQueueHandler):
+    """
+    A BatchingQueueHandler sending its batches to the LogAggregator at
+    address. By default, while the aggregator is unreachable up to
+    max_pending records wait in the worker, then DEBUG and INFO are dropped
+    first; see package.overflow for the other policies.
+    """
+
+    def __init__(self, address, capacity=100, flush_interval=0.5, flush_level=logging.ERROR,
+                 defer_format=False, overflow='drop', **overflow_options):
+        super().__init__(SocketQueue(address), capacity, flush_interval, flush_level, defer_format,
+                         overflow, **overflow_options)
+
+
+class CompactSocketHandler(CompactQueueHandler):
+    """
+    BatchingSocketHandler in the compact wire format. Every connection
+    opens with the strings the encoder has interned so far, so records keep
+    decoding when the aggregator restarts, even those encoded before it did.
+    """
+
+    def __init__(self, address, capacity=100, flush_interval=0.5, flush_level=logging.ERROR,
+                 defer_format=False, overflow='drop', **overflow_options):
+        super().__init__(SocketQueue(address, preamble=self._replay), capacity, flush_interval, flush_level,
+                         defer_format, overflow, **overflow_options)
+
+    def _replay(self):
+        return self.encoder.replay()
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class _Receiver(socketserver.StreamRequestHandler):
+    """Reads one worker connection, putting each message on the aggregator's queue."""
+
+    def handle(self):
+        aggregator = self.server.aggregator
+        aggregator._opened(self.connection)
+        try:
+            read = self.rfile.read
+            while True:
+                header = read(_LENGTH.size)
+                if len(header) < _LENGTH.size:
+                    return
+                size = _LENGTH.unpack(header)[0]
+                data = read(size)
+                if len(data) < size:
+                    return
+                aggregator.queue.put(pickle.loads(data))
+        except OSError:
+            pass
+        finally:
+            aggregator._closed(self.connection)
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class LogAggregator:
+    """
+    Accepts connections from SocketQueues at address, a (host, port) pair or
+    a Unix socket path, and puts what they send on one queue. A QueueListener
+    thread dispatches it with QueueLogHandler, so records are routed to the
+    listener's logging configuration exactly as the queue-based listeners
+    route them. Port 0 picks a free port; address holds the bound one.
+
+    Connections are read by a thread each; dispatch stays on the one
+    listener thread.
+    """
+
+    def __init__(self, address, handler=None, metrics=None):
+        self.queue = queue.SimpleQueue()
+        if _family(address) == socket.AF_UNIX:
+            if os.path.exists(address):
+                os.unlink(address)
+            self.server = _UnixServer(address, _Receiver)
+        else:
+            self.server = _TCPServer(tuple(address), _Receiver)
+        self.server.aggregator = self
+        self.address = self.server.server_address
+        if metrics is not None and metrics.queue is None:
+            metrics.queue = self.queue
+        self.listener = logging.handlers.QueueListener(self.queue, handler or QueueLogHandler(metrics))
+        self._connections = set()
+        self._lock = threading.Condition()
+        self._thread = None
+
+    def _opened(self, connection):
+        with self._lock:
+            self._connections.add(connection)
+
+    def _closed(self, connection):
+        with self._lock:
+            self._connections.discard(connection)
+            self._lock.notify_all()
+
+    def start(self):
+        self.listener.start()
+        self._thread = threading.Thread(target=self.server.serve_forever, name='LogAggregator', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """
+        Stops accepting connections and gives open ones up to timeout seconds
+        to close before cutting them off, then dispatches what has arrived.
+        """
+        if self._thread is not None:
+            self.server.shutdown()
+        self.server.server_close()
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while self._connections and self._lock.wait(max(deadline - time.monotonic(), 0)):
+                pass
+            for connection in self._connections:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            while self._connections:
+                self._lock.wait()
+        self.listener.stop()
+        if _family(self.address) == socket.AF_UNIX and os.path.exists(self.address):
+            os.unlink(self.address)
+
+
+def aggregator_process(address, stop_event, config, metrics=None, stats_interval=None, ready=None):
+    """
+    Configures logging and runs a LogAggregator at address until stop_event
+    is set. ready, an Event, is set once it is accepting connections.
+    """
+    logging.config.dictConfig(config)
+    if metrics is not None:
+        metrics.start(stats_interval)
+    aggregator = LogAggregator(address, metrics=metrics)
+    aggregator.start()
+    if ready is not None:
+        ready.set()
+    stop_event.wait()
+    aggregator.stop()
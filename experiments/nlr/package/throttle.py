@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \throttle.py                                                                                                  #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 10:31:50 pm                                                                        #
+# Modified : Sunday, October 18th 2026, 10:31:50 pm                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Worker-side filters that keep a hot loop from flooding the log transport."""
+import collections
+import logging
+import multiprocessing.util
+import os
+import threading
+import time
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Summary records carry this attribute and pass both filters untouched.
+SUMMARY = 'throttle_summary'
+
+
+def _summary(record, msg, args):
+    summary = logging.LogRecord(record.name, record.levelno, record.pathname, record.lineno,
+                                msg, args, None, record.funcName)
+    setattr(summary, SUMMARY, True)
+    return summary
+
+
+def _emit(summaries):
+    # Filters have no handler of their own, so summaries go back through
+    # the logger: they reach every handler that would have had the record.
+    for summary in summaries:
+        logging.getLogger(summary.name).handle(summary)
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class DuplicateFilter(logging.Filter):
+    """
+    Collapses repeats of a message. The first record with a given logger,
+    level, msg and args passes; identical records in the next window seconds
+    are only counted. When the window has passed, the next repeat is let
+    through after a summary record saying how many were suppressed.
+
+    Up to max_keys distinct messages are tracked, least recently seen
+    evicted first. Counts still pending are reported on eviction and at
+    process exit.
+    """
+
+    def __init__(self, name='', window=1.0, max_keys=1024):
+        super().__init__(name)
+        self.window = window
+        self.max_keys = max_keys
+        self.suppressed = 0
+        self._seen = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._registered = None
+
+    @staticmethod
+    def key(record):
+        key = (record.name, record.levelno, record.msg, record.args)
+        try:
+            hash(key)
+        except TypeError:
+            key = (record.name, record.levelno, record.getMessage())
+        return key
+
+    def filter(self, record):
+        if not super().filter(record):
+            return False
+        if getattr(record, SUMMARY, False):
+            return True
+        if self._registered != os.getpid():
+            self._register()
+        key = self.key(record)
+        now = time.monotonic()
+        summaries = []
+        with self._lock:
+            entry = self._seen.get(key)
+            if entry is not None and now - entry[0] < self.window:
+                entry[1] += 1
+                entry[2] = record
+                self.suppressed += 1
+                self._seen.move_to_end(key)
+                return False
+            if entry is not None and entry[1]:
+                summaries.append(self._summarise(entry, now))
+            self._seen[key] = [now, 0, None]
+            self._seen.move_to_end(key)
+            while len(self._seen) > self.max_keys:
+                _, entry = self._seen.popitem(last=False)
+                if entry[1]:
+                    summaries.append(self._summarise(entry, now))
+        _emit(summaries)
+        return True
+
+    @staticmethod
+    def _summarise(entry, now):
+        started, count, last = entry
+        return _summary(last, '%s (repeated %d more times in %.1fs)', (last.getMessage(), count, now - started))
+
+    def _register(self):
+        # As with the handlers, exit hooks are per process.
+        self._registered = os.getpid()
+        self._seen.clear()
+        # Ahead of the queue handlers' final flush (priority 20).
+        multiprocessing.util.Finalize(self, self.flush, exitpriority=30)
+
+    def flush(self):
+        """Reports every count still pending."""
+        now = time.monotonic()
+        with self._lock:
+            summaries = [self._summarise(entry, now) for entry in self._seen.values() if entry[1]]
+            self._seen.clear()
+        _emit(summaries)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    A token bucket per logger name: each logger may pass rate records per
+    second on average, in bursts of up to burst (by default, one second's
+    worth). rates overrides rate for particular loggers, e.g.
+    {'blue_log': 10}; a rate of None leaves loggers unlimited. Records at or
+    above exempt_level always pass.
+
+    When a logger is let through again after dropping records, a summary
+    record says how many were dropped. Counts still pending are reported
+    at process exit.
+    """
+
+    def __init__(self, name='', rate=100.0, burst=None, rates=None, exempt_level=logging.ERROR):
+        super().__init__(name)
+        self.rate = rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self.exempt_level = exempt_level
+        self.dropped = 0
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._registered = None
+
+    def filter(self, record):
+        if not super().filter(record):
+            return False
+        if record.levelno >= self.exempt_level or getattr(record, SUMMARY, False):
+            return True
+        if self._registered != os.getpid():
+            self._register()
+        now = time.monotonic()
+        with self._lock:
+            try:
+                bucket = self._buckets[record.name]
+            except KeyError:
+                bucket = self._buckets[record.name] = self._bucket(record.name, now)
+            if bucket is None:
+                return True
+            rate, burst, tokens, updated, dropped, _ = bucket
+            tokens = min(burst, tokens + (now - updated) * rate)
+            bucket[3] = now
+            if tokens < 1:
+                bucket[2] = tokens
+                bucket[4] += 1
+                bucket[5] = record
+                self.dropped += 1
+                return False
+            bucket[2] = tokens - 1
+            bucket[4] = 0
+        if dropped:
+            _emit([self._summarise(record, dropped)])
+        return True
+
+    @staticmethod
+    def _summarise(record, dropped):
+        return _summary(record, '%d records from %s dropped by the rate limit', (dropped, record.name))
+
+    def _register(self):
+        self._registered = os.getpid()
+        self._buckets.clear()
+        multiprocessing.util.Finalize(self, self.flush, exitpriority=30)
+
+    def flush(self):
+        """Reports every count still pending."""
+        with self._lock:
+            summaries = [self._summarise(bucket[5], bucket[4]) for bucket in self._buckets.values()
+                         if bucket is not None and bucket[4]]
+            for bucket in self._buckets.values():
+                if bucket is not None:
+                    bucket[4] = 0
+        _emit(summaries)
+
+    def _bucket(self, name, now):
+        rate = self.rates.get(name, self.rate)
+        if rate is None:
+            return None
+        burst = self.burst if self.burst is not None else max(rate, 1)
+        # rate, burst, tokens, last refill, dropped since the last pass, last dropped record
+        return [rate, burst, burst, now, 0, None]
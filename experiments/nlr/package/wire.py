@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Natural Language Recommendation                                                                               #
+# Version  : 0.1.0                                                                                                         #
+# File     : \wire.py                                                                                                      #
+# Language : Python 3.8.12                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/nlr                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Sunday, October 18th 2026, 2:52:19 pm                                                                         #
+# Modified : Monday, October 19th 2026, 1:51:36 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Compact binary wire format for LogRecords sent from workers to the listener."""
+import logging
+import marshal
+import os
+import pickle
+import struct
+# ------------------------------------------------------------------------------------------------------------------------ #
+# A message is a header, a block of string definitions and one record. Definitions bind an integer id to a string the
+# first time an encoder sends it, so logger names, paths, function, process and thread names and format strings travel
+# once per worker and are referenced by id afterwards. Ids are scoped to the sender, a random token drawn by each
+# encoder in each process.
+#
+#   header      : sender Q, definition count H
+#   definitions : per definition id I, length I, utf-8 bytes
+#   record      : _RECORD, then the message (inline or interned), then the optional sections flagged in `flags`
+#
+# A message may stop after its definitions. Those are sent in place of records that were dropped or spilled, so that
+# later records from the same sender can still be decoded.
+_HEADER = struct.Struct('<QH')
+_DEFINITION = struct.Struct('<II')
+_LENGTH = struct.Struct('<I')
+_RECORD = struct.Struct('<BIdddQIIIIIII')
+# Flags
+_INTERNED = 0x01
+_ARGS = 0x02
+_EXC_TEXT = 0x04
+_STACK_INFO = 0x08
+_EXTRA = 0x10
+_PICKLED = 0x20
+
+_exception_formatter = logging.Formatter()
+_new_record = object.__new__
+_STANDARD = frozenset(logging.makeLogRecord({}).__dict__) | {'message', 'asctime', 'taskName'}
+
+
+def definitions_only(data):
+    """Returns the header and definitions of a message without its record, or None if it defines nothing."""
+    sender, count = _HEADER.unpack_from(data)
+    if not count:
+        return None
+    offset = _HEADER.size
+    for _ in range(count):
+        offset += _DEFINITION.size + _DEFINITION.unpack_from(data, offset)[1]
+    return data[:offset]
+
+
+class RecordEncoder:
+    """Encodes LogRecords for one worker process, interning repeated strings."""
+
+    def __init__(self):
+        self._pid = None
+
+    def _reset(self):
+        # A forked child starts a namespace of its own. The token comes from
+        # urandom because the random module's state is copied by fork.
+        self._pid = os.getpid()
+        self.sender = int.from_bytes(os.urandom(8), 'little')
+        self._ids = {}
+
+    def strings(self, since=0):
+        """Returns {id: string} for the strings interned after id `since`."""
+        if self._pid != os.getpid():
+            return {}
+        return {id: value for value, id in self._ids.items() if id > since}
+
+    def replay(self):
+        """
+        Returns messages defining every string interned so far, without a
+        record. A transport sends them first on each new connection, so that
+        a listener that has never seen this sender, such as a restarted one,
+        can decode the records that follow, including those encoded before.
+        """
+        if self._pid != os.getpid():
+            return []
+        definitions = []
+        for value, id in list(self._ids.items()):
+            data = value.encode('utf-8')
+            definitions.append(_DEFINITION.pack(id, len(data)) + data)
+        # The header counts definitions in 16 bits.
+        return [b''.join([_HEADER.pack(self.sender, len(block))] + block)
+                for block in (definitions[i:i + 0xffff] for i in range(0, len(definitions), 0xffff))]
+
+    def _intern(self, value, new, definitions):
+        # New strings are held in `new` until the whole record has encoded: if pickling it fails, its definitions
+        # are never sent, and later records must not refer to them.
+        value = '' if value is None else value
+        id = self._ids.get(value) or new.get(value)
+        if id is None:
+            id = new[value] = len(self._ids) + len(new) + 1
+            data = value.encode('utf-8')
+            definitions.append(_DEFINITION.pack(id, len(data)) + data)
+        return id
+
+    def encode(self, record):
+        if self._pid != os.getpid():
+            self._reset()
+        new = {}
+        definitions = []
+        flags = 0
+        sections = []
+        # A message with arguments is a format string, and so worth interning.
+        if record.args and isinstance(record.msg, str):
+            flags |= _INTERNED | _ARGS
+            message = _LENGTH.pack(self._intern(record.msg, new, definitions))
+            try:
+                args = marshal.dumps(record.args)
+            except ValueError:
+                flags |= _PICKLED
+                args = pickle.dumps(record.args, pickle.HIGHEST_PROTOCOL)
+            sections.append(_LENGTH.pack(len(args)) + args)
+        else:
+            data = str(record.msg).encode('utf-8')
+            message = _LENGTH.pack(len(data)) + data
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = _exception_formatter.formatException(record.exc_info)
+        for flag, value in ((_EXC_TEXT, exc_text), (_STACK_INFO, record.stack_info)):
+            if value:
+                flags |= flag
+                data = value.encode('utf-8')
+                sections.append(_LENGTH.pack(len(data)) + data)
+        extra = record.__dict__.keys() - _STANDARD
+        if extra:
+            extra = {key: record.__dict__[key] for key in extra}
+            flags |= _EXTRA
+            data = pickle.dumps(extra, pickle.HIGHEST_PROTOCOL)
+            sections.append(_LENGTH.pack(len(data)) + data)
+        fixed = _RECORD.pack(flags, record.levelno, record.created, record.msecs, record.relativeCreated,
+                             record.thread or 0, record.process or 0, record.lineno,
+                             self._intern(record.name, new, definitions),
+                             self._intern(record.pathname, new, definitions),
+                             self._intern(record.funcName, new, definitions),
+                             self._intern(record.processName, new, definitions),
+                             self._intern(record.threadName, new, definitions))
+        self._ids.update(new)
+        return b''.join([_HEADER.pack(self.sender, len(definitions))] + definitions + [fixed, message] + sections)
+
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+class RecordDecoder:
+    """Rebuilds real LogRecords in the listener, so existing formatters keep working."""
+
+    def __init__(self):
+        self._strings = {}
+        self._locations = {}
+
+    def define(self, sender, strings):
+        """Adds strings interned by sender, as returned by RecordEncoder.strings()."""
+        self._strings.setdefault(sender, {}).update(strings)
+
+    def decode(self, data):
+        """Returns the LogRecord in data, or None for a message that only carries definitions."""
+        view = memoryview(data)
+        sender, count = _HEADER.unpack_from(view)
+        offset = _HEADER.size
+        strings = self._strings.setdefault(sender, {})
+        for _ in range(count):
+            id, length = _DEFINITION.unpack_from(view, offset)
+            offset += _DEFINITION.size
+            strings[id] = str(view[offset:offset + length], 'utf-8')
+            offset += length
+        if offset == len(view):
+            return None
+        (flags, levelno, created, msecs, relative_created, thread, process, lineno,
+         name, pathname, func_name, process_name, thread_name) = _RECORD.unpack_from(view, offset)
+        offset += _RECORD.size
+
+        def section():
+            nonlocal offset
+            (length,) = _LENGTH.unpack_from(view, offset)
+            offset += _LENGTH.size + length
+            return view[offset - length:offset]
+
+        if flags & _INTERNED:
+            (msg,) = _LENGTH.unpack_from(view, offset)
+            offset += _LENGTH.size
+            msg = strings[msg]
+        else:
+            msg = str(section(), 'utf-8')
+        args = None
+        if flags & _ARGS:
+            args = pickle.loads(section()) if flags & _PICKLED else marshal.loads(section())
+        exc_text = str(section(), 'utf-8') if flags & _EXC_TEXT else None
+        stack_info = str(section(), 'utf-8') if flags & _STACK_INFO else None
+        pathname = strings[pathname]
+        location = self._locations.get(pathname)
+        if location is None:
+            filename = os.path.basename(pathname)
+            location = self._locations[pathname] = (filename, os.path.splitext(filename)[0])
+        # Bypassing LogRecord.__init__ avoids recomputing everything the worker already did.
+        record = _new_record(logging.LogRecord)
+        record.__dict__.update({
+            'name': strings[name], 'msg': msg, 'args': args, 'levelno': levelno,
+            'levelname': logging.getLevelName(levelno), 'pathname': pathname, 'filename': location[0],
+            'module': location[1], 'exc_info': None, 'exc_text': exc_text, 'stack_info': stack_info,
+            'lineno': lineno, 'funcName': strings[func_name] or None, 'created': created, 'msecs': msecs,
+            'relativeCreated': relative_created, 'thread': thread or None, 'threadName': strings[thread_name] or None,
+            'process': process or None, 'processName': strings[process_name] or None})
+        if flags & _EXTRA:
+            record.__dict__.update(pickle.loads(section()))
+        return record
+
+
+_decoder = RecordDecoder()
+
+
+def decode(data):
+    """Decodes with the listener's process-wide decoder."""
+    return _decoder.decode(data)
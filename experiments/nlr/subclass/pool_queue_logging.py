@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Sunday, November 7th 2021, 1:43:45 pm                                                                         #
-# Modified : Sunday, November 7th 2021, 2:02:45 pm                                                                         #
+# Modified : Monday, October 19th 2026, 12:14:22 pm                                                                        #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -22,18 +22,28 @@
 import logging
 import logging.handlers
 import multiprocessing
-import multiprocessing.pool
 
 from random import choice, random
 import time
 
+from experiments.nlr.package.batching import BatchingQueueHandler, unbatch
+from experiments.nlr.package.dispatch import DispatchTable
+from experiments.nlr.package.metrics import ListenerMetrics
+from experiments.nlr.package.outofband import OutOfBandPool
+from experiments.nlr.package.overflow import OverflowCounters
+
 
 class ProcessLogger(multiprocessing.Process):
     _global_process_logger = None
 
-    def __init__(self):
+    def __init__(self, maxsize=1000, stats_interval=None):
         super().__init__()
-        self.queue = multiprocessing.Queue(-1)
+        self.queue = multiprocessing.Queue(maxsize)
+        self.counters = OverflowCounters()
+        # Snapshots can be taken from the parent; stats_interval also has the
+        # listener log them.
+        self.metrics = ListenerMetrics(self.queue)
+        self.stats_interval = stats_interval
 
     @classmethod
     def get_global_logger(cls):
@@ -60,25 +70,31 @@ class ProcessLogger(multiprocessing.Process):
 
     def run(self):
         self.configure()
+        self.counters.start_reporting()
+        self.metrics.start(self.stats_interval)
+        dispatch = DispatchTable(rewrite_process_name=False)
         while True:
             try:
-                record = self.queue.get()
-                if record is None:
+                item = self.queue.get()
+                if item is None:
                     break
-                logger = logging.getLogger(record.name)
-                logger.handle(record)
+                records = list(unbatch(item))
+                for record in records:
+                    dispatch.handle(record)
+                self.metrics.observe(records)
             except Exception:
                 import sys
                 import traceback
                 print('Whoops! Problem:', file=sys.stderr)
                 traceback.print_exc(file=sys.stderr)
+        self.counters.close()
 
     # def new_process(self, target, args=[], kwargs={}):
     #     return ProcessWithLogging(self, target, args, kwargs)
 
 
-def configure_new_process(log_process_queue):
-    h = logging.handlers.QueueHandler(log_process_queue)
+def configure_new_process(log_process_queue, counters=None):
+    h = BatchingQueueHandler(log_process_queue, overflow='drop', counters=counters)
     root = logging.getLogger()
     root.addHandler(h)
     root.setLevel(logging.DEBUG)
@@ -93,18 +109,19 @@ class ProcessWithLogging(multiprocessing.Process):
         if log_process is None:
             log_process = ProcessLogger.get_global_logger()
         self.log_process_queue = log_process.queue
+        self.log_process_counters = log_process.counters
 
     def run(self):
-        configure_new_process(self.log_process_queue)
+        configure_new_process(self.log_process_queue, self.log_process_counters)
         self.target(*self.args, **self.kwargs)
 
 
-class PoolWithLogging(multiprocessing.pool.Pool):
+class PoolWithLogging(OutOfBandPool):
     def __init__(self, processes=None, context=None, log_process=None):
         if log_process is None:
             log_process = ProcessLogger.get_global_logger()
         super().__init__(processes=processes, initializer=configure_new_process,
-                         initargs=(log_process.queue,), context=context)
+                         initargs=(log_process.queue, log_process.counters), context=context)
 
 
 LEVELS = [logging.DEBUG, logging.INFO,
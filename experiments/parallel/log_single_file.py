@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/lab                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, October 25th 2021, 10:52:48 pm                                                                        #
-# Modified : Wednesday, October 27th 2021, 2:21:13 am                                                                      #
+# Modified : Sunday, October 18th 2026, 9:26:37 pm                                                                         #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -22,11 +22,14 @@
 import logging
 import logging.handlers
 import multiprocessing
+import sys
 
 # Next two import lines for this demo only
 from random import choice, random
 import time
 
+from experiments.nlr.package.segments import SegmentHandler, merge_segments, segment_paths
+
 #
 # Because you'll want to define the logging configurations for listener and workers, the
 # listener and worker process functions take a configurer parameter which is a callable
@@ -100,6 +103,19 @@ def worker_configurer(queue):
     # send all messages, for demo; no other level or filter logic applied.
     root.setLevel(logging.DEBUG)
 
+
+# Alternatively each worker writes its own segment file, with no queue and no
+# listener, and the segments are merged into one log once the workers are done.
+
+
+def segment_configurer(directory):
+    h = SegmentHandler(directory)
+    h.setFormatter(logging.Formatter(
+        '%(asctime)s %(processName)-10s %(name)s %(levelname)-8s %(message)s'))
+    root = logging.getLogger()
+    root.addHandler(h)
+    root.setLevel(logging.DEBUG)
+
 # This is the worker process top-level loop, which just logs ten events with
 # random intervening delays before terminating.
 # The print messages are just so you know it's doing something!
@@ -139,6 +155,21 @@ def main():
     listener.join()
 
 
+def main_with_segments(directory='segments'):
+    workers = []
+    for i in range(10):
+        worker = multiprocessing.Process(target=worker_process,
+                                         args=(directory, segment_configurer))
+        workers.append(worker)
+        worker.start()
+    for w in workers:
+        w.join()
+    merge_segments(segment_paths(directory), 'mplog.log', remove=True)
+
+
 if __name__ == '__main__':
-    main()
+    if '--segments' in sys.argv[1:]:
+        main_with_segments()
+    else:
+        main()
 # %%
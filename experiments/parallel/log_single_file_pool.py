@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/lab                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Monday, October 25th 2021, 10:52:48 pm                                                                        #
-# Modified : Monday, November 1st 2021, 4:12:25 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 11:04:27 pm                                                                        #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -23,10 +23,15 @@ import math
 import logging
 import logging.handlers
 import multiprocessing as mp
+import os
 
 # Next two import lines for this demo only
 from random import choice, random
 import time
+
+from experiments.nlr.package.dispatch import DispatchTable
+from experiments.nlr.package.ringbuffer import SharedMemoryQueue
+
 NUM_PROCESSORS = max(1, math.floor(mp.cpu_count() / 2))
 LOGDIR = 'nlr/logs/'
 #
@@ -44,6 +49,7 @@ LOGDIR = 'nlr/logs/'
 
 
 def listener_configurer():
+    os.makedirs(LOGDIR, exist_ok=True)
     logfile = os.path.join(LOGDIR, 'listener.log')
     root = logging.getLogger()
     h = logging.handlers.TimedRotatingFileHandler(
@@ -62,9 +68,9 @@ def listener_configurer():
 # LogRecord.
 
 
-def listener_process(queue, configurer):
+def listener_process(queue, configurer, stop_event):
     configurer()
-    listener = logging.handlers.QueueListener(queue, MyHandler())
+    listener = logging.handlers.QueueListener(queue, DispatchTable())
     listener.start()
     if os.name == 'posix':
         # On POSIX, the setup logger will have been configured in the
@@ -94,7 +100,8 @@ MESSAGES = [
 
 # The worker configuration is done at the start of the worker process run.
 # Note that on Windows you can't rely on fork semantics, so each process
-# will run the logging configuration code when it starts.
+# will run the logging configuration code when it starts. The pool runs it as
+# its initializer, since the queue can only reach a worker as it is created.
 
 
 def worker_configurer(queue):
@@ -109,8 +116,7 @@ def worker_configurer(queue):
 # The print messages are just so you know it's doing something!
 
 
-def worker_process(queue, configurer):
-    configurer(queue)
+def worker_process():
     name = mp.current_process().name
     print('Worker started: %s' % name)
     for i in range(10):
@@ -123,27 +129,25 @@ def worker_process(queue, configurer):
 
 # Here's where the demo gets orchestrated. Create the queue, create and start
 # the listener, create ten workers and start them, wait for them to finish,
-# then send a None to the queue to tell the listener to finish.
+# then set the stop event to tell the listener to finish.
 
 
 def main():
-    queue = mp.Manager().Queue(-1)
+    queue = SharedMemoryQueue()
+    stop_event = mp.Event()
     listener = mp.Process(target=listener_process,
-                          args=(queue, listener_configurer))
+                          args=(queue, listener_configurer, stop_event))
     listener.start()
 
-    pool = mp.Pool(NUM_PROCESSORS)
-    results = [pool.apply_async(func)]
-    workers = []
+    pool = mp.Pool(NUM_PROCESSORS, initializer=worker_configurer,
+                   initargs=(queue,))
     for i in range(10):
-        worker = mp.Process(target=worker_process,
-                            args=(queue, worker_configurer))
-        workers.append(worker)
-        worker.start()
-    for w in workers:
-        w.join()
-    queue.put_nowait(None)
+        pool.apply_async(worker_process)
+    pool.close()
+    pool.join()
+    stop_event.set()
     listener.join()
+    queue.unlink()
 
 
 if __name__ == '__main__':
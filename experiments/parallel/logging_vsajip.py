@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/lab                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Wednesday, October 27th 2021, 3:24:36 am                                                                      #
-# Modified : Monday, November 1st 2021, 11:19:49 am                                                                        #
+# Modified : Sunday, October 18th 2026, 9:58:14 pm                                                                         #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -22,11 +22,15 @@
 import logging
 import logging.config
 import logging.handlers
-from multiprocessing import Process, Queue, Event, current_process
+from multiprocessing import Process, Queue, Event
 import os
 import random
 import time
 
+from experiments.nlr.package.batching import unbatch
+from experiments.nlr.package.dispatch import DispatchTable
+from experiments.nlr.package.sharded import close_shards, shard_handlers
+
 
 class MyHandler(object):
     """
@@ -36,13 +40,14 @@ class MyHandler(object):
     configured for those loggers.
     """
 
-    def handle(self, record):
-        logger = logging.getLogger(record.name)
+    def __init__(self):
         # The process name is transformed just to show that it's the listener
         # doing the logging to files and console
-        record.processName = '%s (for %s)' % (
-            current_process().name, record.processName)
-        logger.handle(record)
+        self.dispatch = DispatchTable()
+
+    def handle(self, item):
+        for record in unbatch(item):
+            self.dispatch.handle(record)
 
 
 def listener_process(q, stop_event, config):
@@ -55,6 +60,9 @@ def listener_process(q, stop_event, config):
     via the event. The listener is then stopped, and the process exits.
     """
     logging.config.dictConfig(config)
+    # Give each handler its own writer thread, so a slow console cannot hold
+    # up the files.
+    shards = shard_handlers()
     listener = logging.handlers.QueueListener(q, MyHandler())
     listener.start()
     if os.name == 'posix':
@@ -68,6 +76,7 @@ def listener_process(q, stop_event, config):
         logger.critical('Should not appear, because of disabled logger ...')
     stop_event.wait()
     listener.stop()
+    close_shards(shards)
 
 
 def worker_process(config):
@@ -137,7 +146,7 @@ def main():
         'disable_existing_loggers': True,
         'handlers': {
             'queue': {
-                'class': 'logging.handlers.QueueHandler',
+                'class': 'experiments.nlr.package.batching.BatchingQueueHandler',
                 'queue': q,
             },
         },
@@ -172,13 +181,13 @@ def main():
                 'formatter': 'simple',
             },
             'file': {
-                'class': 'logging.FileHandler',
+                'class': 'experiments.nlr.package.buffered.BufferedFileHandler',
                 'filename': 'mplog.log',
                 'mode': 'w',
                 'formatter': 'detailed',
             },
             'foofile': {
-                'class': 'logging.FileHandler',
+                'class': 'experiments.nlr.package.buffered.BufferedFileHandler',
                 'filename': 'mplog-foo.log',
                 'mode': 'w',
                 'formatter': 'detailed',
@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/lab                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Wednesday, October 27th 2021, 3:24:36 am                                                                      #
-# Modified : Sunday, November 7th 2021, 1:27:48 pm                                                                         #
+# Modified : Sunday, October 18th 2026, 11:04:27 pm                                                                        #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -70,21 +70,20 @@ def listener_process(q, stop_event, config):
     listener.stop()
 
 
-def worker_process(config):
+def worker_process():
     """
     A number of these are spawned for the purpose of illustration. In
     practice, they could be a heterogenous bunch of processes rather than
     ones which are identical to each other.
 
-    This initialises logging according to the specified configuration,
-    and logs a hundred messages with random levels to randomly selected
-    loggers.
+    This logs a hundred messages with random levels to randomly selected
+    loggers. Logging is configured by the pool initializer, since the queue
+    in the configuration can only reach a worker as it is created.
 
     A small sleep is added to allow other processes a chance to run. This
     is not strictly needed, but it mixes the output from the different
     processes a bit more than if it's left out.
     """
-    logging.config.dictConfig(config)
     levels = [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR,
               logging.CRITICAL]
     loggers = ['foo', 'foo.bar', 'foo.bar.baz',
@@ -214,9 +213,8 @@ def main():
     #     wp.start()
     #     logger.info('Started worker: %s', wp.name)
 
-    pool = Pool()
-    async_results = [pool.apply_async(
-        func=worker_process, args=(config_worker,)) for i in range(5)]
+    pool = Pool(initializer=logging.config.dictConfig, initargs=(config_worker,))
+    async_results = [pool.apply_async(func=worker_process) for i in range(5)]
 
     logger.info('About to create listener ...')
     stop_event = Event()
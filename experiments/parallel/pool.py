@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/lab                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Tuesday, October 26th 2021, 3:26:01 pm                                                                        #
-# Modified : Tuesday, October 26th 2021, 3:26:20 pm                                                                        #
+# Modified : Monday, October 19th 2026, 3:57:51 am                                                                         #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -24,6 +24,8 @@ import time
 import random
 import sys
 
+from experiments.nlr.package.chunking import ChunkingPool
+
 #
 # Functions used by test code
 #
@@ -71,7 +73,9 @@ def test():
     PROCESSES = 4
     print('Creating pool with %d processes\n' % PROCESSES)
 
-    with multiprocessing.Pool(PROCESSES) as pool:
+    # Tasks go through apply_async() in chunks, so this also checks that each
+    # still gets its own result and its own exception.
+    with ChunkingPool(PROCESSES) as pool:
         #
         # Tests
         #
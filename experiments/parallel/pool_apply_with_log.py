@@ -12,7 +12,7 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Sunday, November 7th 2021, 2:53:52 pm                                                                         #
-# Modified : Sunday, November 7th 2021, 2:56:22 pm                                                                         #
+# Modified : Monday, October 19th 2026, 9:12:05 am                                                                         #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
@@ -25,7 +25,16 @@ import numpy as np
 import time
 import multiprocessing
 import pandas as pd
+import sys
+
+from experiments.nlr.package.bootstrap import configure
+from experiments.nlr.package.project import Project
+from experiments.nlr.package.ringbuffer import SharedMemoryQueue
+from experiments.nlr.package.scheduler import CostModel, Scheduler
+from experiments.nlr.package.segments import merge_segments, segment_paths
 log_file = 'log_file.log'
+segment_dir = 'segments'
+merged_file = 'mplog.log'
 
 
 def listener_configurer():
@@ -67,20 +76,56 @@ def worker_configurer_old(queue):
 
 
 def worker_configurer(queue):
-    root = logging.getLogger()
-    # print(f'{root.handlers=}')
-    if len(root.handlers) == 0:
-        h = logging.handlers.QueueHandler(queue)
-        root.addHandler(h)
-        root.setLevel(logging.DEBUG)
+    # Applied once per process, however often it is called.
+    configure({
+        'version': 1,
+        'disable_existing_loggers': False,
+        'handlers': {
+            'queue': {
+                'class': 'logging.handlers.QueueHandler',
+                'queue': queue
+            }
+        },
+        'root': {
+            'level': 'DEBUG',
+            'handlers': ['queue']
+        }
+    })
+
+
+def segment_configurer(directory):
+    # Segment mode: each worker appends to its own file and no listener is needed.
+    configure({
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': {
+            'detailed': {
+                'format': '%(asctime)s %(processName)-10s %(name)s %(levelname)-8s %(message)s'
+            }
+        },
+        'handlers': {
+            'segment': {
+                'class': 'experiments.nlr.package.segments.SegmentHandler',
+                'directory': directory,
+                'formatter': 'detailed'
+            }
+        },
+        'root': {
+            'level': 'DEBUG',
+            'handlers': ['segment']
+        }
+    })
+
+# The configurers run as the pool initializer. The SharedMemoryQueue holds a
+# lock, which can only be pickled while a process is being started, so it
+# reaches a pool worker as an initarg, never through apply_async arguments.
 
 # This is the worker process top-level loop, which just logs ten events with
 # random intervening delays before terminating.
 # The print messages are just so you know it's doing something!
 
 
-def worker_function(sleep_time, name, queue, configurer):
-    configurer(queue)
+def worker_function(sleep_time, name):
     start_message = 'Worker {} started and will now sleep for {}s'.format(
         name, sleep_time)
     logging.info(start_message)
@@ -90,24 +135,69 @@ def worker_function(sleep_time, name, queue, configurer):
     logging.info(success_message)
 
 
+class SleepJob:
+    """One call of worker_function, costed at its sleep time so the scheduler can run the longest first."""
+
+    def __init__(self, sleep_time, name):
+        self.sleep_time = sleep_time
+        self.name = name
+        self.cost = sleep_time
+
+    def run(self):
+        worker_function(self.sleep_time, self.name)
+
+
+def run_job(job):
+    return job.run()
+
+
+def schedule(pool, job_list, processes, fifo=False):
+    # Longest first unless fifo, then how close the run came to the best any order could do.
+    project = Project(len(job_list))
+    project.jobs = [SleepJob(sleep_time, str(i)) for i, sleep_time in enumerate(job_list)]
+    scheduler = Scheduler(pool, run_job, cost=None if fifo else CostModel(), processes=processes)
+    scheduler.submit(project)
+    for _ in scheduler.as_completed():
+        pass
+    print("Makespan was {makespan:.2f}s against an ideal of {ideal:.2f}s ({efficiency:.0%} efficient)".format(
+        **scheduler.report()))
+
+
 def main_with_pool():
     start_time = time.time()
-    queue = multiprocessing.Manager().Queue(-1)
+    queue = SharedMemoryQueue()
     listener = multiprocessing.Process(target=listener_process,
                                        args=(queue, listener_configurer))
     listener.start()
-    pool = multiprocessing.Pool(processes=3)
+    pool = multiprocessing.Pool(processes=3, initializer=worker_configurer,
+                                initargs=(queue,))
     job_list = [np.random.randint(10) / 2 for i in range(10)]
     single_thread_time = np.sum(job_list)
-    for i, sleep_time in enumerate(job_list):
-        name = str(i)
-        pool.apply_async(worker_function,
-                         args=(sleep_time, name, queue, worker_configurer))
+    schedule(pool, job_list, 3, fifo='--fifo' in sys.argv[1:])
 
     pool.close()
     pool.join()
     queue.put_nowait(None)
     listener.join()
+    queue.unlink()
+    end_time = time.time()
+    print("Script execution time was {}s, but single-thread time was {}s".format(
+        (end_time - start_time),
+        single_thread_time
+    ))
+
+
+def main_with_segments():
+    start_time = time.time()
+    pool = multiprocessing.Pool(processes=3, initializer=segment_configurer,
+                                initargs=(segment_dir,))
+    job_list = [np.random.randint(10) / 2 for i in range(10)]
+    single_thread_time = np.sum(job_list)
+    schedule(pool, job_list, 3, fifo='--fifo' in sys.argv[1:])
+
+    pool.close()
+    pool.join()
+    merge_segments(segment_paths(segment_dir), merged_file, remove=True)
     end_time = time.time()
     print("Script execution time was {}s, but single-thread time was {}s".format(
         (end_time - start_time),
@@ -116,5 +206,8 @@ def main_with_pool():
 
 
 if __name__ == "__main__":
-    main_with_pool()
+    if '--segments' in sys.argv[1:]:
+        main_with_segments()
+    else:
+        main_with_pool()
 # %%
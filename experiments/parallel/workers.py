@@ -12,18 +12,21 @@
 # URL      : https://github.com/john-james-sf/nlr                                                                          #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # Created  : Sunday, November 7th 2021, 4:14:21 am                                                                         #
-# Modified : Sunday, November 7th 2021, 6:06:15 am                                                                         #
+# Modified : Monday, October 19th 2026, 1:15:02 am                                                                         #
 # Modifier : John James (john.james@nov8.ai)                                                                               #
 # ------------------------------------------------------------------------------------------------------------------------ #
 # License  : BSD 3-clause "New" or "Revised" License                                                                       #
 # Copyright: (c) 2021 nov8.ai                                                                                              #
 # ======================================================================================================================== #
 import logging
+
+from experiments.nlr.package.bootstrap import configure
 # ------------------------------------------------------------------------------------------------------------------------ #
 
 
 def worker(job):
-    logging.config.dictConfig(job.qconfig)
+    # Skipped unless the job brings a configuration this process is not running yet.
+    configure(job.qconfig)
     logger = logging.getLogger()
     logger.info("Worker started a job")
     result = job.run()
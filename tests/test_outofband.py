@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_outofband.py                                                                                            #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 11:48:05 am                                                                        #
+# Modified : Monday, October 19th 2026, 11:48:05 am                                                                        #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Pools on out of band queues terminate while workers are part way through large results."""
+import threading
+import time
+
+import pytest
+
+from experiments.nlr.package.chunking import ChunkingPool
+from experiments.nlr.package.outofband import OutOfBandPool
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def echo(value):
+    return value
+
+
+def terminated(pool, timeout=10):
+    # In a thread of its own, so that a hang fails the test rather than the run.
+    thread = threading.Thread(target=lambda: (pool.terminate(), pool.join()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+@pytest.mark.parametrize('cls', [OutOfBandPool, ChunkingPool])
+def test_terminate_with_large_pending_payloads(cls):
+    for run in range(8):
+        pool = cls(2)
+        for _ in range(50):
+            pool.apply_async(echo, (bytes(100000),))
+        # Terminated at different points of the workers' writes.
+        time.sleep(0.01 * (run % 4))
+        assert terminated(pool), 'run %d of %s hung in terminate()' % (run, cls.__name__)
+
+
+@pytest.mark.parametrize('cls', [OutOfBandPool, ChunkingPool])
+def test_close_returns_every_result(cls):
+    pool = cls(2)
+    results = [pool.apply_async(echo, (bytes([i]) * 100000,)) for i in range(20)]
+    pool.close()
+    pool.join()
+    assert [result.get(0) for result in results] == [bytes([i]) * 100000 for i in range(20)]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ======================================================================================================================== #
+# Project  : Lab                                                                                                           #
+# Version  : 0.1.0                                                                                                         #
+# File     : \test_sockets.py                                                                                              #
+# Language : Python 3.7.11                                                                                                 #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Author   : John James                                                                                                    #
+# Company  : nov8.ai                                                                                                       #
+# Email    : john.james@nov8.ai                                                                                            #
+# URL      : https://github.com/john-james-sf/lab                                                                          #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# Created  : Monday, October 19th 2026, 10:06:31 am                                                                        #
+# Modified : Monday, October 19th 2026, 1:47:18 pm                                                                         #
+# Modifier : John James (john.james@nov8.ai)                                                                               #
+# ------------------------------------------------------------------------------------------------------------------------ #
+# License  : BSD 3-clause "New" or "Revised" License                                                                       #
+# Copyright: (c) 2021 nov8.ai                                                                                              #
+# ======================================================================================================================== #
+"""Compact records sent over a socket keep decoding when the aggregator restarts."""
+import logging
+import multiprocessing as mp
+import time
+
+from experiments.nlr.package.sockets import CompactSocketHandler, aggregator_process
+# ------------------------------------------------------------------------------------------------------------------------ #
+
+
+def start_aggregator(address, filename):
+    config = {
+        'version': 1,
+        'formatters': {'message': {'format': '%(name)s %(message)s'}},
+        'handlers': {'file': {'class': 'logging.FileHandler', 'filename': filename, 'formatter': 'message'}},
+        'root': {'level': 'DEBUG', 'handlers': ['file']}
+    }
+    # Spawned, so that the aggregator does not inherit the sending logger and its handler.
+    ctx = mp.get_context('spawn')
+    stop_event, ready = ctx.Event(), ctx.Event()
+    process = ctx.Process(target=aggregator_process, args=(address, stop_event, config),
+                          kwargs={'ready': ready})
+    process.start()
+    assert ready.wait(10)
+    return process, stop_event
+
+
+def stop_aggregator(process, stop_event):
+    stop_event.set()
+    process.join(10)
+
+
+def log(logger, handler, start, count):
+    for i in range(start, start + count):
+        logger.info('Record %d', i)
+    handler.flush()
+
+
+def read(filename):
+    with open(filename) as f:
+        return f.read().splitlines()
+
+
+def test_aggregator_restart(tmp_path):
+    address = str(tmp_path / 'aggregator.sock')
+    first, second = str(tmp_path / 'first.log'), str(tmp_path / 'second.log')
+    handler = CompactSocketHandler(address, capacity=10, overflow='drop', max_pending=1000)
+    logger = logging.getLogger('restart')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    try:
+        aggregator = start_aggregator(address, first)
+        log(logger, handler, 0, 100)
+        time.sleep(0.5)
+        stop_aggregator(*aggregator)
+        # Encoded while no aggregator is listening, and held in the worker until one is.
+        log(logger, handler, 100, 20)
+        aggregator = start_aggregator(address, second)
+        log(logger, handler, 120, 80)
+        time.sleep(0.5)
+        stop_aggregator(*aggregator)
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+    assert read(first) == ['restart Record %d' % i for i in range(100)]
+    assert read(second) == ['restart Record %d' % i for i in range(100, 200)]